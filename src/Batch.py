@@ -0,0 +1,137 @@
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from CoverCache import capacity_bytes, choose_cover, default_cache
+from FileProcessor import read_secret_payload
+from Sisip import OPT_MATRIX, OPT_SCATTER
+from Stream import embed_mmap
+
+MANIFEST_COLUMNS = ("cover", "secret", "output", "n_lsb", "key", "seed")
+REPORT_COLUMNS = ("job", "cover", "secret", "output", "n_lsb", "status", "error", "secret_bytes", "seconds")
+
+def read_manifest(path: str) -> list[dict]:
+    """
+    Membaca manifest CSV dengan kolom cover, secret, output, n_lsb, key, seed
+    (key/seed kosong berarti tanpa kunci/tanpa seed)
+
+    Args:
+        path (str): path berkas manifest CSV (baris pertama nama kolom)
+
+    Output:
+        list job berupa dict
+    """
+    with open(path, newline='') as f:
+        reader = csv.DictReader(f)
+        missing = [c for c in MANIFEST_COLUMNS[:4] if c not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"Kolom manifest tidak lengkap: {', '.join(missing)}")
+
+        jobs = []
+        for i, row in enumerate(reader):
+            jobs.append({
+                "job": i,
+                "cover": row["cover"],
+                "secret": row["secret"],
+                "output": row["output"],
+                "n_lsb": int(row["n_lsb"]),
+                "key": row.get("key") or None,
+                "seed": row.get("seed") or None,
+                "frame_aware": (row.get("frame_aware") or "").strip().lower() in ("1", "y", "true"),
+                "compression": (row.get("compression") or "none").strip().lower(),
+                "checksum": (row.get("checksum") or "1").strip().lower() not in ("0", "n", "false"),
+                "scatter": (row.get("scatter") or "").strip().lower() in ("1", "y", "true"),
+                "matrix": (row.get("matrix") or "").strip().lower() in ("1", "y", "true"),
+            })
+    return jobs
+
+def run_job(job: dict) -> dict:
+    """
+    Menjalankan satu penyisipan tanpa berkas sementara bersama (aman dijalankan paralel)
+
+    Args:
+        job (dict): satu baris manifest hasil read_manifest
+
+    Output:
+        dict hasil: status ok/error, pesan error, ukuran secret, durasi
+    """
+    result = {c: job.get(c) for c in ("job", "cover", "secret", "output", "n_lsb")}
+    start = time.perf_counter()
+    try:
+        payload = read_secret_payload(job["secret"], job["key"], job.get("compression", "none"),
+                                      job.get("checksum", True))
+        frame_aware = job.get("frame_aware", False)
+        options = (OPT_SCATTER if job.get("scatter") else 0) | (OPT_MATRIX if job.get("matrix") else 0)
+        # Kapasitas matrix embedding maksimal (k = 1) sama dengan 1 LSB per byte
+        n_lsb = 1 if job.get("matrix") else job["n_lsb"]
+        cache = default_cache()
+        if os.path.isdir(job["cover"]):
+            # Kolom cover berisi folder: pilih cover terkecil yang muat dari analisis cache
+            covers = [e.path for e in os.scandir(job["cover"]) if e.name.lower().endswith('.mp3')]
+            result["cover"] = choose_cover(cache, sorted(covers), len(payload["data"]), n_lsb,
+                                           payload["ext"], payload["checksum"] is not None, frame_aware)
+        analysis = cache.analyze(result["cover"], frame_aware)
+        if capacity_bytes(analysis, n_lsb, payload["ext"], payload["checksum"] is not None,
+                          frame_aware) < len(payload["data"]):
+            raise ValueError("Cover tidak cukup untuk berkas rahasia.")
+        embed_mmap(result["cover"], payload["data"], payload["ext"], job["output"], job["seed"], job["n_lsb"],
+                   frame_aware, payload["options"] | options,
+                   payload["checksum"], analysis)
+        result.update(status="ok", error="", secret_bytes=len(payload["data"]))
+    except Exception as e:
+        result.update(status="error", error=str(e), secret_bytes=0)
+    result["seconds"] = round(time.perf_counter() - start, 6)
+    return result
+
+def run_batch(jobs: list[dict], workers: int | None = None) -> list[dict]:
+    """
+    Menjalankan seluruh job di ProcessPoolExecutor
+
+    Args:
+        jobs (list[dict]): daftar job
+        workers (int | None): jumlah proses (None = jumlah CPU, 1 = tanpa pool)
+
+    Output:
+        list hasil sesuai urutan job
+    """
+    if workers == 1:
+        return [run_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_job, jobs, chunksize=max(1, len(jobs) // (8 * (workers or os.cpu_count() or 1)))))
+
+def write_report(results: list[dict], path: str | None = None) -> None:
+    """
+    Menulis laporan per job: .json -> JSON lines, selain itu CSV.
+    Tanpa path, ringkasan tabel dicetak ke layar
+    """
+    if path is None:
+        print(f"{'job':>5} {'status':<7} {'detik':>9}  output / error")
+        for r in results:
+            print(f"{r['job']:>5} {r['status']:<7} {r['seconds']:>9.3f}  {r['output'] if r['status'] == 'ok' else r['error']}")
+    elif path.endswith('.json') or path.endswith('.jsonl'):
+        with open(path, 'w') as f:
+            for r in results:
+                f.write(json.dumps(r) + '\n')
+    else:
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=REPORT_COLUMNS)
+            writer.writeheader()
+            writer.writerows(results)
+
+    ok = sum(r["status"] == "ok" for r in results)
+    print(f"{ok}/{len(results)} job berhasil, total {sum(r['seconds'] for r in results):.3f} detik kerja")
+
+def main_batch(manifest: str, workers: int | None = None, report: str | None = None) -> int:
+    """
+    Entry point subcommand batch
+
+    Output:
+        exit code (0 jika semua job berhasil)
+    """
+    start = time.perf_counter()
+    results = run_batch(read_manifest(manifest), workers)
+    write_report(results, report)
+    print(f"Waktu total: {time.perf_counter() - start:.3f} detik")
+    return 0 if all(r["status"] == "ok" for r in results) else 1
@@ -0,0 +1,274 @@
+import csv
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from FileProcessor import read_cover, read_secret, write_stego
+from LSBEngine import embed_payload
+from PSNR import compare_files
+from Sisip import OPT_RANDOM_START, build_header, extract, find_audio_start, payload_layout
+
+# MPEG1 Layer III, 128 kbps, 44.1 kHz, tanpa CRC; panjang frame 417 (+1 jika padding)
+FRAME_HEADER = bytes([0xFF, 0xFB, 0x90, 0x00])
+FRAME_HEADER_PADDED = bytes([0xFF, 0xFB, 0x92, 0x00])
+STAGES = ("read", "audio_start", "header_embed", "payload_embed", "write", "extract", "psnr")
+# Modul entry point yang diukur waktu import-nya; numpy (dependensi wajib, biaya tetap) dilaporkan terpisah
+STARTUP_MODULES = ("Cli", "Stream", "PSNR", "Main")
+STARTUP_BUDGET_MS = 50
+
+def make_cover(path: str, size: int, rng: np.random.Generator, id3: bool = True) -> None:
+    """
+    Membuat cover sintetis mirip MP3: tag ID3v2 kecil lalu frame-frame dengan header valid
+    dan isi acak
+
+    Args:
+        path (str): path keluaran (.mp3)
+        size (int): perkiraan ukuran berkas dalam byte
+        rng (np.random.Generator): generator acak (agar hasil dapat direproduksi)
+        id3 (bool): sertakan tag ID3v2 di awal
+    """
+    out = bytearray()
+    if id3:
+        out += b'ID3\x04\x00\x00\x00\x00\x00\x76' + bytes(118)
+    frame = 0
+    while len(out) < size:
+        # Pola padding 44.1 kHz: kira-kira 1 dari 49 frame tanpa padding
+        padded = frame % 49 != 0
+        header = FRAME_HEADER_PADDED if padded else FRAME_HEADER
+        body = rng.integers(0, 256, 417 + padded - 4, dtype=np.uint8).tobytes()
+        out += header + body
+        frame += 1
+    with open(path, 'wb') as f:
+        f.write(out[:size])
+
+def make_secret(path: str, size: int, rng: np.random.Generator) -> None:
+    with open(path, 'wb') as f:
+        f.write(rng.integers(0, 256, size, dtype=np.uint8).tobytes())
+
+def timed(timings: dict, stage: str, fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    timings.setdefault(stage, []).append(time.perf_counter() - start)
+    return result
+
+def run_case(workdir: str, cover_path: str, secret_path: str, n_lsb: int, random_start: bool,
+             repeat: int) -> dict:
+    """
+    Menjalankan satu kombinasi parameter dan mencatat waktu setiap tahap
+
+    Output:
+        dict nama tahap -> list durasi (detik), atau None jika secret tidak muat
+    """
+    seed = "benchmark" if random_start else None
+    output_path = os.path.join(workdir, "stego.mp3")
+    timings = {}
+    for _ in range(repeat):
+        cover = timed(timings, "read", read_cover, cover_path)
+        secret, secret_ext = read_secret(secret_path)
+        stego = bytearray(cover)
+
+        audio_start_idx = timed(timings, "audio_start", find_audio_start, stego)
+        content_size_bits = len(secret) * 8
+        header = build_header(n_lsb, secret_ext, OPT_RANDOM_START if random_start else 0, content_size_bits)
+        header_len = len(header) * 8
+        try:
+            payload_base, capacity, start_offset_bit = payload_layout(
+                len(stego), audio_start_idx, header_len, content_size_bits, n_lsb, seed)
+        except ValueError:
+            return None
+
+        timed(timings, "header_embed", embed_payload, stego, header, audio_start_idx, 0, header_len, 1)
+        timed(timings, "payload_embed", embed_payload, stego, secret, payload_base, start_offset_bit,
+              capacity, n_lsb)
+        timed(timings, "write", write_stego, output_path, stego)
+        extracted, _ = timed(timings, "extract", extract, stego, seed)
+        if extracted != secret:
+            raise AssertionError("Hasil ekstraksi tidak sama dengan secret")
+        timed(timings, "psnr", compare_files, cover_path, output_path)
+    return timings
+
+def run_benchmark(cover_sizes: list[int], secret_sizes: list[int], n_lsbs=(1, 2, 3, 4),
+                  random_starts=(False, True), repeat: int = 3, seed: int = 0) -> list[dict]:
+    """
+    Menyapu seluruh kombinasi ukuran cover, ukuran secret, n_lsb, dan random start
+
+    Output:
+        list baris hasil (satu baris per tahap per kombinasi), median dari repeat
+    """
+    rng = np.random.default_rng(seed)
+    rows = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for cover_size in cover_sizes:
+            cover_path = os.path.join(workdir, f"cover-{cover_size}.mp3")
+            make_cover(cover_path, cover_size, rng)
+            for secret_size in secret_sizes:
+                secret_path = os.path.join(workdir, f"secret-{secret_size}.bin")
+                make_secret(secret_path, secret_size, rng)
+                for n_lsb in n_lsbs:
+                    for random_start in random_starts:
+                        timings = run_case(workdir, cover_path, secret_path, n_lsb, random_start, repeat)
+                        if timings is None:
+                            continue
+                        for stage in STAGES:
+                            median = statistics.median(timings[stage])
+                            processed = {"header_embed": None, "payload_embed": secret_size,
+                                         "extract": secret_size}.get(stage, cover_size)
+                            rows.append({
+                                "cover_bytes": cover_size,
+                                "secret_bytes": secret_size,
+                                "n_lsb": n_lsb,
+                                "random_start": random_start,
+                                "stage": stage,
+                                "seconds": round(median, 6),
+                                "mb_per_s": round(processed / median / 1e6, 3) if processed and median > 0 else None,
+                            })
+    return rows
+
+def case_key(row: dict) -> tuple:
+    return (row["cover_bytes"], row["secret_bytes"], row["n_lsb"], row["random_start"], row["stage"])
+
+def find_regressions(rows: list[dict], baseline: list[dict], threshold: float = 0.25,
+                     min_seconds: float = 1e-3) -> list[dict]:
+    """
+    Membandingkan hasil dengan baseline (hasil commit sebelumnya)
+
+    Args:
+        threshold (float): batas kenaikan waktu relatif yang dianggap regresi
+        min_seconds (float): tahap yang lebih cepat dari ini diabaikan (noise)
+
+    Output:
+        list baris yang melambat lebih dari threshold, dengan kolom baseline dan ratio
+    """
+    base = {case_key(r): r for r in baseline}
+    regressions = []
+    for row in rows:
+        old = base.get(case_key(row))
+        if old is None or max(row["seconds"], old["seconds"]) < min_seconds or old["seconds"] == 0:
+            continue
+        ratio = row["seconds"] / old["seconds"]
+        if ratio > 1 + threshold:
+            regressions.append({**row, "baseline": old["seconds"], "ratio": round(ratio, 3)})
+    return regressions
+
+def load_results(path: str) -> list[dict]:
+    """
+    Membaca hasil write_results (.csv atau JSON); kolom CSV dikembalikan ke tipe aslinya
+    """
+    if not path.endswith('.csv'):
+        with open(path) as f:
+            return json.load(f)["results"]
+    with open(path, newline='') as f:
+        rows = list(csv.DictReader(f))
+    for row in rows:
+        for column in ("cover_bytes", "secret_bytes", "n_lsb"):
+            row[column] = int(row[column])
+        row["random_start"] = row["random_start"] == "True"
+        row["seconds"] = float(row["seconds"])
+        row["mb_per_s"] = float(row["mb_per_s"]) if row["mb_per_s"] else None
+    return rows
+
+def write_results(rows: list[dict], path: str) -> None:
+    """
+    Menyimpan hasil: .csv -> CSV, selain itu JSON (dengan metadata lingkungan)
+    """
+    if path.endswith('.csv'):
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()) if rows else [])
+            writer.writeheader()
+            writer.writerows(rows)
+        return
+    meta = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+    with open(path, 'w') as f:
+        json.dump({"meta": meta, "results": rows}, f, indent=1)
+
+def main_bench(cover_sizes: list[int], secret_sizes: list[int], n_lsbs: list[int], repeat: int,
+               output: str | None, baseline: str | None, threshold: float) -> int:
+    """
+    Entry point subcommand bench
+
+    Output:
+        exit code (1 jika ada regresi terhadap baseline)
+    """
+    rows = run_benchmark(cover_sizes, secret_sizes, n_lsbs, repeat=repeat)
+    if output:
+        write_results(rows, output)
+    else:
+        print(f"{'cover':>10} {'secret':>9} {'n':>2} {'rand':>5} {'stage':<14} {'detik':>10} {'MB/s':>9}")
+        for r in rows:
+            print(f"{r['cover_bytes']:>10} {r['secret_bytes']:>9} {r['n_lsb']:>2} {str(r['random_start']):>5} "
+                  f"{r['stage']:<14} {r['seconds']:>10.6f} {r['mb_per_s'] or 0:>9.1f}")
+
+    if baseline:
+        regressions = find_regressions(rows, load_results(baseline), threshold)
+        for r in regressions:
+            print(f"REGRESI {case_key(r)}: {r['baseline']:.6f} -> {r['seconds']:.6f} detik (x{r['ratio']})")
+        return 1 if regressions else 0
+    return 0
+
+def parse_importtime(stderr: str) -> dict:
+    """
+    Waktu import kumulatif per modul (mikrodetik) dari keluaran python -X importtime;
+    modul yang muncul lebih dari sekali diambil kemunculan pertamanya
+    """
+    cumulative = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line[12:]:
+            continue
+        _, cum, name = line[12:].split("|")
+        if cum.strip().isdigit():
+            cumulative.setdefault(name.strip(), int(cum))
+    return cumulative
+
+def import_time(module: str, repeat: int = 5) -> dict:
+    """
+    Mengukur waktu import modul di interpreter baru dengan python -X importtime (median)
+
+    Output:
+        dict berisi module, import_ms (total), numpy_ms, own_ms (tanpa numpy), dan modules
+        (nama seluruh modul yang ikut ter-import)
+    """
+    totals, numpys = [], []
+    for _ in range(repeat):
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                              cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(f"Import {module} gagal: {proc.stderr.strip().splitlines()[-1]}")
+        cumulative = parse_importtime(proc.stderr)
+        totals.append(cumulative[module] / 1000)
+        numpys.append(cumulative.get("numpy", 0) / 1000)
+    total, numpy_ms = statistics.median(totals), statistics.median(numpys)
+    return {"module": module, "import_ms": round(total, 3), "numpy_ms": round(numpy_ms, 3),
+            "own_ms": round(total - numpy_ms, 3), "modules": sorted(cumulative)}
+
+def main_startup(repeat: int = 5, budget_ms: float = STARTUP_BUDGET_MS) -> int:
+    """
+    Memeriksa target waktu startup: setiap entry point ter-import di bawah budget_ms (di luar numpy)
+    tanpa memuat pygame
+
+    Output:
+        exit code (1 jika ada modul melebihi target atau memuat pygame)
+    """
+    failed = False
+    print(f"{'modul':<8} {'total ms':>9} {'numpy ms':>9} {'lain ms':>8}  status")
+    for module in STARTUP_MODULES:
+        r = import_time(module, repeat)
+        problems = []
+        if r["own_ms"] > budget_ms:
+            problems.append(f"> {budget_ms} ms")
+        if "pygame" in r["modules"]:
+            problems.append("memuat pygame")
+        failed |= bool(problems)
+        print(f"{module:<8} {r['import_ms']:>9.1f} {r['numpy_ms']:>9.1f} {r['own_ms']:>8.1f}  {', '.join(problems) or 'ok'}")
+    return 1 if failed else 0
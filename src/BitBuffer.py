@@ -0,0 +1,82 @@
+import numpy as np
+
+from LSBEngine import as_array
+
+class BitBuffer:
+    """
+    Deretan bit MSB dulu yang disimpan packed dalam bytearray (8 bit per byte), dengan tulis
+    field n-bit di akhir buffer dan baca field n-bit berurutan dari kursor
+    """
+
+    def __init__(self, data: bytes = b'', n_bits: int | None = None):
+        self.data = bytearray(data)
+        self.n_bits = len(self.data) * 8 if n_bits is None else n_bits
+        if not 0 <= self.n_bits <= len(self.data) * 8:
+            raise ValueError("Jumlah bit melebihi panjang data.")
+        self.pos = 0
+
+    @classmethod
+    def from_lsbs(cls, usable, n_bits: int, offset: int = 0) -> "BitBuffer":
+        """
+        Mengumpulkan LSB byte usable[offset : offset + n_bits] (1 bit per byte) menjadi buffer packed
+        """
+        lsbs = as_array(usable)[offset:offset + n_bits] & 1
+        if len(lsbs) < n_bits:
+            raise ValueError("Data terlalu pendek untuk jumlah bit yang diminta.")
+        return cls(np.packbits(lsbs).tobytes(), n_bits)
+
+    def __len__(self) -> int:
+        return self.n_bits
+
+    def write(self, value: int, width: int) -> None:
+        """
+        Menambahkan value sebagai field width bit (MSB dulu)
+        """
+        if not 0 <= value < 1 << width:
+            raise ValueError(f"Nilai {value} tidak muat dalam {width} bit.")
+        used = self.n_bits % 8
+        if used:
+            # Gabungkan dengan bit yang sudah terisi pada byte terakhir
+            value |= (self.data.pop() >> (8 - used)) << width
+        total = used + width
+        pad = -total % 8
+        self.data += (value << pad).to_bytes((total + pad) // 8, 'big')
+        self.n_bits += width
+
+    def write_bytes(self, data: bytes) -> None:
+        """
+        Menambahkan data utuh (8 bit per byte)
+        """
+        if self.n_bits % 8:
+            self.write(int.from_bytes(data, 'big'), len(data) * 8)
+            return
+        self.data += data
+        self.n_bits += len(data) * 8
+
+    def read(self, width: int) -> int:
+        """
+        Membaca field width bit dari posisi kursor lalu memajukan kursor
+        """
+        end = self.pos + width
+        if end > self.n_bits:
+            raise ValueError("Pembacaan melewati akhir buffer.")
+        lo, hi = self.pos >> 3, (end + 7) >> 3
+        value = int.from_bytes(self.data[lo:hi], 'big') >> (hi * 8 - end)
+        self.pos = end
+        return value & ((1 << width) - 1)
+
+    def read_bytes(self, n: int) -> bytes:
+        """
+        Membaca n byte (8n bit) dari posisi kursor
+        """
+        if self.pos % 8 == 0 and self.pos + n * 8 <= self.n_bits:
+            out = bytes(self.data[self.pos >> 3:(self.pos >> 3) + n])
+            self.pos += n * 8
+            return out
+        return self.read(n * 8).to_bytes(n, 'big')
+
+    def to_bytes(self) -> bytes:
+        """
+        Isi buffer dalam bytes (bit sisa di byte terakhir bernilai 0)
+        """
+        return bytes(self.data)
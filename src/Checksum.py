@@ -0,0 +1,73 @@
+import zlib
+
+from Sisip import OPT_CHECKSUM, read_payload
+from Vigenere import decrypt_bytes
+
+# Jumlah byte awal payload yang diverifikasi lebih dulu: seed/kunci salah
+# terdeteksi setelah mengekstrak beberapa KB, bukan seluruh payload
+CHECKSUM_SAMPLE = 4096
+CHECKSUM_ERROR = "Checksum payload tidak cocok: seed atau kunci salah, atau stego rusak."
+
+class PayloadChecksum:
+    """
+    CRC32 payload sebelum enkripsi (setelah kompresi) beserta CRC32 CHECKSUM_SAMPLE byte pertamanya,
+    dihitung per chunk berurutan
+    """
+
+    def __init__(self):
+        self.prefix_crc = 0
+        self.crc = 0
+        self.length = 0
+
+    def update(self, chunk: bytes) -> None:
+        if self.length < CHECKSUM_SAMPLE:
+            self.prefix_crc = zlib.crc32(chunk[:CHECKSUM_SAMPLE - self.length], self.prefix_crc)
+        self.crc = zlib.crc32(chunk, self.crc)
+        self.length += len(chunk)
+
+    def value(self) -> tuple[int, int]:
+        return self.prefix_crc, self.crc
+
+def checksum_of(data: bytes) -> tuple[int, int]:
+    """
+    CRC32 sampel awal dan CRC32 seluruh data dalam satu panggilan
+    """
+    checksum = PayloadChecksum()
+    checksum.update(data)
+    return checksum.value()
+
+def verify_prefix(prefix: bytes, header: dict, key: str | None = None) -> None:
+    """
+    Memverifikasi sampel awal payload (hasil ekstraksi, belum didekripsi) terhadap header
+
+    Args:
+        prefix (bytes): min(CHECKSUM_SAMPLE, ukuran payload) byte pertama payload
+        header (dict): header stego (hasil read_header/locate_payload)
+        key (str | None): kunci dekripsi vigenere (opsional)
+    """
+    if not header["options"] & OPT_CHECKSUM:
+        return
+    if key:
+        prefix = decrypt_bytes(prefix, key)
+    if zlib.crc32(prefix) != header["prefix_crc"]:
+        raise ValueError(CHECKSUM_ERROR)
+
+def verify_stego_prefix(stego, layout: dict, key: str | None = None) -> None:
+    """
+    Verifikasi cepat (early abort) sebelum ekstraksi penuh: hanya sampel awal payload yang diekstrak
+
+    Args:
+        stego (bytes | bytearray | memoryview | mmap): isi berkas stego mp3
+        layout (dict): hasil Sisip.locate_payload
+        key (str | None): kunci dekripsi vigenere (opsional)
+    """
+    if layout["options"] & OPT_CHECKSUM:
+        sample = min(CHECKSUM_SAMPLE, layout["content_size"] // 8)
+        verify_prefix(read_payload(stego, layout, 0, sample), layout, key)
+
+def verify_crc(crc: int, expected: int | None) -> None:
+    """
+    Membandingkan CRC32 payload yang sudah didekripsi dengan nilai di header (None = tanpa checksum)
+    """
+    if expected is not None and crc != expected:
+        raise ValueError(CHECKSUM_ERROR)
@@ -0,0 +1,296 @@
+import argparse
+import json
+import sys
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Steganografi audio MP3 dengan Multiple-LSB (non-interaktif)")
+    parser.add_argument("--profile", action="store_true", help="catat waktu per tahap dan cetak ringkasannya")
+    parser.add_argument("--profile-out", default=None, metavar="PATH", help="tulis record profiling sebagai JSON lines")
+    parser.add_argument("--profile-memory", action="store_true", help="catat juga puncak memori per tahap (lebih lambat)")
+    parser.add_argument("--threads", type=int, default=None,
+                        help="thread penyisipan/ekstraksi per berkas (0 = jumlah CPU, default STEGO_THREADS atau 1)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    batch = sub.add_parser("batch", help="Menyisipkan banyak berkas sesuai manifest CSV secara paralel")
+    batch.add_argument("manifest", help="CSV dengan kolom cover, secret, output, n_lsb, key, seed")
+    batch.add_argument("-w", "--workers", type=int, default=None, help="jumlah proses (default: jumlah CPU)")
+    batch.add_argument("-r", "--report", default=None, help="berkas laporan (.csv atau .json)")
+
+    pack = sub.add_parser("pack", help="Menyisipkan beberapa berkas rahasia ke satu cover (container)")
+    pack.add_argument("cover", help="cover mp3")
+    pack.add_argument("output", help="stego mp3 keluaran")
+    pack.add_argument("secrets", nargs="+", help="berkas rahasia")
+    pack.add_argument("-n", "--n-lsb", type=int, choices=range(1, 5), default=1, help="jumlah LSB (1 - 4)")
+    pack.add_argument("-k", "--key", default=None, help="kunci vigenere")
+    pack.add_argument("-s", "--seed", default=None, help="seed random start")
+    pack.add_argument("--frame-aware", action="store_true", help="lompati header frame MP3")
+    pack.add_argument("--scatter", action="store_true", help="sebar bit payload dengan permutasi berkunci seed")
+    pack.add_argument("--matrix", action="store_true",
+                      help="matrix embedding Hamming: lebih sedikit byte berubah, -n diabaikan")
+
+    unpack = sub.add_parser("unpack", help="Mengekstrak berkas dari stego container")
+    unpack.add_argument("stego", help="stego mp3")
+    unpack.add_argument("names", nargs="*", help="nama/index entri (kosong = semua)")
+    unpack.add_argument("-o", "--output-dir", default=".", help="folder keluaran")
+    unpack.add_argument("-k", "--key", default=None, help="kunci vigenere")
+    unpack.add_argument("-s", "--seed", default=None, help="seed random start")
+    unpack.add_argument("-l", "--list", action="store_true", help="hanya tampilkan daftar entri")
+
+    embed = sub.add_parser("embed", help="Mode pipe: cover dari stdin, stego mp3 ke stdout")
+    source = embed.add_mutually_exclusive_group(required=True)
+    source.add_argument("--secret", default=None, help="path berkas rahasia")
+    source.add_argument("--secret-fd", type=int, default=None, help="file descriptor berkas rahasia, contoh 3 (3<rahasia.txt)")
+    embed.add_argument("--ext", default=None, help="ekstensi berkas rahasia (default dari --secret atau .bin)")
+    embed.add_argument("-n", "--n-lsb", type=int, choices=range(1, 5), default=1, help="jumlah LSB (1 - 4)")
+    embed.add_argument("-k", "--key", default=None, help="kunci vigenere")
+    embed.add_argument("-s", "--seed", default=None, help="seed random start (cover dibaca utuh ke memori)")
+    embed.add_argument("-c", "--compression", choices=("none", "zlib", "lzma", "auto"), default="none",
+                       help="metode kompresi (auto: zlib atau lzma dipilih dari sampel awal)")
+    embed.add_argument("--no-checksum", action="store_true", help="tanpa CRC32 payload di header")
+    embed.add_argument("--frame-aware", action="store_true", help="lompati header frame MP3 (cover dibaca utuh)")
+    embed.add_argument("--scatter", action="store_true", help="sebar bit payload dengan permutasi berkunci seed")
+    embed.add_argument("--matrix", action="store_true",
+                       help="matrix embedding Hamming: lebih sedikit byte berubah, -n diabaikan (cover dibaca utuh)")
+    embed.add_argument("--chunk-size", type=int, default=1 << 20, help="ukuran buffer baca/tulis (byte)")
+
+    extract = sub.add_parser("extract", help="Mode pipe: stego dari stdin, berkas rahasia ke stdout")
+    extract.add_argument("-k", "--key", default=None, help="kunci vigenere")
+    extract.add_argument("-s", "--seed", default=None, help="seed saat penyisipan")
+    extract.add_argument("--chunk-size", type=int, default=1 << 20, help="ukuran buffer baca (byte)")
+
+    extract_range = sub.add_parser("range", help="Mengekstrak sebagian berkas rahasia (rentang byte) tanpa membaca sisanya")
+    extract_range.add_argument("stego", help="stego mp3")
+    extract_range.add_argument("--offset", type=int, default=0, help="byte awal; negatif = dari akhir berkas rahasia")
+    extract_range.add_argument("--length", type=int, default=None, help="jumlah byte (default: sampai akhir)")
+    extract_range.add_argument("-k", "--key", default=None, help="kunci vigenere")
+    extract_range.add_argument("-s", "--seed", default=None, help="seed saat penyisipan")
+    extract_range.add_argument("-o", "--output", default=None, help="berkas keluaran (default: stdout)")
+
+    update = sub.add_parser("update", help="Mengganti berkas rahasia pada stego secara in-place (hanya bagian yang berubah)")
+    update.add_argument("stego", help="stego mp3 yang diperbarui")
+    update.add_argument("secret", help="berkas rahasia baru")
+    update.add_argument("-k", "--key", default=None, help="kunci vigenere")
+    update.add_argument("-s", "--seed", default=None, help="seed saat penyisipan awal")
+    update.add_argument("-c", "--compression", choices=("none", "zlib", "lzma", "auto"), default=None,
+                        help="metode kompresi (default: mengikuti header lama)")
+
+    probe = sub.add_parser("probe", help="Membaca metadata header stego tanpa mengekstrak payload")
+    probe.add_argument("paths", nargs="+", help="berkas mp3 atau folder")
+    probe.add_argument("-r", "--recursive", action="store_true", help="telusuri subfolder")
+    probe.add_argument("-w", "--workers", type=int, default=None, help="jumlah thread (default: otomatis)")
+    probe.add_argument("--json", action="store_true", help="keluaran JSON lines")
+
+    psnr = sub.add_parser("psnr", help="Menghitung PSNR dan metrik distorsi banyak pasangan berkas")
+    psnr.add_argument("files", nargs="+", help="pasangan ASLI STEGO [ASLI STEGO ...]")
+    psnr.add_argument("-w", "--workers", type=int, default=None, help="jumlah proses (default: jumlah CPU)")
+    psnr.add_argument("--json", action="store_true", help="keluaran JSON lines")
+    psnr.add_argument("--ratios", action="store_true",
+                      help="baca header stego untuk kolom bit/chg dan chg/KB (rasio terhadap ukuran payload)")
+
+    bench = sub.add_parser("bench", help="Benchmark throughput embed/extract per tahap")
+    bench.add_argument("--cover-sizes", type=int_list, default=[1_000_000, 10_000_000], help="daftar ukuran cover (byte), dipisah koma")
+    bench.add_argument("--secret-sizes", type=int_list, default=[10_000, 1_000_000], help="daftar ukuran secret (byte), dipisah koma")
+    bench.add_argument("--n-lsb", type=int_list, default=[1, 2, 3, 4], help="daftar n_lsb, dipisah koma")
+    bench.add_argument("--repeat", type=int, default=3, help="jumlah pengulangan (diambil median)")
+    bench.add_argument("-o", "--output", default=None, help="simpan hasil ke berkas .json atau .csv")
+    bench.add_argument("--baseline", default=None, help="hasil JSON commit sebelumnya untuk deteksi regresi")
+    bench.add_argument("--threshold", type=float, default=0.25, help="batas kenaikan waktu relatif (default 0.25)")
+    bench.add_argument("--startup", action="store_true", help="ukur waktu import entry point (python -X importtime)")
+
+    cache = sub.add_parser("cache", help="Statistik atau pengosongan cache analisis cover")
+    cache.add_argument("--clear", action="store_true", help="hapus seluruh entri cache")
+
+    serve = sub.add_parser("serve", help="Menjalankan server HTTP (TCP/Unix socket) untuk embed, extract, dan probe")
+    serve.add_argument("--host", default="127.0.0.1", help="alamat TCP (default 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=8470, help="port TCP (default 8470)")
+    serve.add_argument("--unix", default=None, help="path Unix socket (menggantikan host/port)")
+    serve.add_argument("-w", "--workers", type=int, default=None, help="jumlah proses worker (default: jumlah CPU)")
+    serve.add_argument("--max-jobs", type=int, default=None, help="job CPU bersamaan (default: jumlah worker)")
+    serve.add_argument("--max-pending", type=int, default=64, help="batas request aktif + antre sebelum 503")
+    serve.add_argument("--max-body", type=int, default=1 << 30, help="ukuran body maksimal (byte)")
+
+    return parser
+
+def int_list(text: str) -> list[int]:
+    return [int(float(v)) for v in text.split(',') if v]
+
+def print_psnr(results: list[dict], as_json: bool) -> None:
+    if as_json:
+        for r in results:
+            print(json.dumps(r))
+        return
+    print(f"{'psnr (dB)':>10} {'mse':>10} {'changed':>9} {'max':>4} {'bit/chg':>7} {'chg/KB':>8}  bit flip LSB..MSB  stego")
+    for r in results:
+        if "error" in r:
+            print(f"{'error':>10}  {r['stego']}: {r['error']}")
+            continue
+        flips = ','.join(str(v) for v in r["bits_flipped"])
+        efficiency = '-' if r.get("bits_per_change") is None else f"{r['bits_per_change']:.2f}"
+        per_kb = '-' if r.get("changes_per_kb") is None else f"{r['changes_per_kb']:.1f}"
+        print(f"{r['psnr']:>10.2f} {r['mse']:>10.4f} {r['bytes_changed']:>9} {r['max_delta']:>4} {efficiency:>7} "
+              f"{per_kb:>8}  {flips}  {r['stego']}")
+
+def print_probe(results: list[dict], as_json: bool) -> None:
+    if as_json:
+        for r in results:
+            print(json.dumps(r))
+        return
+    print(f"{'n':>2} {'ext':<6} {'bytes':>10} {'audio':>7} {'hdr':>5}  {'flags':<24} path")
+    for r in results:
+        if "error" in r:
+            print(f"{'-':>2} {'-':<6} {'-':>10} {'-':>7} {'-':>5}  {'-':<24} {r['path']}: {r['error']}")
+            continue
+        print(f"{r['n_lsb']:>2} {r['ext']:<6} {r['content_bytes']:>10} {r['audio_start']:>7} {r['header_bits']:>5}  "
+              f"{r['flags'] or '-':<24} {r['path']}")
+
+def run_pack(args: argparse.Namespace) -> int:
+    from Container import pack_files
+    from Sisip import OPT_MATRIX, OPT_SCATTER
+    try:
+        pack_files(args.cover, args.secrets, args.output, args.seed, args.n_lsb, args.key, args.frame_aware,
+                   (OPT_SCATTER if args.scatter else 0) | (OPT_MATRIX if args.matrix else 0))
+    except (ValueError, OSError) as e:
+        print(f"Terjadi kesalahan: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+def run_unpack(args: argparse.Namespace) -> int:
+    from Container import list_entries, unpack_file
+    from FileProcessor import read_cover
+    try:
+        if args.list:
+            entries = list_entries(read_cover(args.stego), args.seed)
+            print(f"{'#':>4} {'bytes':>10} {'crc32':>8}  nama")
+            for i, e in enumerate(entries):
+                print(f"{i:>4} {e['length']:>10} {e['crc32']:08x}  {e['name']}{e['ext']}")
+            return 0
+        names = [int(n) if n.isdigit() else n for n in args.names] or None
+        for path in unpack_file(args.stego, args.output_dir, names, args.seed, args.key):
+            print(path)
+    except (ValueError, OSError) as e:
+        print(f"Terjadi kesalahan: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+def run_pipe(args: argparse.Namespace) -> int:
+    import io
+    import os
+    from Pipe import embed_pipe, extract_pipe
+    try:
+        if args.command == "extract":
+            header = extract_pipe(sys.stdin.buffer, sys.stdout.buffer, args.seed, args.key, args.chunk_size)
+            print(f"ekstensi: {header['ext']}", file=sys.stderr)
+        else:
+            from FileProcessor import read_secret_payload, secret_payload
+            from Sisip import OPT_MATRIX, OPT_SCATTER
+            checksum = not args.no_checksum
+            if args.secret is not None:
+                payload = read_secret_payload(args.secret, args.key, args.compression, checksum)
+            else:
+                with os.fdopen(args.secret_fd, 'rb') as f:
+                    raw = f.read()
+                payload = secret_payload(io.BytesIO(raw), len(raw), args.ext or ".bin", args.key, args.compression,
+                                         checksum)
+            if args.ext:
+                payload["ext"] = args.ext
+            embed_pipe(sys.stdin.buffer, sys.stdout.buffer, payload, args.seed, args.n_lsb, args.frame_aware,
+                       (OPT_SCATTER if args.scatter else 0) | (OPT_MATRIX if args.matrix else 0), args.chunk_size)
+        sys.stdout.buffer.flush()
+    except (ValueError, OSError) as e:
+        print(f"Terjadi kesalahan: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+def run_range(args: argparse.Namespace) -> int:
+    from Stream import extract_range
+    try:
+        data, ext = extract_range(args.stego, args.offset, args.length, args.seed, args.key)
+        if args.output:
+            with open(args.output, 'wb') as f:
+                f.write(data)
+        else:
+            sys.stdout.buffer.write(data)
+    except (ValueError, OSError) as e:
+        print(f"Terjadi kesalahan: {e}", file=sys.stderr)
+        return 1
+    print(f"{len(data)} byte (ekstensi {ext})", file=sys.stderr)
+    return 0
+
+def run_update(args: argparse.Namespace) -> int:
+    from Stream import update_file
+    try:
+        stats = update_file(args.stego, args.secret, args.seed, args.key, args.compression)
+    except (ValueError, OSError) as e:
+        print(f"Terjadi kesalahan: {e}", file=sys.stderr)
+        return 1
+    mode = "incremental" if stats["incremental"] else "penuh"
+    print(f"{mode}: {stats['patched_bytes']}/{stats['payload_bytes']} byte payload ditulis ({stats['runs']} rentang)")
+    return 0
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.threads is not None:
+        from LSBEngine import set_threads
+        set_threads(args.threads)
+    if not (args.profile or args.profile_out or args.profile_memory):
+        return run_command(args)
+
+    import Profiler
+    Profiler.enable(memory=args.profile_memory, out=args.profile_out)
+    try:
+        return run_command(args)
+    finally:
+        if args.profile_out:
+            Profiler.write_json_lines(args.profile_out)
+        if args.profile or not args.profile_out:
+            print(Profiler.summary_table(), file=sys.stderr)
+
+def run_command(args: argparse.Namespace) -> int:
+    if args.command == "batch":
+        from Batch import main_batch
+        return main_batch(args.manifest, args.workers, args.report)
+    if args.command == "pack":
+        return run_pack(args)
+    if args.command == "unpack":
+        return run_unpack(args)
+    if args.command in ("embed", "extract"):
+        return run_pipe(args)
+    if args.command == "range":
+        return run_range(args)
+    if args.command == "update":
+        return run_update(args)
+    if args.command == "probe":
+        from Probe import collect_mp3, probe_many
+        results = probe_many(collect_mp3(args.paths, args.recursive), args.workers)
+        print_probe(results, args.json)
+        return 0 if all("error" not in r for r in results) else 1
+    if args.command == "psnr":
+        if len(args.files) % 2:
+            print("Berkas harus berpasangan: ASLI STEGO", file=sys.stderr)
+            return 2
+        from PSNR import compare_many
+        results = compare_many(list(zip(args.files[0::2], args.files[1::2])), args.workers, args.ratios)
+        print_psnr(results, args.json)
+        return 0 if all("error" not in r for r in results) else 1
+    if args.command == "bench" and args.startup:
+        from Benchmark import main_startup
+        return main_startup(args.repeat)
+    if args.command == "bench":
+        from Benchmark import main_bench
+        return main_bench(args.cover_sizes, args.secret_sizes, args.n_lsb, args.repeat, args.output,
+                          args.baseline, args.threshold)
+    if args.command == "cache":
+        from CoverCache import default_cache
+        if args.clear:
+            print(f"{default_cache().clear()} entri dihapus")
+        else:
+            print(json.dumps(default_cache().stats()))
+        return 0
+    if args.command == "serve":
+        from Server import main_serve
+        return main_serve(args.host, args.port, args.unix, args.workers, args.max_jobs, args.max_pending,
+                          args.max_body)
+    return 2
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+import lzma
+import zlib
+
+from Sisip import OPT_COMPRESSED, OPT_LZMA
+
+COMPRESSION_METHODS = ("none", "zlib", "lzma", "auto")
+CHUNK_SIZE = 1 << 20
+# Mode auto: jika sampel awal tidak menyusut minimal 2% (zlib maupun lzma), berkas dianggap sudah terkompresi
+# (png, docx, mp3, ...) dan tidak dikompresi sama sekali
+AUTO_SAMPLE_SIZE = 1 << 16
+AUTO_SAMPLE_RATIO = 0.98
+# Hasil kompresi mode auto ditahan di memori sampai ukuran ini, selebihnya di berkas sementara
+AUTO_SPOOL_SIZE = 1 << 24
+
+def method_options(method: str) -> int:
+    """
+    Bit options header untuk metode kompresi
+    """
+    if method not in COMPRESSION_METHODS or method == "auto":
+        raise ValueError(f"Metode kompresi tidak dikenal: {method}")
+    return {"none": 0, "zlib": OPT_COMPRESSED, "lzma": OPT_COMPRESSED | OPT_LZMA}[method]
+
+def new_compressor(method: str):
+    """
+    Objek kompresor streaming (compress/flush) untuk metode zlib atau lzma
+    """
+    if method == "zlib":
+        return zlib.compressobj(9)
+    if method == "lzma":
+        return lzma.LZMACompressor(format=lzma.FORMAT_XZ, check=lzma.CHECK_NONE)
+    raise ValueError(f"Metode kompresi tidak dikenal: {method}")
+
+class Decompressor:
+    """
+    Dekompresi per chunk berurutan sesuai bit options pada header
+    """
+
+    def __init__(self, options: int):
+        self.lzma = bool(options & OPT_LZMA)
+        self.obj = lzma.LZMADecompressor(format=lzma.FORMAT_XZ) if self.lzma else zlib.decompressobj()
+
+    def update(self, chunk: bytes) -> bytes:
+        try:
+            return self.obj.decompress(chunk)
+        except (zlib.error, lzma.LZMAError, EOFError):
+            raise ValueError("Payload terkompresi rusak (seed atau kunci salah?).")
+
+    def finish(self) -> bytes:
+        if self.lzma:
+            if not self.obj.eof:
+                raise ValueError("Payload terkompresi tidak lengkap.")
+            return b''
+        try:
+            out = self.obj.flush()
+        except zlib.error:
+            raise ValueError("Payload terkompresi rusak (seed atau kunci salah?).")
+        if not self.obj.eof:
+            raise ValueError("Payload terkompresi tidak lengkap.")
+        return out
+
+def sample_method(sample: bytes) -> str:
+    """
+    Memilih metode untuk mode auto dari sampel awal: zlib atau lzma, mana yang menghasilkan sampel
+    lebih kecil, atau none jika keduanya tidak menyusutkan sampel
+    """
+    if not sample:
+        return "none"
+    sizes = {method: sum(map(len, compress_chunks([sample], method))) for method in ("zlib", "lzma")}
+    method = min(sizes, key=sizes.get)
+    return method if sizes[method] < len(sample) * AUTO_SAMPLE_RATIO else "none"
+
+def compress_chunks(chunks, method: str):
+    """
+    Generator kompresi streaming: menerima iterable chunk bytes, menghasilkan chunk terkompresi
+    """
+    compressor = new_compressor(method)
+    for chunk in chunks:
+        out = compressor.compress(chunk)
+        if out:
+            yield out
+    yield compressor.flush()
+
+def decompress_chunks(chunks, options: int):
+    """
+    Generator dekompresi streaming sesuai bit options pada header
+    """
+    decompressor = Decompressor(options)
+    for chunk in chunks:
+        out = decompressor.update(chunk)
+        if out:
+            yield out
+    yield decompressor.finish()
+
+def read_chunks(f, chunk_size: int = CHUNK_SIZE, first: bytes = b''):
+    """
+    Generator chunk dari file object (diawali first jika ada)
+    """
+    if first:
+        yield first
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+def spooled_chunks(spool, chunk_size: int = CHUNK_SIZE):
+    """
+    Generator chunk dari berkas spool (dari awal), lalu menutupnya
+    """
+    with spool:
+        spool.seek(0)
+        yield from read_chunks(spool, chunk_size)
+
+def compress_file(f, method: str, raw_size: int, chunk_size: int = CHUNK_SIZE):
+    """
+    Mengompresi isi file object secara streaming
+
+    Args:
+        f (file object): berkas rahasia yang dibuka mode biner, posisi di awal
+        method (str): none, zlib, lzma, atau auto
+        raw_size (int): ukuran berkas asli dalam byte
+        chunk_size (int): ukuran chunk baca
+
+    Output:
+        tuple (iterable chunk payload, bit options). Pada mode auto, metode dipilih dari sampel awal
+        dan hasil kompresi (di-spool, bukan di memori seluruhnya) hanya dipakai jika lebih kecil dari berkas asli
+    """
+    if method == "none":
+        return read_chunks(f, chunk_size), 0
+    if method != "auto":
+        return compress_chunks(read_chunks(f, chunk_size), method), method_options(method)
+
+    sample = f.read(AUTO_SAMPLE_SIZE)
+    method = sample_method(sample)
+    if method == "none":
+        return read_chunks(f, chunk_size, sample), 0
+    import tempfile
+    spool = tempfile.SpooledTemporaryFile(max_size=AUTO_SPOOL_SIZE)
+    for chunk in compress_chunks(read_chunks(f, chunk_size, sample), method):
+        spool.write(chunk)
+    if spool.tell() >= raw_size:
+        spool.close()
+        f.seek(0)
+        return read_chunks(f, chunk_size), 0
+    return spooled_chunks(spool, chunk_size), method_options(method)
@@ -0,0 +1,227 @@
+import mmap
+import os
+import struct
+import zlib
+
+from FileProcessor import read_secret
+from Profiler import profiled
+from Sisip import OPT_CONTAINER, embed_into, locate_payload, read_payload
+from Stream import embed_mmap
+from Vigenere import decrypt_bytes, encrypt_bytes
+
+# Payload mode container: prefix, tabel direktori, lalu data seluruh entri berurutan
+# prefix  : magic "SC", jumlah entri (16 bit), panjang tabel direktori dalam byte (32 bit)
+# entri   : panjang nama (8 bit), nama (utf-8), panjang ekstensi (8 bit), ekstensi,
+#           offset data relatif awal area data (32 bit), panjang (32 bit), CRC32 isi sebelum enkripsi (32 bit)
+CONTAINER_MAGIC = b"SC"
+PREFIX = struct.Struct(">2sHI")
+ENTRY_FIELDS = struct.Struct(">III")
+
+def pack_container(entries: list[dict]) -> bytes:
+    """
+    Menyusun payload container dari beberapa berkas rahasia
+
+    Args:
+        entries (list[dict]): setiap entri berisi name, ext, data (sudah dienkripsi jika perlu),
+            crc32 (CRC32 isi sebelum enkripsi; jika tidak ada, CRC32 data)
+
+    Output:
+        payload container dalam bytes
+    """
+    if not entries:
+        raise ValueError("Container membutuhkan minimal satu berkas.")
+    if len(entries) > 0xFFFF:
+        raise ValueError("Jumlah berkas pada container terlalu banyak.")
+
+    table = bytearray()
+    offset = 0
+    for entry in entries:
+        name = entry["name"].encode("utf-8")
+        ext = entry["ext"].encode("utf-8")
+        if len(name) > 255 or len(ext) > 255:
+            raise ValueError(f"Nama atau ekstensi berkas terlalu panjang: {entry['name']}")
+        table += bytes([len(name)]) + name + bytes([len(ext)]) + ext
+        crc = entry["crc32"] if "crc32" in entry else zlib.crc32(entry["data"])
+        table += ENTRY_FIELDS.pack(offset, len(entry["data"]), crc)
+        offset += len(entry["data"])
+
+    return b''.join([PREFIX.pack(CONTAINER_MAGIC, len(entries), len(table)), table]
+                    + [entry["data"] for entry in entries])
+
+def parse_directory(prefix: bytes, table: bytes) -> list[dict]:
+    """
+    Membaca tabel direktori container
+
+    Args:
+        prefix (bytes): PREFIX.size byte pertama payload
+        table (bytes): tabel direktori (panjang sesuai prefix)
+
+    Output:
+        list entri berisi name, ext, offset (byte di dalam payload), length, crc32
+    """
+    magic, count, table_len = PREFIX.unpack(prefix)
+    if magic != CONTAINER_MAGIC or len(table) != table_len:
+        raise ValueError("Payload bukan container yang valid.")
+
+    data_start = PREFIX.size + table_len
+    entries = []
+    pos = 0
+    try:
+        for _ in range(count):
+            name = table[pos + 1:pos + 1 + table[pos]].decode("utf-8")
+            pos += 1 + table[pos]
+            ext = table[pos + 1:pos + 1 + table[pos]].decode("utf-8")
+            pos += 1 + table[pos]
+            offset, length, crc = ENTRY_FIELDS.unpack_from(table, pos)
+            pos += ENTRY_FIELDS.size
+            entries.append({"name": name, "ext": ext, "offset": data_start + offset, "length": length,
+                            "crc32": crc})
+    except (IndexError, struct.error, UnicodeDecodeError):
+        raise ValueError("Tabel direktori container rusak.")
+    return entries
+
+def read_directory(stego, layout: dict) -> list[dict]:
+    """
+    Membaca tabel direktori container dari stego tanpa mengekstrak data entri
+
+    Args:
+        stego (bytes | bytearray | memoryview | mmap): isi berkas stego mp3
+        layout (dict): hasil Sisip.locate_payload
+
+    Output:
+        list entri (lihat parse_directory)
+    """
+    if not layout["options"] & OPT_CONTAINER:
+        raise ValueError("Stego tidak berisi container.")
+    prefix = read_payload(stego, layout, 0, PREFIX.size)
+    _, _, table_len = PREFIX.unpack(prefix)
+    table = read_payload(stego, layout, PREFIX.size, table_len)
+    return parse_directory(prefix, table)
+
+def find_entry(entries: list[dict], which: int | str) -> dict:
+    """
+    Mencari entri berdasarkan index atau nama berkas (dengan atau tanpa ekstensi)
+    """
+    if isinstance(which, int):
+        if not 0 <= which < len(entries):
+            raise ValueError(f"Index entri di luar jangkauan: {which}")
+        return entries[which]
+    for entry in entries:
+        if which in (entry["name"], entry["name"] + entry["ext"]):
+            return entry
+    raise ValueError(f"Berkas tidak ditemukan di container: {which}")
+
+def read_entry(stego, layout: dict, entry: dict, key: str | None = None) -> bytes:
+    """
+    Mengekstrak satu entri (hanya bit milik entri tersebut yang dibaca), mendekripsinya, lalu
+    memeriksa CRC32 isi sehingga kunci yang salah ikut terdeteksi
+    """
+    data = read_payload(stego, layout, entry["offset"], entry["length"])
+    if key:
+        data = decrypt_bytes(data, key)
+    if zlib.crc32(data) != entry["crc32"]:
+        raise ValueError(f"Checksum tidak cocok untuk {entry['name']}{entry['ext']}: kunci salah atau stego rusak.")
+    return data
+
+def load_entries(paths: list[str], key: str | None = None) -> list[dict]:
+    """
+    Membaca beberapa berkas rahasia sebagai entri container (dienkripsi jika ada key,
+    CRC32 dihitung dari isi sebelum enkripsi)
+    """
+    entries = []
+    for path in paths:
+        data, ext = read_secret(path)
+        crc = zlib.crc32(data)
+        if key:
+            data = encrypt_bytes(data, key)
+        entries.append({"name": os.path.splitext(os.path.basename(path))[0], "ext": ext, "data": data,
+                        "crc32": crc})
+    return entries
+
+# ---------- Main functions ----------
+def embed_many_into(stego, entries: list[dict], random_seed: str | None = None, n_lsb: int = 1,
+                    frame_aware: bool = False) -> None:
+    """
+    Menyisipkan beberapa berkas rahasia sekaligus (satu lintasan) ke buffer stego in-place
+
+    Args:
+        stego (bytearray | mmap): isi berkas cover mp3 yang akan dimodifikasi
+        entries (list[dict]): entri berisi name, ext, data
+        random_seed (str | None): seed untuk random start (opsional)
+        n_lsb (int): jumlah LSB yang digunakan (1 - 4)
+        frame_aware (bool): hanya menyisipkan ke main data frame MP3
+    """
+    embed_into(stego, pack_container(entries), "", random_seed, n_lsb, frame_aware, OPT_CONTAINER)
+
+def embed_many(cover, entries: list[dict], random_seed: str | None = None, n_lsb: int = 1,
+               frame_aware: bool = False) -> bytearray:
+    """
+    Sama seperti embed_many_into, tetapi menghasilkan salinan baru
+
+    Output:
+        bytearray berisi stego-object
+    """
+    stego = bytearray(cover)
+    embed_many_into(stego, entries, random_seed, n_lsb, frame_aware)
+    return stego
+
+def list_entries(stego, random_seed: str | None = None) -> list[dict]:
+    """
+    Daftar berkas di dalam container tanpa mengekstrak isinya
+    """
+    return read_directory(stego, locate_payload(stego, random_seed))
+
+def extract_entry(stego, which: int | str, random_seed: str | None = None,
+                  key: str | None = None) -> tuple[bytes, str]:
+    """
+    Mengekstrak satu berkas dari container tanpa mendekode entri lain
+
+    Args:
+        stego (bytes | bytearray | memoryview | mmap): isi berkas stego mp3
+        which (int | str): index entri atau nama berkas
+        random_seed (str | None): seed yang dipakai saat penyisipan (opsional)
+        key (str | None): kunci dekripsi vigenere (opsional)
+
+    Output:
+        tuple (isi berkas, nama berkas beserta ekstensi)
+    """
+    layout = locate_payload(stego, random_seed)
+    entry = find_entry(read_directory(stego, layout), which)
+    return read_entry(stego, layout, entry, key), entry["name"] + entry["ext"]
+
+@profiled("pack_files")
+def pack_files(cover_path: str, secret_paths: list[str], output_path: str, random_seed: str | None = None,
+               n_lsb: int = 1, key: str | None = None, frame_aware: bool = False, options: int = 0) -> None:
+    """
+    Menyisipkan beberapa berkas ke satu cover mp3 dan menulis stego ke output_path
+    (options: bit tambahan, contoh OPT_SCATTER)
+    """
+    payload = pack_container(load_entries(secret_paths, key))
+    embed_mmap(cover_path, payload, "", output_path, random_seed, n_lsb, frame_aware, options | OPT_CONTAINER)
+
+@profiled("unpack_file")
+def unpack_file(stego_path: str, output_dir: str, names: list[str] | None = None,
+                random_seed: str | None = None, key: str | None = None) -> list[str]:
+    """
+    Mengekstrak berkas dari container ke output_dir. Jika names diisi, hanya entri tersebut
+    yang dibaca dari stego
+
+    Output:
+        list path berkas yang ditulis
+    """
+    if not stego_path.endswith('.mp3'):
+        raise Exception("File audio harus berekstensi mp3!")
+
+    written = []
+    with open(stego_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as stego:
+        layout = locate_payload(stego, random_seed)
+        entries = read_directory(stego, layout)
+        selected = entries if names is None else [find_entry(entries, name) for name in names]
+        os.makedirs(output_dir, exist_ok=True)
+        for entry in selected:
+            # Hanya nama dasar yang dipakai agar entri tidak dapat menulis di luar output_dir
+            path = os.path.join(output_dir, os.path.basename(entry["name"] + entry["ext"]))
+            with open(path, 'wb') as out:
+                out.write(read_entry(stego, layout, entry, key))
+            written.append(path)
+    return written
@@ -0,0 +1,283 @@
+import base64
+import hashlib
+import json
+import mmap
+import os
+import threading
+import zlib
+from array import array
+from collections import OrderedDict
+
+import numpy as np
+
+from Planner import UsableIndex, capacity_bits
+from Sisip import CHECKSUM_LEN, FIXED_HEADER_LEN, find_audio_start
+
+# Lokasi cache di disk; ukuran total dibatasi, entri yang paling lama tidak dipakai dihapus lebih dulu
+CACHE_DIR = os.environ.get("STEGO_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "stego-mp3")
+CACHE_MAX_BYTES = int(float(os.environ.get("STEGO_CACHE_MAX") or 64 << 20))
+# Jumlah entri yang diingat di memori per proses
+MEMO_SIZE = 1024
+# Folder cache dipindai ulang (evict) jika perkiraan total melewati batas, atau setelah sekian kali store
+# (menangkap entri yang ditulis proses lain)
+EVICT_INTERVAL = 256
+# Eviction menyisakan ruang ini (fraksi max_bytes) agar store berikutnya tidak langsung memicu pemindaian lagi
+EVICT_HEADROOM = 0.1
+CACHE_VERSION = 3
+
+def header_bits(secret_ext: str, checksum: bool = True) -> int:
+    """
+    Panjang header stego dalam bit (= byte cover yang dipakai header) untuk ekstensi tertentu
+    """
+    return FIXED_HEADER_LEN + len(secret_ext) * 8 + (CHECKSUM_LEN if checksum else 0)
+
+def capacity_bytes(analysis: dict, n_lsb: int, secret_ext: str = "", checksum: bool = True,
+                   frame_aware: bool = False) -> int:
+    """
+    Ukuran payload maksimal (byte) yang muat di cover, dihitung dari hasil analisis tanpa membuka cover
+
+    Args:
+        analysis (dict): hasil CoverCache.analyze
+        n_lsb (int): jumlah LSB yang digunakan
+        secret_ext (str): ekstensi berkas rahasia (ikut disimpan di header)
+        checksum (bool): header memuat CRC32 payload
+        frame_aware (bool): hanya main data frame MP3 (butuh analisis dengan frames=True)
+    """
+    if frame_aware:
+        if analysis["usable_bytes"] is None:
+            raise ValueError("Analisis cover tidak memuat indeks frame.")
+        usable = analysis["usable_bytes"]
+    else:
+        usable = analysis["size"] - analysis["audio_start"]
+    return capacity_bits(usable, n_lsb, header_bits(secret_ext, checksum)) // 8
+
+class CoverCache:
+    """
+    Cache hasil analisis cover (awal audio, indeks frame, jumlah byte usable) dengan kunci
+    path + ukuran + mtime berkas. Dua lapis: memo LRU di memori proses dan satu berkas JSON
+    per cover di disk (LRU berdasarkan mtime berkas cache, dibatasi total ukuran)
+    """
+
+    def __init__(self, directory: str | None = CACHE_DIR, max_bytes: int = CACHE_MAX_BYTES,
+                 memo_size: int = MEMO_SIZE):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.memo_size = memo_size
+        self.memo = OrderedDict()
+        self.lock = threading.Lock()
+        # Perkiraan total ukuran folder cache (None = belum dipindai) dan jumlah store sejak pemindaian terakhir
+        self.disk_bytes = None
+        self.stores = 0
+
+    def key(self, path: str) -> str:
+        st = os.stat(path)
+        return f"{os.path.realpath(path)}:{st.st_size}:{st.st_mtime_ns}"
+
+    def entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json")
+
+    def remember(self, key: str, analysis: dict) -> None:
+        with self.lock:
+            self.memo[key] = analysis
+            self.memo.move_to_end(key)
+            while len(self.memo) > self.memo_size:
+                self.memo.popitem(last=False)
+
+    def load(self, key: str) -> dict | None:
+        """
+        Mengambil entri dari memo atau disk (None jika belum ada atau tidak valid)
+        """
+        with self.lock:
+            if key in self.memo:
+                self.memo.move_to_end(key)
+                return self.memo[key]
+        if not self.directory:
+            return None
+        path = self.entry_path(key)
+        try:
+            with open(path) as f:
+                analysis = json.load(f)
+        except (OSError, ValueError):
+            return None
+        try:
+            # Tandai baru dipakai untuk LRU; cache read-only tetap dapat dibaca
+            os.utime(path)
+        except OSError:
+            pass
+        if analysis.get("key") != key or analysis.get("version") != CACHE_VERSION:
+            return None
+        self.remember(key, analysis)
+        return analysis
+
+    def store(self, key: str, analysis: dict) -> None:
+        """
+        Menyimpan entri ke memo dan disk. Cache hanya optimasi: kegagalan menulis ke disk
+        (folder tidak dapat ditulis, disk penuh) diabaikan dan entri tetap ada di memo
+        """
+        self.remember(key, analysis)
+        if not self.directory:
+            return
+        path = self.entry_path(key)
+        # Tulis ke berkas sementara lalu rename: aman jika beberapa proses batch menulis bersamaan
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp, 'w') as f:
+                json.dump(analysis, f, separators=(',', ':'))
+                size = f.tell()
+            os.replace(tmp, path)
+            with self.lock:
+                self.stores += 1
+                if self.disk_bytes is not None:
+                    self.disk_bytes += size
+                scan = (self.disk_bytes is None or self.disk_bytes > self.max_bytes
+                        or self.stores >= EVICT_INTERVAL)
+            if scan:
+                self.evict()
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    def evict(self) -> None:
+        """
+        Jika total ukuran melewati max_bytes, menghapus entri disk yang paling lama tidak dipakai
+        sampai tersisa ruang EVICT_HEADROOM, lalu memperbarui perkiraan total ukuran folder
+        """
+        entries = []
+        with os.scandir(self.directory) as it:
+            for e in it:
+                if e.name.endswith('.json'):
+                    try:
+                        st = e.stat()
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime_ns, st.st_size, e.path))
+        total = sum(size for _, size, _ in entries)
+        limit = self.max_bytes * (1 - EVICT_HEADROOM) if total > self.max_bytes else self.max_bytes
+        for _, size, path in sorted(entries):
+            if total <= limit:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+        with self.lock:
+            self.disk_bytes = total
+            self.stores = 0
+
+    def analyze(self, path: str, frames: bool = False) -> dict:
+        """
+        Hasil analisis cover dari cache; dihitung (lalu disimpan) jika belum ada atau cover berubah
+
+        Args:
+            path (str): path cover mp3
+            frames (bool): sertakan indeks frame untuk mode frame-aware
+
+        Output:
+            dict berisi path, size, audio_start, usable_bytes, frames (dua terakhir None jika indeks
+            frame tidak diminta; frames dibaca dengan frame_index)
+        """
+        key = self.key(path)
+        analysis = self.load(key)
+        if analysis is not None and (not frames or analysis["usable_bytes"] is not None):
+            return analysis
+
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            analysis = {
+                "version": CACHE_VERSION,
+                "key": key,
+                "path": path,
+                "size": len(data),
+                "audio_start": find_audio_start(data),
+                "usable_bytes": None,
+                "frames": None,
+            }
+            if frames:
+                index = UsableIndex.from_data(data)
+                analysis.update(usable_bytes=len(index), frames=pack_index(index))
+        self.store(key, analysis)
+        return analysis
+
+    def clear(self) -> int:
+        """
+        Mengosongkan memo dan cache disk
+
+        Output:
+            jumlah berkas cache yang dihapus
+        """
+        with self.lock:
+            self.memo.clear()
+            self.disk_bytes = None
+        removed = 0
+        if self.directory and os.path.isdir(self.directory):
+            with os.scandir(self.directory) as it:
+                for e in it:
+                    if e.name.endswith('.json'):
+                        os.remove(e.path)
+                        removed += 1
+        return removed
+
+    def stats(self) -> dict:
+        entries = []
+        if self.directory and os.path.isdir(self.directory):
+            with os.scandir(self.directory) as it:
+                entries = [e.stat().st_size for e in it if e.name.endswith('.json')]
+        return {"directory": self.directory, "entries": len(entries), "bytes": sum(entries),
+                "max_bytes": self.max_bytes, "memo_entries": len(self.memo)}
+
+def pack_index(index: UsableIndex) -> str:
+    """
+    Indeks frame dalam bentuk ringkas untuk entri cache: selisih awal run berurutan lalu panjang run
+    (uint64, cover >= 4 GiB), dikompresi zlib dan di-base64. Pada cover CBR kedua deret hampir konstan
+    """
+    deltas = np.diff(np.frombuffer(index.starts, dtype=np.uint64), prepend=np.uint64(0))
+    lengths = np.frombuffer(index.lengths, dtype=np.uint64)
+    return base64.b64encode(zlib.compress(np.concatenate([deltas, lengths]).tobytes())).decode("ascii")
+
+def unpack_index(packed: str) -> UsableIndex:
+    """
+    Kebalikan pack_index
+    """
+    values = np.frombuffer(zlib.decompress(base64.b64decode(packed)), dtype=np.uint64)
+    n = len(values) // 2
+    starts = np.cumsum(values[:n], dtype=np.uint64)
+    return UsableIndex(array('Q', starts.tobytes()), array('Q', values[n:].tobytes()))
+
+def frame_index(analysis: dict) -> UsableIndex | None:
+    """
+    UsableIndex dari hasil analisis (None jika indeks frame tidak disimpan)
+    """
+    if analysis["frames"] is None:
+        return None
+    return unpack_index(analysis["frames"])
+
+def choose_cover(cache: CoverCache, paths: list[str], secret_bytes: int, n_lsb: int, secret_ext: str = "",
+                 checksum: bool = True, frame_aware: bool = False) -> str:
+    """
+    Memilih cover terkecil yang masih muat untuk secret (best fit), hanya dari hasil analisis cache
+
+    Output:
+        path cover terpilih. ValueError jika tidak ada yang muat
+    """
+    best = None
+    for path in paths:
+        capacity = capacity_bytes(cache.analyze(path, frame_aware), n_lsb, secret_ext, checksum, frame_aware)
+        if capacity >= secret_bytes and (best is None or capacity < best[0]):
+            best = (capacity, path)
+    if best is None:
+        raise ValueError(f"Tidak ada cover yang muat untuk {secret_bytes} byte dengan {n_lsb} LSB.")
+    return best[1]
+
+_default = None
+
+def default_cache() -> CoverCache:
+    """
+    Cache bersama per proses (lokasi STEGO_CACHE_DIR, batas ukuran STEGO_CACHE_MAX)
+    """
+    global _default
+    if _default is None:
+        _default = CoverCache()
+    return _default
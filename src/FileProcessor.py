@@ -1,6 +1,11 @@
+import os
 import struct
-import pathlib
-from Vigenere import *
+import zlib
+from Vigenere import VigenereStream, decrypt_bytes, encrypt_bytes
+from Profiler import current_stage, profiled
+from Compression import CHUNK_SIZE, Decompressor, compress_file
+from Checksum import PayloadChecksum, verify_crc
+from Sisip import OPT_COMPRESSED
 
 def bstr(n: int) -> str:
     """
@@ -8,6 +13,7 @@ def bstr(n: int) -> str:
     """
     return ''.join([str(n >> x & 1) for x in (7,6,5,4,3,2,1,0)])
 
+@profiled("read_input")
 def read_input(path: str, cover: bool, key: str | None = None):
     """
     Membaca file dan menyimpan dalam representasi bit-bit di file txt
@@ -23,28 +29,17 @@ def read_input(path: str, cover: bool, key: str | None = None):
     if cover and not path.endswith('.mp3'):
         raise Exception("File cover atau output harus berekstensi mp3!")
     
-    key_idx = 0
+    with open(path, 'rb') as f:
+        data = f.read()
+    # Enkripsi file rahasia jika ada key
     if not cover and key:
-        key = key.encode("utf-8")
-        key_len = len(key)
+        data = encrypt_bytes(data, key)
     
-    with open(path, 'rb') as f, open('cover.txt' if cover else 'sisip.txt', 'w') as temp:
-        temp.write(pathlib.Path(path).suffix + '\n')
-        
-        while True:
-            byte = f.read(1)
-            if not byte:
-                break
-            
-            value = struct.unpack('B', byte)[0]
-            # Enkripsi file rahasia jika ada key
-            if not cover and key:
-                current_key = key[key_idx % key_len]
-                value = encrypt_vigenere(value, current_key)
-                key_idx += 1
-            
-            temp.write(bstr(value) + '\n')
+    with open('cover.txt' if cover else 'sisip.txt', 'w') as temp:
+        temp.write(os.path.splitext(path)[1] + '\n')
+        temp.writelines(bstr(value) + '\n' for value in data)
 
+@profiled("read_input_stega")
 def read_input_stega(path: str):
     """
     Membaca file dan menyimpan dalam representasi bit-bit di file txt
@@ -58,7 +53,7 @@ def read_input_stega(path: str):
         raise Exception("File audio harus berekstensi mp3!")
     
     with open(path, 'rb') as f, open('stega.txt', 'w') as temp:
-        temp.write(pathlib.Path(path).suffix + '\n')
+        temp.write(os.path.splitext(path)[1] + '\n')
         
         while True:
             byte = f.read(1)
@@ -69,6 +64,7 @@ def read_input_stega(path: str):
             
             temp.write(bstr(value) + '\n')
 
+@profiled("write_stega")
 def write_stega(fileName: str):
     """
     Membuat file .mp3 hasil steganografi yang bit-bitnya diambil dari file stega.txt
@@ -92,6 +88,7 @@ def write_stega(fileName: str):
             byteResult = bytes([int(byteString, 2)])
             out.write(byteResult)
 
+@profiled("read_write_secret")
 def read_write_secret(fileName: str, key: str | None = None):
     """
     Rekronsturksi file rahasia dari extracted.txt
@@ -103,29 +100,167 @@ def read_write_secret(fileName: str, key: str | None = None):
     Output:
         file rahasia disimpan di fileName
     """
-    key_idx = 0
-    if key:
-        key = key.encode("utf=8")
-        key_len = len(key)
     fileName = fileName.split('.')[0]
         
     with open('extracted.txt', 'r') as f:
         ext = f.readline().strip() # Read and add extension
         fileName += ext
         
-        with open(fileName, 'wb') as out:    
-            while True:
-                byteString = f.readline().strip()
-                if not byteString: break
-                
-                value = int(byteString, 2)
-                if key:
-                    current_key = key[key_idx % key_len]
-                    value = decrypt_vigenere(value, current_key)
-                    key_idx += 1
+        data = bytearray()
+        while True:
+            byteString = f.readline().strip()
+            if not byteString: break
+            data.append(int(byteString, 2))
+    
+    if key:
+        data = decrypt_bytes(bytes(data), key)
+    
+    with open(fileName, 'wb') as out:
+        out.write(data)
+
+@profiled("read_cover")
+def read_cover(path: str) -> bytes:
+    """
+    Membaca berkas cover/stego mp3 langsung sebagai bytes (tanpa berkas txt)
+    
+    Args:
+        path (str): Path file mp3
+    Output:
+        isi berkas dalam bytes
+    """
+    if not path.endswith('.mp3'):
+        raise Exception("File audio harus berekstensi mp3!")
+    
+    with open(path, 'rb') as f:
+        data = f.read()
+    current_stage().add(bytes=len(data))
+    return data
+
+@profiled("read_secret")
+def read_secret(path: str, key: str | None = None) -> tuple[bytes, str]:
+    """
+    Membaca berkas rahasia sebagai bytes dan mengenkripsinya jika ada key
+    
+    Args:
+        path (str): Path file rahasia
+        key (str | None): Kunci untuk enkripsi vigenere (opsional)
+    Output:
+        tuple (isi berkas, ekstensi berkas)
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    
+    if key:
+        data = encrypt_bytes(data, key)
+    current_stage().add(bytes=len(data))
+    
+    return data, os.path.splitext(path)[1]
+
+@profiled("read_secret_payload")
+def read_secret_payload(path: str, key: str | None = None, compression: str = "none",
+                        checksum: bool = False) -> dict:
+    """
+    Membaca berkas rahasia secara streaming: dikompresi (opsional), checksum dihitung (opsional),
+    lalu dienkripsi jika ada key
+    
+    Args:
+        path (str): Path file rahasia
+        key (str | None): Kunci untuk enkripsi vigenere (opsional)
+        compression (str): none, zlib, lzma, atau auto (dikompresi hanya jika lebih kecil)
+        checksum (bool): hitung CRC32 payload untuk header
+    Output:
+        dict berisi data (payload), ext, options (bit options header), checksum (None jika tidak dihitung)
+    """
+    with open(path, 'rb') as f:
+        return secret_payload(f, os.path.getsize(path), os.path.splitext(path)[1], key, compression, checksum)
+
+def secret_payload(f, raw_size: int, ext: str, key: str | None = None, compression: str = "none",
+                   checksum: bool = False) -> dict:
+    """
+    Seperti read_secret_payload, tetapi dari file object yang sudah terbuka (misalnya pipe yang
+    sudah dibaca ke io.BytesIO)
+    
+    Args:
+        f (BinaryIO): berkas rahasia, posisi di awal (harus dapat di-seek untuk kompresi auto)
+        raw_size (int): ukuran berkas rahasia dalam byte
+        ext (str): ekstensi berkas rahasia untuk header
+    """
+    cipher = VigenereStream(key) if key else None
+    crc = PayloadChecksum() if checksum else None
+    data = bytearray()
+    chunks, options = compress_file(f, compression, raw_size)
+    for chunk in chunks:
+        if crc:
+            crc.update(chunk)
+        data += cipher.update(chunk) if cipher else chunk
+    current_stage().add(bytes=len(data))
+    
+    return {
+        "data": bytes(data),
+        "ext": ext,
+        "options": options,
+        "checksum": crc.value() if crc else None,
+    }
+
+@profiled("write_stego")
+def write_stego(fileName: str, data) -> None:
+    """
+    Menulis stego-object dari bytes ke fileName
+    
+    Args:
+        fileName (str): File output steganografi (wajib mp3)
+        data (bytes | bytearray): isi stego-object
+    """
+    if (not fileName.endswith('.mp3')):
+        raise Exception("File stego-object berekstensi mp3!")
+    
+    with open(fileName, 'wb') as out:
+        out.write(data)
+    current_stage().add(bytes=len(data))
+
+@profiled("write_secret")
+def write_secret(fileName: str, data: bytes, ext: str, key: str | None = None, options: int = 0,
+                 crc32: int | None = None) -> str:
+    """
+    Menulis berkas rahasia hasil ekstraksi, didekripsi jika ada key
+    dan didekompresi per chunk jika header menandai payload terkompresi.
+    Jika crc32 diisi, payload diverifikasi sebelum ada berkas yang ditulis
+    
+    Args:
+        fileName (str): File output (ekstensi diganti dengan ext)
+        data (bytes): isi berkas rahasia hasil ekstraksi
+        ext (str): ekstensi berkas rahasia
+        key (str | None): Kunci untuk dekripsi vigenere (opsional)
+        options (int): bit options pada header stego
+        crc32 (int | None): CRC32 payload dari header (opsional)
+        
+    Output:
+        path berkas yang ditulis
+    """
+    if key:
+        data = decrypt_bytes(data, key)
+    if crc32 is not None:
+        verify_crc(zlib.crc32(data), crc32)
+    
+    fileName = os.path.splitext(fileName)[0] + ext
+    with open(fileName, 'wb') as out:
+        write_plain(out, data, options)
+    current_stage().add(bytes=len(data))
+    
+    return fileName
 
-                byteResult = bytes([value])
-                out.write(byteResult)
+def write_plain(out, data: bytes, options: int = 0) -> None:
+    """
+    Menulis payload yang sudah didekripsi ke file object, didekompresi per chunk jika perlu
+    """
+    if options & OPT_COMPRESSED:
+        decompressor = Decompressor(options)
+        view = memoryview(data)
+        for i in range(0, len(view), CHUNK_SIZE):
+            out.write(decompressor.update(view[i:i + CHUNK_SIZE]))
+        out.write(decompressor.finish())
+    else:
+        out.write(data)
 
 
 # Contoh penggunaan
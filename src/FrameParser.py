@@ -0,0 +1,158 @@
+from typing import NamedTuple
+
+# Bitrate (kbps) per [MPEG1?][layer], index 0 = free format (tidak didukung), 15 = tidak valid
+BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# Sample rate per bit versi (00 = MPEG2.5, 10 = MPEG2, 11 = MPEG1)
+SAMPLE_RATES = {
+    0b00: (11025, 12000, 8000),
+    0b10: (22050, 24000, 16000),
+    0b11: (44100, 48000, 32000),
+}
+
+class Frame(NamedTuple):
+    """
+    Satu frame MP3 hasil parsing
+
+    offset: index byte awal frame (sync word)
+    length: panjang frame dalam byte (header + side info + main data)
+    header_len: panjang header (4, atau 6 jika ada CRC)
+    side_info_len: panjang side information (hanya layer III, selain itu 0)
+    """
+    offset: int
+    length: int
+    header_len: int
+    side_info_len: int
+
+    @property
+    def end(self) -> int:
+        return self.offset + self.length
+
+    @property
+    def main_data_start(self) -> int:
+        return self.offset + self.header_len + self.side_info_len
+
+def id3v2_length(head) -> int:
+    """
+    Panjang total tag ID3v2 dari 10 byte header tag (0 jika tidak ada tag)
+
+    Args:
+        head (bytes | bytearray | memoryview | mmap): minimal 10 byte awal berkas mp3
+    """
+    if len(head) < 10 or bytes(head[0:3]) != b'ID3':
+        return 0
+    # Ukuran tag berupa synchsafe integer (7 bit per byte)
+    size = (head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9]
+    footer = 10 if head[5] & 0x10 else 0
+    return 10 + size + footer
+
+def skip_id3v2(data) -> int:
+    """
+    Mengembalikan index byte setelah tag ID3v2 (0 jika tidak ada tag)
+
+    Args:
+        data (bytes | bytearray | memoryview | mmap): isi berkas mp3
+
+    Output:
+        index byte pertama setelah tag ID3v2
+    """
+    return min(id3v2_length(data), len(data))
+
+def parse_frame_header(data, pos: int) -> Frame | None:
+    """
+    Memvalidasi dan membaca header frame MP3 pada index pos
+
+    Args:
+        data (bytes | bytearray | memoryview | mmap): isi berkas mp3
+        pos (int): index kandidat sync word
+
+    Output:
+        Frame jika header valid, None jika tidak
+    """
+    if pos + 4 > len(data):
+        return None
+    b1, b2, b3 = data[pos + 1], data[pos + 2], data[pos + 3]
+    if data[pos] != 0xFF or b1 & 0xE0 != 0xE0:
+        return None
+
+    version = (b1 >> 3) & 0b11
+    layer = 4 - ((b1 >> 1) & 0b11)
+    if version == 0b01 or layer == 4:
+        return None
+    bitrate_idx = b2 >> 4
+    sr_idx = (b2 >> 2) & 0b11
+    if bitrate_idx in (0, 15) or sr_idx == 3:
+        return None
+
+    mpeg1 = version == 0b11
+    bitrate = BITRATES[(mpeg1, layer)][bitrate_idx] * 1000
+    sample_rate = SAMPLE_RATES[version][sr_idx]
+    padding = (b2 >> 1) & 1
+
+    if layer == 1:
+        length = (12 * bitrate // sample_rate + padding) * 4
+    elif layer == 3 and not mpeg1:
+        length = 72 * bitrate // sample_rate + padding
+    else:
+        length = 144 * bitrate // sample_rate + padding
+
+    header_len = 4 if b1 & 1 else 6  # protection bit 0 = ada CRC 16 bit
+    side_info_len = 0
+    if layer == 3:
+        mono = (b3 >> 6) == 0b11
+        if mpeg1:
+            side_info_len = 17 if mono else 32
+        else:
+            side_info_len = 9 if mono else 17
+    if length < header_len + side_info_len:
+        return None
+
+    return Frame(pos, length, header_len, side_info_len)
+
+def find_next_frame(data, pos: int) -> Frame | None:
+    """
+    Mencari frame valid pertama mulai dari index pos (resync), dengan syarat
+    frame berikutnya juga valid atau frame berakhir tepat di akhir data
+    """
+    n = len(data)
+    while True:
+        pos = data.find(b'\xff', pos)
+        if pos < 0 or pos + 4 > n:
+            return None
+        frame = parse_frame_header(data, pos)
+        if frame is not None and frame.end <= n:
+            if frame.end == n or parse_frame_header(data, frame.end) is not None:
+                return frame
+        pos += 1
+
+def index_frames(data) -> list[Frame]:
+    """
+    Membangun indeks frame MP3 dalam satu lintasan linear:
+    lewati ID3v2, cari frame pertama, lalu lompat sesuai panjang frame
+
+    Args:
+        data (bytes | bytearray | mmap | memoryview): isi berkas mp3
+
+    Output:
+        list Frame berurutan (frame terpotong di akhir berkas tidak dimasukkan)
+    """
+    if not hasattr(data, 'find'):
+        data = bytes(data)
+    n = len(data)
+    frames = []
+    pos = skip_id3v2(data)
+    while pos < n:
+        frame = parse_frame_header(data, pos)
+        if frame is None or frame.end > n:
+            frame = find_next_frame(data, pos + 1 if frame is None else pos)
+            if frame is None:
+                break
+        frames.append(frame)
+        pos = frame.end
+    return frames
@@ -0,0 +1,235 @@
+import os
+
+import numpy as np
+
+# Jumlah bit payload maksimal yang diproses sekaligus (membatasi memori sementara)
+CHUNK_BITS = 1 << 22
+# Payload di bawah ukuran ini tidak dipecah ke thread (overhead pool lebih besar dari hasilnya)
+PARALLEL_MIN_BITS = 1 << 23
+_threads = int(os.environ.get("STEGO_THREADS") or 1) or os.cpu_count() or 1
+_pool = None
+
+def set_threads(n: int) -> None:
+    """
+    Mengatur jumlah thread penyisipan/ekstraksi dalam satu berkas (0 = jumlah CPU, 1 = tanpa thread).
+    Default dari environment STEGO_THREADS
+    """
+    global _threads, _pool
+    n = n or os.cpu_count() or 1
+    if n != _threads and _pool is not None:
+        _pool.shutdown()
+        _pool = None
+    _threads = n
+
+def run_tasks(fn, tasks: list[tuple]) -> None:
+    """
+    Menjalankan fn(*task) untuk setiap task, paralel di thread pool jika diaktifkan.
+    Kernel NumPy melepas GIL, sehingga task pada rentang byte berbeda berjalan bersamaan
+    """
+    global _pool
+    if _threads <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            fn(*task)
+        return
+    if _pool is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _pool = ThreadPoolExecutor(max_workers=_threads, thread_name_prefix="lsb")
+    for future in [_pool.submit(fn, *task) for task in tasks]:
+        future.result()
+
+def as_array(buf) -> np.ndarray:
+    """
+    Membungkus bytes/bytearray/memoryview menjadi array uint8 tanpa menyalin
+
+    Args:
+        buf (bytes | bytearray | memoryview | np.ndarray): buffer data
+
+    Output:
+        view np.ndarray uint8 (writable jika buf writable)
+    """
+    if isinstance(buf, np.ndarray):
+        return buf
+    return np.frombuffer(buf, dtype=np.uint8)
+
+def bit_segments(n_bits: int, start_offset_bit: int, capacity: int):
+    """
+    Memecah bit payload 0..n_bits-1 menjadi potongan yang kontigu di ruang payload
+    (maksimal dua potongan karena wrap-around % capacity)
+
+    Args:
+        n_bits (int): jumlah bit payload
+        start_offset_bit (int): offset bit awal payload
+        capacity (int): kapasitas payload dalam bit
+
+    Output:
+        generator (index bit payload, index bit di ruang payload, panjang)
+    """
+    j = 0
+    g = start_offset_bit % capacity
+    while j < n_bits:
+        length = min(n_bits - j, capacity - g)
+        yield j, g, length
+        j += length
+        g = 0
+
+def partition(n_bits: int, start_offset_bit: int, capacity: int, n_lsb: int) -> list[list[tuple[int, int, int]]]:
+    """
+    Seperti bit_segments, tetapi setiap potongan dipecah lagi menjadi bagian-bagian untuk thread.
+    Batas bagian selalu jatuh di awal byte cover (g kelipatan n_lsb). Jika wrap-around membuat ekor
+    potongan kedua dan kepala potongan pertama berada di byte cover yang sama, keduanya dimasukkan
+    ke task yang sama, sehingga tidak ada dua task yang menulis byte yang sama
+
+    Output:
+        list task, masing-masing list (index bit payload, index bit di ruang payload, panjang)
+        yang dijalankan berurutan
+    """
+    segments = list(bit_segments(n_bits, start_offset_bit, capacity))
+    if _threads <= 1 or n_bits < PARALLEL_MIN_BITS:
+        return [segments]
+    step = -(-n_bits // (_threads * 4))
+    step += -step % (8 * n_lsb)
+    tasks = []
+    for j, g, length in segments:
+        cut = min((-g) % n_lsb + step, length)
+        tasks.append([(j, g, cut)])
+        while cut < length:
+            size = min(step, length - cut)
+            tasks.append([(j + cut, g + cut, size)])
+            cut += size
+    if len(segments) == 2:
+        (_, g0, _), (_, _, wrapped) = segments
+        if (wrapped - 1) // n_lsb == g0 // n_lsb:
+            tasks[0] += tasks.pop()
+    return tasks
+
+def split_aligned(j: int, g: int, length: int, n_lsb: int):
+    """
+    Memecah satu potongan kontigu menjadi bagian kepala/ekor (tidak sejajar byte cover)
+    dan bagian tengah yang sejajar (setiap byte cover terisi penuh n_lsb bit)
+
+    Output:
+        list (index bit payload, index bit di ruang payload, panjang, sejajar)
+    """
+    head = min((-g) % n_lsb, length)
+    body = (length - head) // n_lsb * n_lsb
+    tail = length - head - body
+    pieces = []
+    if head:
+        pieces.append((j, g, head, False))
+    for k in range(0, body, CHUNK_BITS - CHUNK_BITS % n_lsb):
+        step = min(CHUNK_BITS - CHUNK_BITS % n_lsb, body - k)
+        pieces.append((j + head + k, g + head + k, step, True))
+    if tail:
+        pieces.append((j + head + body, g + head + body, tail, False))
+    return pieces
+
+def unpack_bits(src: np.ndarray, j: int, length: int) -> np.ndarray:
+    """
+    Mengambil bit ke-j s.d. j+length-1 (MSB dulu) dari src sebagai array 0/1
+    """
+    return np.unpackbits(src[j >> 3:(j + length + 7) >> 3])[j & 7:(j & 7) + length]
+
+def embed_run(arr: np.ndarray, src: np.ndarray, j: int, g: int, length: int, payload_base: int,
+              n_lsb: int) -> None:
+    """
+    Menyisipkan bit src ke-j s.d. j+length-1 ke posisi payload g s.d. g+length-1
+    (satu potongan kontigu tanpa wrap-around)
+
+    Args:
+        arr (np.ndarray): buffer stego uint8 yang writable
+        src (np.ndarray): sumber bit (MSB dulu) uint8
+        j (int): index bit awal pada src
+        g (int): index bit awal di ruang payload
+        length (int): jumlah bit
+        payload_base (int): index byte awal region payload relatif terhadap arr
+        n_lsb (int): jumlah LSB yang digunakan
+    """
+    for j, g, length, aligned in split_aligned(j, g, length, n_lsb):
+        bits = unpack_bits(src, j, length)
+        if aligned:
+            # Setiap byte cover menerima tepat n_lsb bit berurutan
+            cols = bits.reshape(-1, n_lsb)
+            vals = cols[:, 0].copy()
+            for k in range(1, n_lsb):
+                vals |= cols[:, k] << k
+            lo = payload_base + g // n_lsb
+            view = arr[lo:lo + len(vals)]
+            view &= np.uint8(0xFF ^ ((1 << n_lsb) - 1))
+            view |= vals
+        else:
+            for b in range(length):
+                idx = payload_base + (g + b) // n_lsb
+                p = (g + b) % n_lsb
+                arr[idx] = (arr[idx] & (0xFF ^ (1 << p))) | (int(bits[b]) << p)
+
+def extract_run(arr: np.ndarray, bits: np.ndarray, j: int, g: int, length: int, payload_base: int,
+                n_lsb: int) -> None:
+    """
+    Mengambil bit pada posisi payload g s.d. g+length-1 ke bits[j:j+length]
+    (kebalikan embed_run)
+    """
+    for j, g, length, aligned in split_aligned(j, g, length, n_lsb):
+        if aligned:
+            lo = payload_base + g // n_lsb
+            vals = arr[lo:lo + length // n_lsb]
+            planes = bits[j:j + length].reshape(-1, n_lsb)
+            for k in range(n_lsb):
+                np.bitwise_and(vals >> k, 1, out=planes[:, k])
+        else:
+            for b in range(length):
+                idx = payload_base + (g + b) // n_lsb
+                bits[j + b] = (arr[idx] >> ((g + b) % n_lsb)) & 1
+
+def embed_payload(stego, payload: bytes, payload_base: int, start_offset_bit: int, capacity: int,
+                  n_lsb: int, n_bits: int | None = None) -> None:
+    """
+    Menyisipkan bit-bit payload (MSB dulu) ke n_lsb LSB stego secara in-place.
+    Bit ke-j masuk ke posisi g = (start_offset_bit + j) % capacity, yaitu
+    byte payload_base + g // n_lsb pada LSB ke-(g % n_lsb)
+
+    Args:
+        stego (bytearray | memoryview | np.ndarray): buffer stego yang writable
+        payload (bytes): data yang disisipkan
+        payload_base (int): index byte awal region payload
+        start_offset_bit (int): offset bit awal payload
+        capacity (int): kapasitas payload dalam bit (wrap-around)
+        n_lsb (int): jumlah LSB yang digunakan
+        n_bits (int | None): jumlah bit yang disisipkan (default seluruh payload)
+    """
+    arr = as_array(stego)
+    src = as_array(payload)
+    if n_bits is None:
+        n_bits = len(src) * 8
+
+    def embed_part(runs: list[tuple[int, int, int]]) -> None:
+        for j, g, length in runs:
+            embed_run(arr, src, j, g, length, payload_base, n_lsb)
+
+    run_tasks(embed_part, [(runs,) for runs in partition(n_bits, start_offset_bit, capacity, n_lsb)])
+
+def extract_payload(stego, n_bits: int, payload_base: int, start_offset_bit: int, capacity: int,
+                    n_lsb: int) -> bytes:
+    """
+    Mengambil n_bits bit payload dari n_lsb LSB stego (kebalikan embed_payload)
+
+    Args:
+        stego (bytes | bytearray | memoryview | np.ndarray): buffer stego
+        n_bits (int): jumlah bit yang diambil
+        payload_base (int): index byte awal region payload
+        start_offset_bit (int): offset bit awal payload
+        capacity (int): kapasitas payload dalam bit (wrap-around)
+        n_lsb (int): jumlah LSB yang digunakan
+
+    Output:
+        payload dalam bytes (bit terakhir dipadding 0)
+    """
+    arr = as_array(stego)
+    bits = np.zeros(n_bits, dtype=np.uint8)
+
+    def extract_part(runs: list[tuple[int, int, int]]) -> None:
+        for j, g, length in runs:
+            extract_run(arr, bits, j, g, length, payload_base, n_lsb)
+
+    run_tasks(extract_part, [(runs,) for runs in partition(n_bits, start_offset_bit, capacity, n_lsb)])
+
+    return np.packbits(bits).tobytes()
@@ -1,18 +1,20 @@
-from Sisip import *
-from PlaySong import *
-from FileProcessor import *
-from Vigenere import *
-from PSNR import *
 import os
 
+from Checksum import verify_stego_prefix
+from Container import pack_files, unpack_file
+from FileProcessor import read_cover, read_secret_payload, write_secret
+from PSNR import calculate_psnr_mp3
+from Sisip import OPT_CONTAINER, OPT_MATRIX, OPT_SCATTER, locate_payload, read_payload
+from Stream import embed_mmap
+
 def sisip_pesan():
     print("\n=== Penyisipan Pesan Rahasia ke File Audio ===\n")
     print("Masukkan file beserta ekstensi!")
     cover_name = input("Masukkan nama file cover (mp3): ")
     cover_name = os.path.join("sound", cover_name)
     
-    secret_name = input("Masukkan nama file pesan rahasia: ")
-    secret_name = os.path.join("secret", secret_name)
+    secret_name = input("Masukkan nama file pesan rahasia (pisahkan dengan koma untuk beberapa file): ")
+    secret_names = [os.path.join("secret", name.strip()) for name in secret_name.split(',') if name.strip()]
     
     output_name = input("Masukkan path file output penyisipan pesan (mp3): ")
     output_name = os.path.join("output", output_name)
@@ -31,17 +33,34 @@ def sisip_pesan():
             
     seed = input("Masukkan seed pembangkit acak (tekan enter untuk tanpa seed): ")
     
+    scatter = bool(seed) and input("Sebar bit pesan secara acak ke seluruh cover dengan seed? (y/n, tekan enter untuk tidak): ").strip().lower() == 'y'
+    
+    matrix = not scatter and input("Gunakan matrix embedding (lebih sedikit byte berubah, jumlah LSB diabaikan)? (y/n, tekan enter untuk tidak): ").strip().lower() == 'y'
+    
+    frame_aware = input("Lompati header frame MP3? (y/n, tekan enter untuk tidak): ").strip().lower() == 'y'
+    
+    if len(secret_names) > 1:
+        # Container tidak dikompresi dan tidak memakai checksum header; setiap entri memiliki CRC32 sendiri
+        print("Kompresi dan checksum tidak berlaku untuk beberapa berkas (container memakai CRC32 per berkas).")
+        compression = "none"
+    else:
+        compression = input("Kompresi berkas rahasia (zlib/lzma/auto, tekan enter untuk tanpa kompresi): ").strip().lower() or "none"
+    
+    options = (OPT_SCATTER if scatter else 0) | (OPT_MATRIX if matrix else 0)
+    
     try:
-        read_input(cover_name, cover=True)
-        read_input(secret_name, cover=False, key=key if key else None)
         print("\nMenyisipkan berkas rahasia...")
-        sisip(seed, n_lsb)
-        write_stega(output_name)
+        if len(secret_names) > 1:
+            pack_files(cover_name, secret_names, output_name, seed, n_lsb, key if key else None, frame_aware,
+                       options)
+        else:
+            payload = read_secret_payload(secret_names[0], key if key else None, compression, checksum=True)
+            embed_mmap(cover_name, payload["data"], payload["ext"], output_name, seed, n_lsb, frame_aware,
+                       payload["options"] | options, payload["checksum"])
         print(f"Pesan berhasil disisipkan ke dalam {output_name}")
-        os.remove('cover.txt')
-        os.remove('sisip.txt')
-        os.remove('stega.txt')
     
+        # pygame hanya dimuat saat fitur pemutaran dipakai
+        from PlaySong import play_song
         play_song(output_name)
         calculate_psnr_mp3(cover_name, output_name)
     except Exception as e:
@@ -59,13 +78,20 @@ def ekstrak_pesan():
     seed = input("Masukkan seed pembangkit acak (tekan enter untuk tanpa seed): ")
 
     try:
-        read_input_stega(stego_name)
-        ekstrak(seed)
+        stego = read_cover(stego_name)
         print("\nMengekstrak berkas rahasia...")
-        read_write_secret(output_name, key if key else None)
+        layout = locate_payload(stego, seed)
+        if layout["options"] & OPT_CONTAINER:
+            # Berisi beberapa berkas: semua ditulis ke folder ekstraksi dengan nama aslinya
+            written = unpack_file(stego_name, os.path.dirname(output_name), None, seed, key if key else None)
+            print(f"{len(written)} pesan berhasil diekstrak: {', '.join(written)}")
+            return
+        # Seed/kunci salah terdeteksi dari sampel awal payload sebelum ekstraksi penuh
+        verify_stego_prefix(stego, layout, key if key else None)
+        secret = read_payload(stego, layout)
+        output_name = write_secret(output_name, secret, layout["ext"], key if key else None, layout["options"],
+                                   layout["crc32"])
         print(f"Pesan berhasil diekstrak ke dalam {output_name}")
-        os.remove('stega.txt')
-        os.remove('extracted.txt')
         
     except Exception as e:
         print(f"Terjadi kesalahan: {e}")
@@ -84,6 +110,8 @@ def main():
             loop = False
             nama_lagu = input("Masukkan nama file audio (mp3): ")
             nama_lagu = os.path.join("sound", nama_lagu)
+            # pygame hanya dimuat saat fitur pemutaran dipakai
+            from PlaySong import play_song
             play_song(nama_lagu)
         elif fitur == '4' :
             loop = False
@@ -95,5 +123,6 @@ def main():
             calculate_psnr_mp3(original_name, stego_name)
         else:
             print("\nPilihan tidak valid. Silakan coba lagi.")
-    
-main() 
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+import numpy as np
+
+from LSBEngine import as_array, bit_segments
+from Randomizer import generate_random
+
+# Batas k: satu blok 2^k - 1 byte memuat k bit; header menyimpan k pada field n_lsb
+MATRIX_MAX_K = 10
+# Jumlah byte cover per batch blok (membatasi memori sementara matriks LSB blok x (2^k - 1))
+MATRIX_CHUNK_BYTES = 1 << 22
+
+def block_size(k: int) -> int:
+    """
+    Jumlah byte cover (1 LSB per byte) dalam satu blok kode Hamming dengan k bit pesan
+    """
+    return (1 << k) - 1
+
+def choose_k(available_bytes: int, content_size_bits: int) -> int:
+    """
+    Memilih k terbesar (efisiensi tertinggi) yang payload-nya masih muat di available_bytes
+
+    Args:
+        available_bytes (int): byte cover untuk payload (setelah header)
+        content_size_bits (int): panjang payload dalam bit
+
+    Output:
+        k (1 - MATRIX_MAX_K). ValueError jika tidak muat bahkan dengan k = 1
+    """
+    for k in range(MATRIX_MAX_K, 0, -1):
+        if -(-content_size_bits // k) * block_size(k) <= available_bytes:
+            return k
+    raise ValueError("Cover tidak cukup untuk berkas rahasia.")
+
+def matrix_layout(total_bytes: int, audio_start_idx: int, header_len: int, content_size_bits: int, k: int,
+                  random_seed: str | None = None) -> tuple[int, int, int]:
+    """
+    Tata letak payload mode matrix: region payload dibagi menjadi blok 2^k - 1 byte, blok payload
+    ke-b berada di blok (start + b) % capacity
+
+    Output:
+        tuple (index byte awal payload, kapasitas dalam blok, blok awal payload)
+    """
+    total_usable_bytes = total_bytes - audio_start_idx
+    if header_len >= total_usable_bytes:
+        raise ValueError("Cover too small to hold header in audio region.")
+    capacity = (total_usable_bytes - header_len) // block_size(k)
+    if -(-content_size_bits // k) > capacity:
+        raise ValueError("Cover tidak cukup untuk berkas rahasia.")
+    start = generate_random(random_seed, capacity) if random_seed is not None and capacity else 0
+    return audio_start_idx + header_len, capacity, start
+
+def _block_runs(b0: int, n_blocks: int, start: int, capacity: int, m: int):
+    """
+    Potongan blok kontigu (index blok payload, index blok di region, jumlah) per batch MATRIX_CHUNK_BYTES
+    """
+    step = max(1, MATRIX_CHUNK_BYTES // m)
+    for j, g, length in bit_segments(n_blocks, start + b0, capacity):
+        for c in range(0, length, step):
+            yield j + c, g + c, min(step, length - c)
+
+def _block_lsbs(arr: np.ndarray, g: int, count: int, payload_base: int, m: int, index=None):
+    """
+    LSB blok g .. g + count - 1 (matriks count x m) beserta posisi byte fisiknya
+    (None jika region kontigu, lsbs lalu berupa view ke arr)
+    """
+    lo = payload_base + g * m
+    if index is None:
+        view = arr[lo:lo + count * m].reshape(count, m)
+        return view, None
+    pos = index.physical_array(np.arange(lo, lo + count * m, dtype=np.int64)).reshape(count, m)
+    return arr[pos], pos
+
+def _syndromes(lsbs: np.ndarray) -> np.ndarray:
+    # Sindrom Hamming: XOR dari nomor kolom (1 .. m) yang LSB-nya 1
+    weights = np.arange(1, lsbs.shape[1] + 1, dtype=np.uint16)
+    return np.bitwise_xor.reduce((lsbs & 1) * weights, axis=1)
+
+def _weights(k: int) -> np.ndarray:
+    return (1 << np.arange(k - 1, -1, -1)).astype(np.uint16)
+
+def embed_blocks(arr: np.ndarray, bits: np.ndarray, b0: int, payload_base: int, start: int, capacity: int, k: int,
+                 index=None) -> int:
+    """
+    Menyisipkan bit (panjang kelipatan k) ke blok payload b0, b0 + 1, ...: setiap blok diubah
+    paling banyak satu LSB sehingga sindromnya sama dengan k bit pesan
+
+    Output:
+        jumlah byte cover yang diubah
+    """
+    m = block_size(k)
+    values = bits.reshape(-1, k) @ _weights(k)
+    changed = 0
+    for j, g, count in _block_runs(b0, len(values), start, capacity, m):
+        lsbs, pos = _block_lsbs(arr, g, count, payload_base, m, index)
+        flip = _syndromes(lsbs) ^ values[j:j + count]
+        rows = np.flatnonzero(flip)
+        cols = flip[rows].astype(np.int64) - 1
+        if pos is None:
+            lsbs[rows, cols] ^= 1
+        else:
+            arr[pos[rows, cols]] ^= 1
+        changed += len(rows)
+    return changed
+
+def extract_blocks(arr: np.ndarray, b0: int, n_blocks: int, payload_base: int, start: int, capacity: int,
+                   k: int, index=None) -> np.ndarray:
+    """
+    Bit pesan (k per blok, MSB dulu) dari blok payload b0 .. b0 + n_blocks - 1
+    """
+    m = block_size(k)
+    bits = np.empty((n_blocks, k), dtype=np.uint8)
+    shifts = np.arange(k - 1, -1, -1, dtype=np.uint16)
+    for j, g, count in _block_runs(b0, n_blocks, start, capacity, m):
+        lsbs, _ = _block_lsbs(arr, g, count, payload_base, m, index)
+        bits[j:j + count] = (_syndromes(lsbs)[:, None] >> shifts) & 1
+    return bits.ravel()
+
+def matrix_embed(stego, payload: bytes, payload_base: int, start: int, capacity: int, k: int, index=None,
+                 j0: int = 0) -> int:
+    """
+    Menyisipkan bit payload (MSB dulu) dengan matrix embedding kode Hamming [2^k - 1, 2^k - 1 - k]:
+    k bit per blok 2^k - 1 byte cover, paling banyak satu LSB berubah per blok
+
+    Args:
+        stego (bytearray | mmap | np.ndarray): buffer stego yang writable
+        payload (bytes): data yang disisipkan
+        payload_base (int): index byte (logis jika index diisi) awal region payload
+        start (int): blok awal payload (random start)
+        capacity (int): kapasitas region dalam blok (wrap-around)
+        k (int): jumlah bit pesan per blok
+        index (UsableIndex | None): pemetaan byte logis -> fisik untuk mode frame-aware
+        j0 (int): index bit payload untuk bit pertama data (menyisipkan sebagian payload)
+
+    Output:
+        jumlah byte cover yang diubah
+    """
+    arr = as_array(stego)
+    n_bits = len(payload) * 8
+    if n_bits == 0:
+        return 0
+    b0, b1 = j0 // k, -(-(j0 + n_bits) // k)
+    lead = j0 - b0 * k
+    if lead or (j0 + n_bits) % k:
+        # Blok di tepi rentang juga memuat bit di luar rentang: bit lama dipertahankan
+        bits = extract_blocks(arr, b0, b1 - b0, payload_base, start, capacity, k, index)
+    else:
+        bits = np.empty((b1 - b0) * k, dtype=np.uint8)
+    bits[lead:lead + n_bits] = np.unpackbits(as_array(payload))
+    return embed_blocks(arr, bits, b0, payload_base, start, capacity, k, index)
+
+def matrix_extract(stego, j0: int, n_bits: int, payload_base: int, start: int, capacity: int, k: int,
+                   index=None) -> bytes:
+    """
+    Mengambil bit payload j0 .. j0 + n_bits - 1 (kebalikan matrix_embed); hanya blok yang memuat
+    rentang tersebut yang dibaca
+
+    Output:
+        bit-bit payload dalam bytes (bit terakhir dipadding 0)
+    """
+    if n_bits == 0:
+        return b''
+    b0, b1 = j0 // k, -(-(j0 + n_bits) // k)
+    bits = extract_blocks(as_array(stego), b0, b1 - b0, payload_base, start, capacity, k, index)
+    lead = j0 - b0 * k
+    return np.packbits(bits[lead:lead + n_bits]).tobytes()
@@ -1,8 +1,130 @@
 import math
+import mmap
+
+import numpy as np
+
+MAX = 255.0  # range maksimum 1 byte
+CHUNK_SIZE = 1 << 22
+
+def psnr_from_mse(mse: float) -> float:
+    """
+    PSNR (dB) dari MSE per byte; inf jika identik
+    """
+    return float('inf') if mse == 0 else 10 * math.log10((MAX ** 2) / mse)
+
+def open_readonly(path: str):
+    """
+    mmap read-only dari path (bytes kosong untuk berkas 0 byte yang tidak bisa di-mmap)
+    """
+    with open(path, 'rb') as f:
+        if f.seek(0, 2) == 0:
+            return b''
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def payload_ratios(stego_name: str, bytes_changed: int, bits_flipped: int) -> dict:
+    """
+    Rasio distorsi terhadap ukuran payload dari header stego: bit payload per bit yang berubah
+    (efisiensi penyisipan) dan byte berubah per KB payload. None jika header tidak terbaca
+    """
+    # Probe memuat modul stego (cukup berat), dimuat hanya saat dibandingkan
+    from Probe import probe
+    try:
+        payload_bytes = probe(stego_name)["content_bytes"]
+    except (OSError, ValueError):
+        return {"payload_bytes": None, "bits_per_change": None, "changes_per_kb": None}
+    return {
+        "payload_bytes": payload_bytes,
+        "bits_per_change": payload_bytes * 8 / bits_flipped if bits_flipped else None,
+        "changes_per_kb": bytes_changed * 1024 / payload_bytes if payload_bytes else None,
+    }
+
+def compare_files(original_name: str, stego_name: str, chunk_size: int = CHUNK_SIZE, ratios: bool = False) -> dict:
+    """
+    Menghitung metrik distorsi antar dua berkas per chunk (memori konstan, lewat mmap).
+    Panjang disamakan ke berkas yang lebih pendek seperti calculate_psnr_mp3
+    
+    Args:
+        original_name (str): path berkas asli
+        stego_name (str): path berkas stego
+        chunk_size (int): ukuran chunk dalam byte
+        ratios (bool): baca juga header stego untuk rasio payload_ratios (opsional)
+        
+    Output:
+        dict berisi bytes (jumlah byte dibandingkan), mse, psnr, bytes_changed,
+        bits_flipped (list per plane bit 0 = LSB s.d. 7 = MSB), max_delta, dan rasio payload_ratios jika ratios
+    """
+    data_orig = open_readonly(original_name)
+    data_stego = open_readonly(stego_name)
+    try:
+        N = min(len(data_orig), len(data_stego))
+        if N == 0:
+            raise ValueError("Berkas kosong, PSNR tidak dapat dihitung.")
+        sq_sum = 0
+        bytes_changed = 0
+        max_delta = 0
+        bits_flipped = [0] * 8
+        for c0 in range(0, N, chunk_size):
+            c1 = min(c0 + chunk_size, N)
+            a = np.frombuffer(data_orig, dtype=np.uint8, count=c1 - c0, offset=c0)
+            b = np.frombuffer(data_stego, dtype=np.uint8, count=c1 - c0, offset=c0)
+            delta = a.astype(np.int64) - b
+            sq_sum += int(np.dot(delta, delta))
+            changed = a != b
+            bytes_changed += int(np.count_nonzero(changed))
+            if bytes_changed:
+                max_delta = max(max_delta, int(np.abs(delta).max()))
+            xor = a ^ b
+            for p in range(8):
+                bits_flipped[p] += int(np.count_nonzero(xor & (1 << p)))
+            del a, b
+    finally:
+        for data in (data_orig, data_stego):
+            if isinstance(data, mmap.mmap):
+                data.close()
+
+    mse = sq_sum / N
+    result = {
+        "original": original_name,
+        "stego": stego_name,
+        "bytes": N,
+        "mse": mse,
+        "psnr": psnr_from_mse(mse),
+        "bytes_changed": bytes_changed,
+        "bits_flipped": bits_flipped,
+        "max_delta": max_delta,
+    }
+    if ratios:
+        result.update(payload_ratios(stego_name, bytes_changed, sum(bits_flipped)))
+    return result
+
+def _compare_pair(pair: tuple[str, str], ratios: bool = False) -> dict:
+    try:
+        return compare_files(*pair, ratios=ratios)
+    except Exception as e:
+        return {"original": pair[0], "stego": pair[1], "error": str(e)}
+
+def compare_many(pairs: list[tuple[str, str]], workers: int | None = None, ratios: bool = False) -> list[dict]:
+    """
+    Menghitung metrik banyak pasangan (asli, stego) secara paralel
+    
+    Args:
+        pairs (list[tuple[str, str]]): daftar pasangan path
+        workers (int | None): jumlah proses (None = jumlah CPU, 1 = tanpa pool)
+        ratios (bool): sertakan rasio payload dari header stego (lihat payload_ratios)
+        
+    Output:
+        list metrik sesuai urutan pasangan (berisi key error jika gagal)
+    """
+    if workers == 1 or len(pairs) <= 1:
+        return [_compare_pair(pair, ratios) for pair in pairs]
+    # Modul multiprocessing cukup berat, dimuat hanya jika benar-benar paralel
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_compare_pair, pairs, [ratios] * len(pairs)))
 
 def calculate_psnr_mp3(original_name: str, stego_name: str) -> float:
     """
-    Menghitung PSNR antar dua file MP3 berdasarkan bit biner (tanpa dependency).
+    Menghitung PSNR antar dua file MP3 berdasarkan bit biner.
     File diambil dari folder 'sound/'.
     """
     # folder = "sound"
@@ -11,26 +133,14 @@ def calculate_psnr_mp3(original_name: str, stego_name: str) -> float:
 
     path_orig = original_name
     path_stego = stego_name
-    # --- Baca file sebagai byte ---
-    with open(path_orig, "rb") as f:
-        data_orig = f.read()
-    with open(path_stego, "rb") as f:
-        data_stego = f.read()
-
-    # --- Samakan panjang (truncate ke file yang lebih pendek) ---
-    N = min(len(data_orig), len(data_stego))
-    data_orig = data_orig[:N]
-    data_stego = data_stego[:N]
-
-    # --- Hitung Mean Squared Error (MSE) antar byte ---
-    mse = sum((a - b) ** 2 for a, b in zip(data_orig, data_stego)) / N
+    metrics = compare_files(path_orig, path_stego)
+    mse = metrics["mse"]
     if mse == 0:
         print("✅ File identik, PSNR tak terhingga (∞)")
         return float('inf')
 
     # --- Hitung PSNR ---
-    MAX = 255.0  # range maksimum 1 byte
-    psnr = 10 * math.log10((MAX ** 2) / mse)
+    psnr = metrics["psnr"]
 
     print(f"✅ PSNR antara {original_name} dan {stego_name}: {psnr:.2f} dB")
     if psnr < 30:
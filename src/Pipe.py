@@ -0,0 +1,215 @@
+import numpy as np
+
+from Checksum import CHECKSUM_SAMPLE, PayloadChecksum, verify_crc, verify_prefix, verify_stego_prefix
+from Compression import Decompressor
+from FileProcessor import write_plain
+from LSBEngine import extract_payload
+from Profiler import current_stage, profiled, stage
+from Sisip import (MAX_HEADER_LEN, OPT_CHECKSUM, OPT_COMPRESSED, OPT_CONTAINER, OPT_FRAME_AWARE,
+                   OPT_MATRIX, OPT_RANDOM_START, OPT_SCATTER, build_header, decode_header, embed_into, find_audio_start,
+                   locate_payload, payload_layout, read_payload)
+from Stream import DEFAULT_CHUNK_SIZE, apply_vigenere, embed_chunk
+from Vigenere import decrypt_bytes
+
+# Mode yang butuh seluruh berkas sekaligus (posisi payload bergantung ukuran berkas atau indeks frame);
+# pada mode ini input pipe dibaca utuh ke memori
+BUFFERED_OPTIONS = OPT_RANDOM_START | OPT_SCATTER | OPT_FRAME_AWARE | OPT_MATRIX
+
+class PipeReader:
+    """
+    Pembaca input sekuensial (stdin) dengan buffer terbatas: hanya byte yang belum diproses yang disimpan
+    """
+
+    def __init__(self, f, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = bytearray()
+        self.eof = False
+
+    def fill(self, n: int) -> bool:
+        """
+        Membaca sampai buffer berisi minimal n byte; False jika input habis lebih dulu
+        """
+        while len(self.buf) < n and not self.eof:
+            block = self.f.read(max(self.chunk_size, n - len(self.buf)))
+            if not block:
+                self.eof = True
+            self.buf += block
+        return len(self.buf) >= n
+
+    def take(self, n: int) -> bytearray:
+        """
+        Mengambil hingga n byte dari depan buffer
+        """
+        self.fill(n)
+        out = self.buf[:n]
+        del self.buf[:n]
+        return out
+
+    def rest(self) -> bytearray:
+        """
+        Seluruh sisa input
+        """
+        while not self.eof:
+            self.fill(len(self.buf) + self.chunk_size)
+        out, self.buf = self.buf, bytearray()
+        return out
+
+def scan_pipe_start(reader: PipeReader) -> int:
+    """
+    Mencari awal audio (sama dengan find_audio_start) tanpa seek: input dibaca per chunk
+    dan ditahan di buffer hingga sync word ditemukan
+    """
+    checked = 0
+    while True:
+        # Sisakan 1 byte sebelumnya agar sync word di perbatasan chunk tetap terdeteksi
+        lo = max(0, checked - 1)
+        idx = find_audio_start(memoryview(reader.buf)[lo:])
+        if idx:
+            return lo + idx
+        checked = len(reader.buf)
+        if reader.eof:
+            return 0
+        reader.fill(checked + reader.chunk_size)
+
+@profiled("embed_pipe")
+def embed_pipe(fin, fout, payload: dict, random_seed: str | None = None, n_lsb: int = 1,
+               frame_aware: bool = False, options: int = 0, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+    """
+    Menyisipkan payload ke cover yang dibaca dari fin (misalnya sys.stdin.buffer) dan menulis stego
+    ke fout (sys.stdout.buffer). Tanpa seed, scatter, dan frame-aware, cover diproses per chunk dengan
+    memori terbatas; selain itu (termasuk matrix) cover dibaca utuh ke memori. Hasilnya identik dengan Sisip.embed
+
+    Args:
+        fin (BinaryIO): sumber cover mp3 (tidak perlu dapat di-seek)
+        fout (BinaryIO): tujuan stego mp3
+        payload (dict): hasil FileProcessor.secret_payload / read_secret_payload
+        random_seed (str | None): seed untuk random start atau kunci scatter (opsional)
+        n_lsb (int): jumlah LSB yang digunakan (1 - 4)
+        frame_aware (bool): hanya menyisipkan ke main data frame MP3
+        options (int): bit options tambahan pada header, contoh OPT_SCATTER atau OPT_MATRIX
+        chunk_size (int): ukuran chunk baca/tulis
+
+    Catatan: pada mode per chunk, keluaran ditahan sampai byte cover yang dibutuhkan payload terbaca,
+    sehingga cover yang terlalu kecil menghasilkan ValueError sebelum ada byte stego yang tertulis
+    """
+    assert 1 <= n_lsb <= 4, "n_lsb must be between 1 and 4"
+    options |= payload["options"]
+    reader = PipeReader(fin, chunk_size)
+    if random_seed is not None or frame_aware or options & BUFFERED_OPTIONS:
+        with stage("read"):
+            stego = reader.rest()
+        embed_into(stego, payload["data"], payload["ext"], random_seed, n_lsb, frame_aware, options,
+                   payload["checksum"])
+        fout.write(stego)
+        return
+
+    if payload["checksum"] is not None:
+        options |= OPT_CHECKSUM
+    content_size_bits = len(payload["data"]) * 8
+    header = np.frombuffer(build_header(n_lsb, payload["ext"], options, content_size_bits, payload["checksum"]),
+                           dtype=np.uint8)
+    header_len = len(header) * 8
+    src = np.frombuffer(payload["data"], dtype=np.uint8)
+
+    with stage("audio_start"):
+        audio_start_idx = scan_pipe_start(reader)
+    if not reader.buf:
+        raise ValueError("Cover contains no data bytes.")
+    # Kapasitas diperiksa sebelum menulis: byte yang dibutuhkan terbatas ukuran payload yang sudah di memori
+    if not reader.fill(audio_start_idx + header_len + max(1, -(-content_size_bits // n_lsb))):
+        payload_layout(len(reader.buf), audio_start_idx, header_len, content_size_bits, n_lsb)
+    # Tanpa random start payload berurutan dari offset 0 sehingga tidak butuh ukuran berkas
+    runs = [(lambda offset, length: header[offset:offset + length], 0, 0, header_len, audio_start_idx, 1),
+            (lambda offset, length: src[offset:offset + length], 0, 0, content_size_bits,
+             audio_start_idx + header_len, n_lsb)]
+    c0 = 0
+    while True:
+        chunk = reader.take(chunk_size)
+        if not chunk:
+            break
+        embed_chunk(chunk, c0, runs)
+        fout.write(chunk)
+        c0 += len(chunk)
+    current_stage().add(bytes=c0, bits=content_size_bits)
+
+@profiled("extract_pipe")
+def extract_pipe(fin, fout, random_seed: str | None = None, key: str | None = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> dict:
+    """
+    Mengekstrak berkas rahasia dari stego yang dibaca dari fin dan menulisnya ke fout.
+    Payload tanpa random start/scatter/frame-aware diproses per chunk: sampel awal diverifikasi
+    (checksum) sebelum ada byte keluaran, lalu byte stego dibuang setelah diproses
+
+    Args:
+        fin (BinaryIO): sumber stego mp3 (tidak perlu dapat di-seek)
+        fout (BinaryIO): tujuan berkas rahasia
+        random_seed (str | None): seed yang dipakai saat penyisipan (opsional)
+        key (str | None): kunci dekripsi vigenere (opsional)
+        chunk_size (int): ukuran chunk baca
+
+    Output:
+        dict header stego (ext berisi ekstensi berkas rahasia)
+    """
+    reader = PipeReader(fin, chunk_size)
+    with stage("read_header"):
+        audio_start_idx = scan_pipe_start(reader)
+        reader.fill(audio_start_idx + MAX_HEADER_LEN)
+        try:
+            header = decode_header(memoryview(reader.buf)[audio_start_idx:], audio_start_idx)
+        except ValueError:
+            header = None
+    if header is None or header["options"] & BUFFERED_OPTIONS:
+        return extract_buffered(reader.rest(), fout, random_seed, key)
+    if header["options"] & OPT_CONTAINER:
+        raise ValueError("Stego berisi container, gunakan Cli.py unpack.")
+
+    n_lsb = header["n_lsb"]
+    content_size = header["content_size"]
+    key_bytes = key.encode("utf-8") if key else None
+    reader.take(audio_start_idx + header["header_len"])
+    current_stage().add(bytes=(content_size + 7) // 8, bits=content_size)
+
+    decompressor = Decompressor(header["options"]) if header["options"] & OPT_COMPRESSED else None
+    crc = PayloadChecksum() if header["crc32"] is not None else None
+    # Setiap 8 byte cover memuat tepat n_lsb byte payload; langkah pertama mencakup sampel checksum
+    first = -(-min(CHECKSUM_SAMPLE * 8, content_size) // n_lsb)
+    step = max(8, chunk_size // 8 * 8)
+    done = 0
+    while done < content_size:
+        size = first + -first % 8 if done == 0 else step
+        cover = reader.take(size)
+        n_bits = min(size * n_lsb, content_size - done)
+        if len(cover) * n_lsb < n_bits:
+            raise ValueError("Stego terpotong: payload tidak lengkap.")
+        data = extract_payload(cover, n_bits, 0, 0, len(cover) * n_lsb, n_lsb)
+        if done == 0 and crc:
+            verify_prefix(data[:CHECKSUM_SAMPLE], header, key)
+        data = apply_vigenere(data, key_bytes, done >> 3, decrypt=True)
+        if crc:
+            crc.update(data)
+        fout.write(decompressor.update(data) if decompressor else data)
+        done += n_bits
+    if crc:
+        verify_crc(crc.crc, header["crc32"])
+    if decompressor:
+        fout.write(decompressor.finish())
+    return header
+
+def extract_buffered(stego: bytearray, fout, random_seed: str | None = None, key: str | None = None) -> dict:
+    """
+    Ekstraksi dari seluruh isi stego di memori (mode random start, scatter, dan frame-aware)
+    """
+    layout = locate_payload(stego, random_seed)
+    if layout["options"] & OPT_CONTAINER:
+        raise ValueError("Stego berisi container, gunakan Cli.py unpack.")
+    verify_stego_prefix(stego, layout, key)
+    data = read_payload(stego, layout)
+    if key:
+        data = decrypt_bytes(data, key)
+    if layout["crc32"] is not None:
+        checksum = PayloadChecksum()
+        checksum.update(data)
+        verify_crc(checksum.crc, layout["crc32"])
+    write_plain(fout, data, layout["options"])
+    return layout
@@ -0,0 +1,168 @@
+from array import array
+from bisect import bisect_right
+
+import numpy as np
+
+from FrameParser import index_frames
+from LSBEngine import as_array, embed_run, extract_run, partition, run_tasks
+
+def capacity_bits(usable_bytes: int, n_lsb: int, header_len: int = 0) -> int:
+    """
+    Kapasitas payload dalam bit pada region usable_bytes byte setelah header (1 LSB per byte) disisihkan
+    """
+    return max(0, (usable_bytes - header_len) * n_lsb)
+
+def bits_fit(usable_bytes: int, n_lsb: int, start_offset_bit: int, header_len: int = 0) -> int:
+    """
+    Banyak bit yang muat berurutan mulai dari offset bit r di ruang payload sebelum terjadi wrap-around
+    """
+    return max(0, capacity_bits(usable_bytes, n_lsb, header_len) - start_offset_bit)
+
+class UsableIndex:
+    """
+    Indeks ringkas run byte cover yang boleh disisipi (main data tiap frame MP3,
+    tanpa header frame dan side information). Byte-byte usable dinomori ulang
+    secara logis 0..len-1; pemetaan logis -> fisik memakai binary search O(log runs)
+    """
+
+    def __init__(self, starts, lengths):
+        # 64 bit: posisi fisik pada cover >= 4 GiB (mode streaming/mmap) tidak boleh overflow
+        self.starts = array('Q', starts)
+        self.lengths = array('Q', lengths)
+        # Index logis awal setiap run (prefix sum panjang run)
+        self.offsets = array('Q', [0] * len(self.lengths))
+        total = 0
+        for r, length in enumerate(self.lengths):
+            self.offsets[r] = total
+            total += length
+        self.total = total
+
+    @classmethod
+    def from_frames(cls, frames) -> "UsableIndex":
+        """
+        Membangun indeks dari hasil FrameParser.index_frames
+        """
+        return cls((f.main_data_start for f in frames), (f.end - f.main_data_start for f in frames))
+
+    @classmethod
+    def from_data(cls, data) -> "UsableIndex":
+        """
+        Membangun indeks langsung dari isi berkas mp3 (bytes | bytearray | mmap)
+        """
+        return cls.from_frames(index_frames(data))
+
+    def __len__(self) -> int:
+        return self.total
+
+    def physical(self, logical: int) -> int:
+        """
+        Memetakan index byte logis ke index byte fisik pada berkas (binary search, O(log runs))
+        """
+        if not 0 <= logical < self.total:
+            raise IndexError("Index logis di luar region usable.")
+        r = bisect_right(self.offsets, logical) - 1
+        return self.starts[r] + (logical - self.offsets[r])
+
+    def physical_array(self, logical: np.ndarray) -> np.ndarray:
+        """
+        Versi vektor physical: memetakan array index byte logis (int64) ke index fisik
+        """
+        offsets = np.frombuffer(self.offsets, dtype=np.uint64).astype(np.int64)
+        starts = np.frombuffer(self.starts, dtype=np.uint64).astype(np.int64)
+        r = np.searchsorted(offsets, logical, side='right') - 1
+        return starts[r] + (logical - offsets[r])
+
+    def bit_position(self, logical_bit: int, n_lsb: int, logical_base: int = 0) -> tuple[int, int]:
+        """
+        Memetakan bit ke-logical_bit di ruang payload ke (index byte fisik, posisi LSB)
+        """
+        return self.physical(logical_base + logical_bit // n_lsb), logical_bit % n_lsb
+
+    def capacity_bits(self, n_lsb: int, header_len: int = 0) -> int:
+        """
+        Kapasitas payload dalam bit setelah header (1 LSB per byte) disisihkan
+        """
+        return capacity_bits(self.total, n_lsb, header_len)
+
+    def bits_fit(self, n_lsb: int, start_offset_bit: int, header_len: int = 0) -> int:
+        """
+        Banyak bit yang muat berurutan mulai dari offset r di ruang payload sebelum terjadi wrap-around
+        """
+        return bits_fit(self.total, n_lsb, start_offset_bit, header_len)
+
+    def pieces(self, lo: int, hi: int):
+        """
+        Memecah rentang byte logis [lo, hi) menjadi potongan fisik yang kontigu
+
+        Output:
+            generator (index logis awal, index fisik awal, panjang)
+        """
+        r = max(bisect_right(self.offsets, lo) - 1, 0)
+        while r < len(self.starts) and self.offsets[r] < hi:
+            a = max(lo, self.offsets[r])
+            b = min(hi, self.offsets[r] + self.lengths[r])
+            if a < b:
+                yield a, self.starts[r] + (a - self.offsets[r]), b - a
+            r += 1
+
+    def gather(self, data, lo: int, hi: int) -> bytes:
+        """
+        Mengambil byte logis [lo, hi) dari data fisik sebagai bytes kontigu
+        """
+        arr = as_array(data)
+        return b''.join(arr[p:p + length].tobytes() for _, p, length in self.pieces(lo, hi))
+
+    def mapped_runs(self, j: int, g: int, length: int, logical_base: int, n_lsb: int):
+        """
+        Memecah satu potongan payload kontigu (bit j.., posisi g..) menurut run fisik
+
+        Output:
+            generator (j, g, panjang, payload_base fisik) untuk embed_run/extract_run
+        """
+        lo = logical_base + g // n_lsb
+        hi = logical_base + (g + length - 1) // n_lsb + 1
+        for a, p, count in self.pieces(lo, hi):
+            g_lo = max(g, (a - logical_base) * n_lsb)
+            g_hi = min(g + length, (a + count - logical_base) * n_lsb)
+            yield j + (g_lo - g), g_lo, g_hi - g_lo, logical_base + p - a
+
+def embed_payload_mapped(index: UsableIndex, stego, payload: bytes, logical_base: int, start_offset_bit: int,
+                         capacity: int, n_lsb: int) -> None:
+    """
+    Seperti LSBEngine.embed_payload, tetapi hanya menyentuh byte-byte usable
+    (melompati header frame dan side info). Posisi dihitung di ruang byte logis
+
+    Args:
+        index (UsableIndex): indeks region usable
+        stego (bytearray | mmap | np.ndarray): buffer stego yang writable
+        payload (bytes): data yang disisipkan
+        logical_base (int): index byte logis awal region payload
+        start_offset_bit (int): offset bit awal payload
+        capacity (int): kapasitas payload dalam bit (wrap-around)
+        n_lsb (int): jumlah LSB yang digunakan
+    """
+    arr = as_array(stego)
+    src = as_array(payload)
+
+    def embed_part(runs: list[tuple[int, int, int]]) -> None:
+        for j, g, length in runs:
+            for run in index.mapped_runs(j, g, length, logical_base, n_lsb):
+                embed_run(arr, src, *run, n_lsb)
+
+    run_tasks(embed_part, [(runs,) for runs in partition(len(src) * 8, start_offset_bit, capacity, n_lsb)])
+
+def extract_payload_mapped(index: UsableIndex, stego, n_bits: int, logical_base: int, start_offset_bit: int,
+                           capacity: int, n_lsb: int) -> bytes:
+    """
+    Kebalikan embed_payload_mapped
+    """
+    arr = as_array(stego)
+    bits = np.zeros(n_bits, dtype=np.uint8)
+
+    def extract_part(runs: list[tuple[int, int, int]]) -> None:
+        for j, g, length in runs:
+            for run in index.mapped_runs(j, g, length, logical_base, n_lsb):
+                extract_run(arr, bits, *run, n_lsb)
+
+    run_tasks(extract_part, [(runs,) for runs in partition(n_bits, start_offset_bit, capacity, n_lsb)])
+    return np.packbits(bits).tobytes()
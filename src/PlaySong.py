@@ -1,6 +1,9 @@
-import pygame
-
 def play_song(file_path: str):
+    try:
+        import pygame
+    except ImportError:
+        print("Pemutaran lagu membutuhkan pygame (pip install pygame).")
+        return
     try:
         pygame.mixer.init()
         pygame.mixer.music.load(file_path)
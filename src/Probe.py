@@ -0,0 +1,112 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from FrameParser import id3v2_length, index_frames
+from Planner import UsableIndex
+from Sisip import (MAX_HEADER_LEN, OPT_CHECKSUM, OPT_COMPRESSED, OPT_CONTAINER, OPT_FRAME_AWARE, OPT_LZMA,
+                   OPT_MATRIX, OPT_RANDOM_START, OPT_SCATTER, decode_header)
+from Stream import read_at, scan_audio_start
+
+# Chunk pembacaan saat mencari awal audio; header lalu dibaca dengan satu seek
+PROBE_CHUNK = 1 << 12
+# Header mode frame-aware berada di main data beberapa frame pertama setelah tag ID3v2
+PROBE_FRAME_WINDOW = 1 << 16
+OPTION_NAMES = (
+    (OPT_FRAME_AWARE, "frame"),
+    (OPT_RANDOM_START, "random"),
+    (OPT_COMPRESSED, "compressed"),
+    (OPT_LZMA, "lzma"),
+    (OPT_CHECKSUM, "checksum"),
+    (OPT_CONTAINER, "container"),
+    (OPT_SCATTER, "scatter"),
+    (OPT_MATRIX, "matrix"),
+)
+
+def option_names(options: int) -> list[str]:
+    """
+    Nama bit options yang aktif pada header, contoh ["random", "checksum"]
+    """
+    return [name for bit, name in OPTION_NAMES if options & bit]
+
+def read_frame_aware_header(f) -> dict:
+    """
+    Membaca header mode frame-aware dari main data frame pertama (hanya PROBE_FRAME_WINDOW byte)
+    """
+    id3_end = id3v2_length(read_at(f, 0, 10))
+    window = read_at(f, id3_end, PROBE_FRAME_WINDOW)
+    index = UsableIndex.from_frames(index_frames(window))
+    header = decode_header(index.gather(window, 0, min(len(index), MAX_HEADER_LEN)), 0)
+    if not header["options"] & OPT_FRAME_AWARE:
+        raise ValueError("Header frame-aware tidak ditemukan.")
+    return header
+
+def probe(path: str) -> dict:
+    """
+    Membaca metadata header stego tanpa menyentuh payload: hanya beberapa KB awal
+    untuk mencari awal audio, lalu satu seek untuk header
+
+    Args:
+        path (str): path berkas mp3
+
+    Output:
+        dict berisi path, n_lsb, ext, content_bytes, options, flags, audio_start, header_bits
+    """
+    with open(path, 'rb') as f:
+        audio_start_idx = scan_audio_start(f, PROBE_CHUNK)
+        try:
+            header = decode_header(read_at(f, audio_start_idx, MAX_HEADER_LEN), audio_start_idx)
+        except ValueError as err:
+            try:
+                header = read_frame_aware_header(f)
+            except ValueError:
+                raise err
+
+    return {
+        "path": path,
+        "n_lsb": header["n_lsb"],
+        "ext": header["ext"],
+        "content_bytes": header["content_size"] // 8,
+        "options": header["options"],
+        "flags": ','.join(option_names(header["options"])),
+        "audio_start": header["audio_start"],
+        "header_bits": header["header_len"],
+    }
+
+def _probe_path(path: str) -> dict:
+    try:
+        return probe(path)
+    except Exception as e:
+        return {"path": path, "error": str(e)}
+
+def collect_mp3(paths: list[str], recursive: bool = False) -> list[str]:
+    """
+    Mengumpulkan berkas .mp3 dari daftar path berkas/folder (urut nama)
+    """
+    found = []
+    for path in paths:
+        if not os.path.isdir(path):
+            found.append(path)
+            continue
+        if recursive:
+            for root, _, files in os.walk(path):
+                found += [os.path.join(root, name) for name in files if name.lower().endswith('.mp3')]
+        else:
+            with os.scandir(path) as entries:
+                found += [e.path for e in entries if e.is_file() and e.name.lower().endswith('.mp3')]
+    return sorted(found)
+
+def probe_many(paths: list[str], workers: int | None = None) -> list[dict]:
+    """
+    Probe banyak berkas secara paralel dengan thread (pekerjaan didominasi I/O seek/baca kecil)
+
+    Args:
+        paths (list[str]): daftar path berkas mp3
+        workers (int | None): jumlah thread (None = bawaan ThreadPoolExecutor, 1 = tanpa pool)
+
+    Output:
+        list hasil sesuai urutan path (berisi key error jika gagal)
+    """
+    if workers == 1 or len(paths) <= 1:
+        return [_probe_path(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_probe_path, paths))
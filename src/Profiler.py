@@ -0,0 +1,228 @@
+import atexit
+import collections
+import functools
+import os
+import threading
+import time
+
+# Jumlah record mentah yang disimpan; record lama dibuang (atau ditulis ke STEGO_PROFILE_OUT lebih dulu),
+# ringkasan per path tetap mencakup seluruh record
+MAX_RECORDS = 10000
+
+class _State:
+    enabled = False
+    memory = False
+    records: collections.deque = collections.deque(maxlen=MAX_RECORDS)
+    summary: dict[str, dict] = {}
+    spill_path: str | None = None
+    listeners: list = []
+    lock = threading.Lock()
+    local = threading.local()
+
+class _NullStage:
+    """
+    Stage kosong saat profiling nonaktif: tidak mengukur apa pun
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+    def add(self, bytes: int = 0, bits: int = 0) -> None:
+        pass
+
+NULL_STAGE = _NullStage()
+
+class _Stage:
+    """
+    Mengukur wall time, byte diproses, bit disisipkan, dan puncak memori satu tahap
+    """
+    __slots__ = ("name", "bytes", "bits", "start", "path", "peak")
+
+    def __init__(self, name: str, bytes: int, bits: int):
+        self.name = name
+        self.bytes = bytes
+        self.bits = bits
+        self.peak = 0
+
+    def __enter__(self):
+        stack = getattr(_State.local, "stack", None)
+        if stack is None:
+            stack = _State.local.stack = []
+        if _State.memory:
+            import tracemalloc
+            # reset_peak menghapus puncak milik tahap induk, simpan dulu ke induk
+            if stack:
+                stack[-1].peak = max(stack[-1].peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        stack.append(self)
+        self.path = "/".join(s.name for s in stack)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        seconds = time.perf_counter() - self.start
+        stack = _State.local.stack
+        stack.pop()
+        peak = None
+        if _State.memory:
+            import tracemalloc
+            peak = self.peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+            if stack:
+                stack[-1].peak = max(stack[-1].peak, peak)
+        record = {
+            "stage": self.name,
+            "path": self.path,
+            "seconds": seconds,
+            "bytes": self.bytes,
+            "bits": self.bits,
+            "peak_memory": peak,
+            "error": exc_type.__name__ if exc_type else None,
+        }
+        spilled = None
+        with _State.lock:
+            if _State.spill_path and len(_State.records) == MAX_RECORDS:
+                spilled = list(_State.records)
+                _State.records.clear()
+            _State.records.append(record)
+            _aggregate(record)
+        if spilled:
+            _append_json_lines(_State.spill_path, spilled)
+        for listener in _State.listeners:
+            listener(record)
+        return False
+
+    def add(self, bytes: int = 0, bits: int = 0) -> None:
+        self.bytes += bytes
+        self.bits += bits
+
+def _aggregate(record: dict) -> None:
+    s = _State.summary.setdefault(record["path"],
+                                  {"calls": 0, "seconds": 0.0, "bytes": 0, "bits": 0, "peak": None})
+    s["calls"] += 1
+    s["seconds"] += record["seconds"]
+    s["bytes"] += record["bytes"]
+    s["bits"] += record["bits"]
+    if record["peak_memory"] is not None:
+        s["peak"] = max(s["peak"] or 0, record["peak_memory"])
+
+def stage(name: str, bytes: int = 0, bits: int = 0):
+    """
+    Context manager untuk satu tahap. Jika profiling nonaktif mengembalikan NULL_STAGE
+    (hanya satu pengecekan flag, hampir tanpa overhead)
+
+    Args:
+        name (str): nama tahap, contoh "payload_embed"
+        bytes (int): jumlah byte yang diproses (dapat ditambah lewat .add)
+        bits (int): jumlah bit yang disisipkan/diekstrak (dapat ditambah lewat .add)
+    """
+    if not _State.enabled:
+        return NULL_STAGE
+    return _Stage(name, bytes, bits)
+
+def current_stage():
+    """
+    Stage yang sedang aktif di thread ini (NULL_STAGE jika tidak ada/nonaktif),
+    untuk menambahkan jumlah byte/bit dari dalam fungsi
+    """
+    if not _State.enabled:
+        return NULL_STAGE
+    stack = getattr(_State.local, "stack", None)
+    return stack[-1] if stack else NULL_STAGE
+
+def profiled(name: str):
+    """
+    Decorator: menjalankan fungsi di dalam stage bernama name jika profiling aktif
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _State.enabled:
+                return fn(*args, **kwargs)
+            with _Stage(name, 0, 0):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def enable(memory: bool = False, out: str | None = None) -> None:
+    """
+    Mengaktifkan profiling; memory=True juga mencatat puncak memori (tracemalloc, lebih lambat).
+    Jika out diisi, record ditulis (JSON lines) ke path itu setiap MAX_RECORDS record lalu dibuang dari memori
+    """
+    import tracemalloc
+    _State.enabled = True
+    _State.memory = memory
+    _State.spill_path = out
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+def disable() -> None:
+    import tracemalloc
+    _State.enabled = False
+    if _State.memory and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _State.memory = False
+
+def is_enabled() -> bool:
+    return _State.enabled
+
+def add_listener(fn) -> None:
+    """
+    Mendaftarkan callback yang dipanggil dengan dict record setiap tahap selesai
+    """
+    _State.listeners.append(fn)
+
+def remove_listener(fn) -> None:
+    _State.listeners.remove(fn)
+
+def records() -> list[dict]:
+    """
+    Record mentah terakhir (maksimal MAX_RECORDS)
+    """
+    with _State.lock:
+        return list(_State.records)
+
+def reset() -> None:
+    with _State.lock:
+        _State.records.clear()
+        _State.summary.clear()
+
+def _append_json_lines(path_or_file, rows: list[dict]) -> None:
+    import json
+    lines = ''.join(json.dumps(r) + '\n' for r in rows)
+    if isinstance(path_or_file, str):
+        with open(path_or_file, 'a') as f:
+            f.write(lines)
+    else:
+        path_or_file.write(lines)
+
+def write_json_lines(path_or_file) -> None:
+    """
+    Menulis record yang tersimpan sebagai JSON lines ke path atau file object
+    """
+    _append_json_lines(path_or_file, records())
+
+def summary_table() -> str:
+    """
+    Ringkasan per path tahap: jumlah panggilan, total/rata-rata waktu, throughput, puncak memori
+    """
+    with _State.lock:
+        summary = {path: dict(s) for path, s in _State.summary.items()}
+
+    lines = [f"{'stage':<40} {'calls':>5} {'total s':>10} {'avg s':>10} {'MB/s':>9} {'bits':>12} {'peak MB':>8}"]
+    for path, s in summary.items():
+        mbps = s["bytes"] / s["seconds"] / 1e6 if s["seconds"] > 0 and s["bytes"] else 0
+        peak = f"{s['peak'] / 1e6:.1f}" if s["peak"] is not None else "-"
+        lines.append(f"{path:<40} {s['calls']:>5} {s['seconds']:>10.6f} {s['seconds'] / s['calls']:>10.6f} "
+                     f"{mbps:>9.1f} {s['bits']:>12} {peak:>8}")
+    return '\n'.join(lines)
+
+# Opt-in lewat environment: STEGO_PROFILE=1 (STEGO_PROFILE=memory untuk puncak memori),
+# STEGO_PROFILE_OUT=path untuk menulis JSON lines (setiap MAX_RECORDS record dan saat proses selesai)
+if os.environ.get("STEGO_PROFILE"):
+    enable(memory=os.environ["STEGO_PROFILE"] == "memory", out=os.environ.get("STEGO_PROFILE_OUT"))
+    if os.environ.get("STEGO_PROFILE_OUT"):
+        atexit.register(lambda: write_json_lines(os.environ["STEGO_PROFILE_OUT"]))
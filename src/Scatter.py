@@ -0,0 +1,109 @@
+import numpy as np
+
+from LSBEngine import as_array
+
+# Jumlah bit payload per batch indeks (membatasi memori sementara array posisi uint64)
+SCATTER_CHUNK_BITS = 1 << 20
+SCATTER_ROUNDS = 4
+_MIX1 = np.uint64(0x9E3779B97F4A7C15)
+_MIX2 = np.uint64(0xBF58476D1CE4E5B9)
+
+class ScatterPermutation:
+    """
+    Permutasi berkunci atas [0, capacity): jaringan Feistel tak seimbang 4 ronde pada domain
+    2^bits (domain < 2 x capacity) dengan cycle walking untuk nilai di luar capacity.
+    Posisi setiap index dihitung langsung (rata-rata < 2 evaluasi Feistel) tanpa menyimpan
+    array acak sebesar capacity, dan seluruh operasi berupa operasi array NumPy
+    """
+
+    def __init__(self, seed: str, capacity: int):
+        if capacity <= 0:
+            raise ValueError("Kapasitas scatter harus positif.")
+        bits = max(2, (capacity - 1).bit_length())
+        self.capacity = capacity
+        # Lebar bagian kiri/kanan; bertukar setiap ronde, kembali semula setelah jumlah ronde genap
+        self.widths = (bits // 2, bits - bits // 2)
+        import hashlib
+        digest = hashlib.sha256(b"stego-scatter:" + seed.encode("utf-8")).digest()
+        self.keys = [np.uint64(k) for k in np.frombuffer(digest, dtype='>u8')][:SCATTER_ROUNDS]
+
+    def _feistel(self, x: np.ndarray) -> np.ndarray:
+        wl, wr = self.widths
+        left = x >> np.uint64(wr)
+        right = x & np.uint64((1 << wr) - 1)
+        for key in self.keys:
+            # Fungsi ronde: pencampur gaya splitmix64 atas bagian kanan dan kunci ronde
+            z = right + key
+            z *= _MIX1
+            z ^= z >> np.uint64(31)
+            z *= _MIX2
+            z ^= z >> np.uint64(29)
+            z &= np.uint64((1 << wl) - 1)
+            z ^= left
+            left, right = right, z
+            wl, wr = wr, wl
+        left <<= np.uint64(wr)
+        left |= right
+        return left
+
+    def positions(self, j: np.ndarray) -> np.ndarray:
+        """
+        Posisi bit di ruang payload untuk index bit payload j (array), hasil uint64
+        """
+        y = self._feistel(np.asarray(j, dtype=np.uint64))
+        walk = np.flatnonzero(y >= self.capacity)
+        while walk.size:
+            y[walk] = self._feistel(y[walk])
+            walk = walk[y[walk] >= self.capacity]
+        return y
+
+def _byte_positions(g: np.ndarray, payload_base: int, n_lsb: int, index=None) -> np.ndarray:
+    logical = (g // np.uint64(n_lsb)).astype(np.int64) + payload_base
+    return logical if index is None else index.physical_array(logical)
+
+def scatter_embed(stego, payload: bytes, payload_base: int, perm: ScatterPermutation, n_lsb: int,
+                  index=None, j0: int = 0) -> None:
+    """
+    Menyisipkan bit payload (MSB dulu) ke posisi acak berkunci: bit ke-j masuk ke posisi
+    g = perm(j), yaitu byte payload_base + g // n_lsb pada LSB ke-(g % n_lsb)
+
+    Args:
+        stego (bytearray | mmap | np.ndarray): buffer stego yang writable
+        payload (bytes): data yang disisipkan
+        payload_base (int): index byte (logis jika index diisi) awal region payload
+        perm (ScatterPermutation): permutasi atas kapasitas payload
+        n_lsb (int): jumlah LSB yang digunakan
+        index (UsableIndex | None): pemetaan byte logis -> fisik untuk mode frame-aware
+        j0 (int): index bit payload untuk bit pertama data (menyisipkan sebagian payload)
+    """
+    arr = as_array(stego)
+    src = as_array(payload)
+    n_bits = len(src) * 8
+    for k0 in range(0, n_bits, SCATTER_CHUNK_BITS):
+        k1 = min(k0 + SCATTER_CHUNK_BITS, n_bits)
+        values = np.unpackbits(src[k0 >> 3:(k1 + 7) >> 3])[:k1 - k0]
+        g = perm.positions(np.arange(j0 + k0, j0 + k1, dtype=np.uint64))
+        byte_idx = _byte_positions(g, payload_base, n_lsb, index)
+        plane = (g % np.uint64(n_lsb)).astype(np.uint8)
+        # Per bit-plane index byte unik, sehingga assignment fancy-index tidak saling menimpa
+        for b in range(n_lsb):
+            sel = plane == b
+            idx = byte_idx[sel]
+            arr[idx] = (arr[idx] & np.uint8(0xFF ^ (1 << b))) | (values[sel] << np.uint8(b))
+
+def scatter_extract(stego, j0: int, n_bits: int, payload_base: int, perm: ScatterPermutation, n_lsb: int,
+                    index=None) -> bytes:
+    """
+    Mengambil bit payload j0 .. j0 + n_bits - 1 dari posisi acak berkunci (kebalikan scatter_embed)
+
+    Output:
+        bit-bit payload dalam bytes (bit terakhir dipadding 0)
+    """
+    arr = as_array(stego)
+    bits = np.empty(n_bits, dtype=np.uint8)
+    for k0 in range(0, n_bits, SCATTER_CHUNK_BITS):
+        k1 = min(k0 + SCATTER_CHUNK_BITS, n_bits)
+        g = perm.positions(np.arange(j0 + k0, j0 + k1, dtype=np.uint64))
+        byte_idx = _byte_positions(g, payload_base, n_lsb, index)
+        bits[k0:k1] = (arr[byte_idx] >> (g % np.uint64(n_lsb)).astype(np.uint8)) & 1
+    return np.packbits(bits).tobytes()
@@ -0,0 +1,277 @@
+import asyncio
+import json
+import mmap
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qsl, urlsplit
+
+from Checksum import verify_stego_prefix
+from Compression import COMPRESSION_METHODS
+from FileProcessor import read_secret_payload, write_secret
+from Probe import probe
+from Sisip import OPT_CONTAINER, OPT_MATRIX, OPT_SCATTER, locate_payload, read_payload
+from Stream import embed_mmap
+
+# Ukuran chunk baca body request dan tulis body response; pembacaan berikutnya baru dilakukan
+# setelah chunk sebelumnya tertulis ke disk (backpressure lewat flow control TCP)
+IO_CHUNK = 1 << 16
+MAX_BODY = 1 << 30
+MAX_HEADER_LINES = 100
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 411: "Length Required",
+           413: "Payload Too Large", 422: "Unprocessable Entity", 500: "Internal Server Error",
+           503: "Service Unavailable"}
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+def embed_job(cover_path: str, secret_path: str, output_path: str, params: dict) -> None:
+    """
+    Penyisipan satu request (dijalankan di proses worker), parameter sama dengan kolom manifest Batch
+    """
+    payload = read_secret_payload(secret_path, params["key"], params["compression"], params["checksum"])
+    options = (OPT_SCATTER if params["scatter"] else 0) | (OPT_MATRIX if params["matrix"] else 0)
+    embed_mmap(cover_path, payload["data"], payload["ext"], output_path, params["seed"], params["n_lsb"],
+               params["frame_aware"], payload["options"] | options, payload["checksum"])
+
+def extract_job(stego_path: str, output_path: str, seed: str | None, key: str | None) -> str:
+    """
+    Ekstraksi satu request (dijalankan di proses worker)
+
+    Output:
+        path berkas rahasia (ekstensi dari header)
+    """
+    with open(stego_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as stego:
+        layout = locate_payload(stego, seed)
+        if layout["options"] & OPT_CONTAINER:
+            raise ValueError("Stego berisi container, gunakan Cli.py unpack.")
+        verify_stego_prefix(stego, layout, key)
+        secret = read_payload(stego, layout)
+    return write_secret(output_path, secret, layout["ext"], key, layout["options"], layout["crc32"])
+
+def flag(query: dict, name: str, default: bool = False) -> bool:
+    value = query.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "y", "true")
+
+def secret_params(query: dict, headers: dict) -> dict:
+    """
+    Kunci dan seed dari header request (X-Stego-Key, X-Stego-Seed), bukan query string,
+    agar tidak tercatat di access log atau proxy
+    """
+    if "key" in query or "seed" in query:
+        raise HttpError(400, "Kirim key/seed lewat header X-Stego-Key/X-Stego-Seed, bukan query string.")
+    return {"key": headers.get("x-stego-key") or None, "seed": headers.get("x-stego-seed") or None}
+
+def embed_params(query: dict, headers: dict) -> dict:
+    """
+    Parameter penyisipan dari query string (nilai kosong = tidak dipakai) dan header request
+    """
+    try:
+        params = {
+            "n_lsb": int(query.get("n_lsb") or "1"),
+            "cover_bytes": int(query["cover_bytes"]),
+        }
+    except (KeyError, ValueError):
+        raise HttpError(400, "Query n_lsb/cover_bytes harus bilangan bulat.")
+    if not 1 <= params["n_lsb"] <= 4:
+        raise HttpError(400, "n_lsb harus di antara 1 dan 4.")
+    params.update(secret_params(query, headers))
+    params.update(
+        ext=query.get("ext") or ".bin",
+        compression=query.get("compression") or "none",
+        checksum=flag(query, "checksum", True),
+        frame_aware=flag(query, "frame_aware"),
+        scatter=flag(query, "scatter"),
+        matrix=flag(query, "matrix"),
+    )
+    if params["compression"] not in COMPRESSION_METHODS:
+        raise HttpError(400, f"Metode kompresi tidak dikenal: {params['compression']}")
+    if not params["ext"].startswith('.') or '/' in params["ext"] or os.sep in params["ext"]:
+        raise HttpError(400, "Ekstensi tidak valid.")
+    return params
+
+class StegoServer:
+    """
+    Server HTTP/1.1 asyncio (TCP atau Unix socket) untuk embed, extract, dan probe.
+    Proses worker tetap hidup sehingga setiap request tidak membayar startup interpreter dan import.
+
+    Endpoint (satu request per koneksi, body wajib memakai Content-Length):
+        POST /embed?cover_bytes=N&ext=.txt&n_lsb=&compression=&checksum=&frame_aware=&scatter=&matrix=
+            body = N byte cover mp3 diikuti isi berkas rahasia; response = stego mp3
+        POST /extract
+            body = stego mp3; response = berkas rahasia (ekstensi di header X-Secret-Ext)
+        Kunci vigenere dan seed dikirim lewat header X-Stego-Key dan X-Stego-Seed (opsional)
+        POST /probe
+            body = stego mp3 (cukup beberapa KB awal); response = metadata header JSON
+    """
+
+    def __init__(self, workers: int | None = None, max_jobs: int | None = None, max_pending: int = 64,
+                 max_body: int = MAX_BODY):
+        self.workers = workers or os.cpu_count() or 1
+        # Job CPU yang diproses bersamaan di pool; body diterima dulu tanpa memegang slot job
+        self.jobs = asyncio.Semaphore(max_jobs or self.workers)
+        self.max_pending = max_pending
+        self.pending = 0
+        self.max_body = max_body
+        self.pool = None
+
+    async def run_in_pool(self, func, *args):
+        async with self.jobs:
+            return await asyncio.get_running_loop().run_in_executor(self.pool, func, *args)
+
+    async def read_request(self, reader: asyncio.StreamReader) -> tuple[str, str, dict, int]:
+        line = await reader.readline()
+        parts = line.decode("latin-1").split()
+        if len(parts) != 3:
+            raise HttpError(400, "Request line tidak valid.")
+        headers = {}
+        for _ in range(MAX_HEADER_LINES):
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode("latin-1").partition(':')
+            headers[name.strip().lower()] = value.strip()
+        else:
+            raise HttpError(400, "Header terlalu banyak.")
+        if "transfer-encoding" in headers or "content-length" not in headers:
+            raise HttpError(411, "Content-Length dibutuhkan.")
+        try:
+            length = int(headers["content-length"])
+        except ValueError:
+            raise HttpError(400, "Content-Length tidak valid.")
+        if length < 0 or length > self.max_body:
+            raise HttpError(413, f"Body maksimal {self.max_body} byte.")
+        return parts[0], parts[1], headers, length
+
+    async def receive(self, reader: asyncio.StreamReader, path: str, length: int) -> None:
+        """
+        Menyalin length byte body ke berkas per IO_CHUNK (operasi disk di thread, bukan di event loop)
+        """
+        out = await asyncio.to_thread(open, path, 'wb')
+        try:
+            while length > 0:
+                chunk = await reader.read(min(IO_CHUNK, length))
+                if not chunk:
+                    raise HttpError(400, "Body terpotong.")
+                await asyncio.to_thread(out.write, chunk)
+                length -= len(chunk)
+        finally:
+            await asyncio.to_thread(out.close)
+
+    async def respond(self, writer: asyncio.StreamWriter, status: int, body_path: str | None = None,
+                      body: bytes = b'', content_type: str = "application/octet-stream",
+                      headers: dict | None = None) -> None:
+        """
+        Mengirim response; body berkas dikirim per IO_CHUNK dengan drain (backpressure ke klien lambat)
+        """
+        length = await asyncio.to_thread(os.path.getsize, body_path) if body_path else len(body)
+        head = [f"HTTP/1.1 {status} {REASONS.get(status, '')}", f"Content-Type: {content_type}",
+                f"Content-Length: {length}", "Connection: close"]
+        head += [f"{name}: {value}" for name, value in (headers or {}).items()]
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode("latin-1"))
+        if body_path:
+            f = await asyncio.to_thread(open, body_path, 'rb')
+            try:
+                while chunk := await asyncio.to_thread(f.read, IO_CHUNK):
+                    writer.write(chunk)
+                    await writer.drain()
+            finally:
+                await asyncio.to_thread(f.close)
+        else:
+            writer.write(body)
+        await writer.drain()
+
+    async def respond_json(self, writer: asyncio.StreamWriter, status: int, data: dict) -> None:
+        await self.respond(writer, status, body=json.dumps(data).encode("utf-8") + b'\n',
+                           content_type="application/json")
+
+    async def handle_embed(self, reader, writer, query: dict, headers: dict, length: int, workdir: str) -> None:
+        params = embed_params(query, headers)
+        if not 0 < params["cover_bytes"] <= length:
+            raise HttpError(400, "cover_bytes harus di antara 1 dan panjang body.")
+        cover_path = os.path.join(workdir, "cover.mp3")
+        secret_path = os.path.join(workdir, "secret" + params["ext"])
+        output_path = os.path.join(workdir, "stego.mp3")
+        await self.receive(reader, cover_path, params["cover_bytes"])
+        await self.receive(reader, secret_path, length - params["cover_bytes"])
+        await self.run_in_pool(embed_job, cover_path, secret_path, output_path, params)
+        await self.respond(writer, 200, output_path, content_type="audio/mpeg")
+
+    async def handle_extract(self, reader, writer, query: dict, headers: dict, length: int, workdir: str) -> None:
+        params = secret_params(query, headers)
+        stego_path = os.path.join(workdir, "stego.mp3")
+        await self.receive(reader, stego_path, length)
+        secret_path = await self.run_in_pool(extract_job, stego_path, os.path.join(workdir, "secret"),
+                                             params["seed"], params["key"])
+        ext = os.path.splitext(secret_path)[1]
+        await self.respond(writer, 200, secret_path, headers={"X-Secret-Ext": ext})
+
+    async def handle_probe(self, reader, writer, query: dict, headers: dict, length: int, workdir: str) -> None:
+        stego_path = os.path.join(workdir, "stego.mp3")
+        await self.receive(reader, stego_path, length)
+        result = await asyncio.to_thread(probe, stego_path)
+        result.pop("path")
+        await self.respond_json(writer, 200, result)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        routes = {"/embed": self.handle_embed, "/extract": self.handle_extract, "/probe": self.handle_probe}
+        try:
+            method, target, headers, length = await self.read_request(reader)
+            url = urlsplit(target)
+            if url.path not in routes:
+                raise HttpError(404, f"Endpoint tidak dikenal: {url.path}")
+            if method != "POST":
+                raise HttpError(405, "Gunakan POST.")
+            if self.pending >= self.max_pending:
+                raise HttpError(503, "Server sibuk, coba lagi nanti.")
+            self.pending += 1
+            try:
+                workdir = await asyncio.to_thread(tempfile.mkdtemp, prefix="stego_")
+                try:
+                    await routes[url.path](reader, writer, dict(parse_qsl(url.query)), headers, length, workdir)
+                finally:
+                    await asyncio.to_thread(shutil.rmtree, workdir, ignore_errors=True)
+            finally:
+                self.pending -= 1
+        except HttpError as e:
+            await self.respond_json(writer, e.status, {"error": str(e)})
+        except ConnectionError:
+            pass
+        except ValueError as e:
+            await self.respond_json(writer, 422, {"error": str(e)})
+        except Exception as e:
+            await self.respond_json(writer, 500, {"error": str(e)})
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8470, unix_path: str | None = None) -> None:
+        with ProcessPoolExecutor(max_workers=self.workers) as self.pool:
+            if unix_path:
+                server = await asyncio.start_unix_server(self.handle, unix_path, limit=IO_CHUNK)
+                address = unix_path
+            else:
+                server = await asyncio.start_server(self.handle, host, port, limit=IO_CHUNK)
+                address = f"http://{host}:{server.sockets[0].getsockname()[1]}"
+            print(f"Server berjalan di {address} ({self.workers} worker)", flush=True)
+            async with server:
+                await server.serve_forever()
+
+def main_serve(host: str = "127.0.0.1", port: int = 8470, unix_path: str | None = None, workers: int | None = None,
+               max_jobs: int | None = None, max_pending: int = 64, max_body: int = MAX_BODY) -> int:
+    """
+    Entry point subcommand serve (berhenti dengan Ctrl+C)
+    """
+    server = StegoServer(workers, max_jobs, max_pending, max_body)
+    try:
+        asyncio.run(server.serve(host, port, unix_path))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if unix_path and os.path.exists(unix_path):
+            os.remove(unix_path)
+    return 0
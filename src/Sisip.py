@@ -1,63 +1,53 @@
-import math
-from typing import List
-
+import numpy as np
+
+from BitBuffer import BitBuffer
+from LSBEngine import as_array, embed_payload, extract_payload
+from Planner import UsableIndex, bits_fit, capacity_bits, embed_payload_mapped, extract_payload_mapped
+from Profiler import current_stage, profiled, stage
+from Matrix import MATRIX_MAX_K, choose_k, matrix_embed, matrix_extract, matrix_layout
+from Scatter import ScatterPermutation, scatter_embed, scatter_extract
 from Randomizer import generate_random
 
 # ---------- Helpers ----------
-def bits_from_lines(lines: List[str]) -> str:
-    return ''.join(line.strip() for line in lines if line.strip())
-
-def lines_from_bits(bits: str, chunk: int = 8) -> List[str]:
-    return [bits[i:i+chunk] for i in range(0, len(bits), chunk)]
-
-def int_to_bits(value: int, width: int) -> str:
-    return format(value, f'0{width}b')
-
-def bits_to_int(b: str) -> int:
-    return int(b, 2) if b else 0
-
 # def find_max_start(nLSB: int, headersList: List[int]) -> int:
-def find_max_start_sisip(nLSB: int, firstHeader: int, stego_metadata: int) -> int:
+def find_max_start(nLSB: int, coverBytes: int, firstHeader: int, stego_metadata: int, payloadBits: int) -> int:
     """
     Mencari lokasi index start maksimal yang dapat digunakan untuk menyisipkan file
     
     Args: 
         nLSB (int): jumlah LSB yang digunakan
+        coverBytes (int): jumlah byte pada cover/stego
         firstHeader (int): index pertama setelah header
         stego_metadata (int): panjang metadata stego file
+        payloadBits (int): panjang file yang disisipkan/diekstrak dalam bit
         
     Output:
         selisih antara byte yang tersedia dengan byte yang dibutuhkan, jika negatif berarti tidak cukup
     """
+    # availableBytes = coverBytes - (4 * len(headersList) + headersList[0] + 72) # kalau pakai teknik lompat header
+    fit = bits_fit(coverBytes - firstHeader, nLSB, 0, stego_metadata)
+    
+    # = availableBytes - ceil(payloadBits / nLSB)
+    return (fit - payloadBits) // nLSB if fit >= payloadBits else -1
+
+def find_max_start_sisip(nLSB: int, firstHeader: int, stego_metadata: int) -> int:
+    """
+    Versi berbasis cover.txt/sisip.txt dari find_max_start (kompatibilitas)
+    """
     with open(r"cover.txt", 'r') as fc, open(r"sisip.txt", 'r') as fs:
         coverBytes = len(fc.readlines()) - 1 # -1 for extension line
         sisipBits = (len(fs.readlines()) - 1) * 8 # -1 for extension line
         
-    bytesAmountNeeded = math.ceil(sisipBits / nLSB)
-    availableBytes = coverBytes - (firstHeader + stego_metadata)
-    # availableBytes = coverBytes - (4 * len(headersList) + headersList[0] + 72) # kalau pakai teknik lompat header
-    
-    return availableBytes - bytesAmountNeeded if (availableBytes >= bytesAmountNeeded) else -1
+    return find_max_start(nLSB, coverBytes, firstHeader, stego_metadata, sisipBits)
 
 def find_max_start_ekstrak(nLSB: int, firstHeader: int, stego_metadata: int, output_size: int) -> int:
     """
-    Mencari lokasi index start maksimal yang dapat digunakan untuk menyisipkan file
-    
-    Args: 
-        nLSB (int): jumlah LSB yang digunakan
-        firstHeader (int): index pertama setelah header
-        stego_metadata (int): panjang metadata stego file
-        output_size (int): panjang file yang akan diekstrak dalam bit
-        
-    Output:
-        selisih antara byte yang tersedia dengan byte yang dibutuhkan, jika negatif berarti tidak cukup
+    Versi berbasis stega.txt dari find_max_start (kompatibilitas)
     """
     with open(r"stega.txt", 'r') as fr:
         coverBytes = len(fr.readlines()) - 1 # -1 for extension line
-    bytesAmountNeeded = math.ceil(output_size / nLSB)
-    availableBytes = coverBytes - (firstHeader + stego_metadata)
     
-    return availableBytes - bytesAmountNeeded if (availableBytes >= bytesAmountNeeded) else -1
+    return find_max_start(nLSB, coverBytes, firstHeader, stego_metadata, output_size)
         
     
 
@@ -131,184 +121,606 @@ def find_spesific_index(firstHeader: int, stego_metadata: int, i: int) -> int:
 #     if pos == -1:
 #         return 0
 #     return (pos // 8) + 1
-def find_audio_start(cover_bytes: list) -> int:
+# Ukuran jendela pemindaian sync word
+# Jendela pertama kecil lalu membesar: sync word biasanya ditemukan di beberapa KB awal
+SCAN_WINDOW_MIN = 1 << 12
+SCAN_WINDOW = 1 << 20
+
+def find_audio_start(cover_bytes) -> int:
     """
     Scan per byte for MP3 sync word (11 ones).
     Checks each byte and the next byte for the sync word starting at any bit position.
     Returns the byte index where the sync word starts, or 0 if not found.
+    
+    Kandidat disaring per jendela dengan NumPy: 11 bit berurutan yang mulai di bit 0..5
+    selalu mencakup 3 LSB byte ini dan 3 MSB byte berikutnya.
+    Lihat FrameParser.index_frames untuk indeks frame MP3 yang sebenarnya.
     """
-    sync_word = "1" * 11
-    n = len(cover_bytes)
-    for i in range(n - 1):
-        # Combine current and next byte for overlap
-        combined = cover_bytes[i] + cover_bytes[i + 1]
-        # Check all possible bit positions in current byte
-        for shift in range(8):
-            candidate = combined[shift:shift + 11]
-            if candidate == sync_word:
-                return i + 4
-    # Check last byte alone (if file is very short)
-    if n > 0 and cover_bytes[-1].startswith(sync_word):
-        return n - 1
+    arr = as_array(cover_bytes)
+    n = len(arr)
+    w0, size = 0, SCAN_WINDOW_MIN
+    while w0 < n - 1:
+        window = arr[w0:w0 + size + 1]
+        candidates = np.flatnonzero(((window[:-1] & 0x07) == 0x07) & (window[1:] >= 0xE0))
+        for i in candidates + w0:
+            # Combine current and next byte for overlap
+            combined = (int(arr[i]) << 8) | int(arr[i + 1])
+            # Check all possible bit positions in current byte
+            for shift in range(6):
+                if (combined >> (5 - shift)) & 0x7FF == 0x7FF:
+                    return int(i) + 4
+        w0 += size
+        size = min(size * 2, SCAN_WINDOW)
     return 0
 
 
-# ---------- Main functions ----------
-def sisip(random_seed: str | None = None, n_lsb: int = 1):
-    assert 1 <= n_lsb <= 4, "n_lsb must be between 1 and 4"
+# ---------- Header ----------
+STEGO_MAGIC = 0x5354
+FIXED_HEADER_LEN = 16 + 8 + 8 + 8 + 32  # = 72 bits
+CHECKSUM_LEN = 32 + 32  # CRC32 sampel awal payload + CRC32 seluruh payload
+# Header terpanjang: 72 bit tetap + 255 karakter ekstensi + checksum, 1 byte cover per bit
+MAX_HEADER_LEN = FIXED_HEADER_LEN + 255 * 8 + CHECKSUM_LEN
+OPT_FRAME_AWARE = 0b00000001
+OPT_RANDOM_START = 0b00000010
+OPT_COMPRESSED = 0b00000100
+OPT_LZMA = 0b00001000  # hanya bermakna bersama OPT_COMPRESSED (lzma, bukan zlib)
+OPT_CHECKSUM = 0b00010000
+OPT_CONTAINER = 0b00100000
+OPT_SCATTER = 0b01000000  # bit payload disebar dengan permutasi berkunci seed (menggantikan random start)
+OPT_MATRIX = 0b10000000  # matrix embedding kode Hamming, field n_lsb header berisi k (bit pesan per blok)
+# Selisih payload yang berjarak kurang dari ini digabung menjadi satu rentang saat update
+UPDATE_RUN_GAP = 64
+
+def payload_start_offset(random_seed: str | None, n_lsb: int, total_bytes: int, audio_start_idx: int,
+                         header_len: int, content_size_bits: int) -> int:
+    """
+    Menghitung offset bit awal payload (random start jika ada seed)
+    
+    Args:
+        random_seed (str | None): seed pembangkit acak
+        n_lsb (int): jumlah LSB yang digunakan
+        total_bytes (int): jumlah byte pada cover/stego
+        audio_start_idx (int): index awal audio
+        header_len (int): panjang header stego dalam bit (= byte, 1 LSB per byte)
+        content_size_bits (int): panjang payload dalam bit
+        
+    Output:
+        offset bit awal payload
+    """
+    if random_seed is None:
+        return 0
+    max_start = find_max_start(n_lsb, total_bytes, audio_start_idx, header_len, content_size_bits)
+    random_number = generate_random(random_seed, max_start)
+    
+    return find_spesific_index(audio_start_idx, header_len, random_number)
 
-    cover_file = "cover.txt"
-    secret_file = "sisip.txt"
-    output_file = "stega.txt"
+def payload_layout(total_bytes: int, audio_start_idx: int, header_len: int, content_size_bits: int,
+                   n_lsb: int, random_seed: str | None = None) -> tuple[int, int, int]:
+    """
+    Menghitung tata letak payload dan memastikan payload muat di cover
+    
+    Args:
+        total_bytes (int): jumlah byte pada cover/stego
+        audio_start_idx (int): index awal audio
+        header_len (int): panjang header stego dalam bit (= byte, 1 LSB per byte)
+        content_size_bits (int): panjang payload dalam bit
+        n_lsb (int): jumlah LSB yang digunakan
+        random_seed (str | None): seed pembangkit acak (None jika tanpa random start)
+        
+    Output:
+        tuple (index byte awal payload, kapasitas payload dalam bit, offset bit awal payload)
+    """
+    total_usable_bytes = total_bytes - audio_start_idx
+    if header_len >= total_usable_bytes:
+        raise ValueError("Cover too small to hold header in audio region.")
 
-    # --- Read cover ---
-    with open(cover_file, "r") as f:
-        lines = [ln.rstrip("\n") for ln in f.readlines()]
-    cover_ext = lines[0].strip()
-    cover_data_lines = lines[1:]
-    cover_data = [line if len(line) >= 8 else line.zfill(8) for line in cover_data_lines]
-    total_cover_bytes = len(cover_data)
-    if total_cover_bytes == 0:
-        raise ValueError("Cover contains no data bytes.")
+    total_payload_capacity = capacity_bits(total_usable_bytes, n_lsb, header_len)
+    if content_size_bits > total_payload_capacity:
+        raise ValueError("Cover tidak cukup untuk berkas rahasia.")
 
-    # --- Find audio sample start ---
-    audio_start_idx = find_audio_start(cover_data)
-    cover_bytes = [list(b) for b in cover_data]
-    usable_cover_bytes = cover_bytes[audio_start_idx:]
-    total_usable_bytes = len(usable_cover_bytes)
-
-    # --- Read secret ---
-    with open(secret_file, "r") as f:
-        s_lines = [ln.rstrip("\n") for ln in f.readlines()]
-    secret_ext = s_lines[0].strip()
-    secret_data_lines = s_lines[1:]
-    secret_bits = bits_from_lines(secret_data_lines)
-    content_size_bits = len(secret_bits)
+    start_offset_bit = payload_start_offset(random_seed, n_lsb, total_bytes, audio_start_idx,
+                                            header_len, content_size_bits)
+    
+    return audio_start_idx + header_len, total_payload_capacity, start_offset_bit
 
-    # --- Build header (always 1 LSB per byte) ---
-    magic = int_to_bits(0x5354, 16)
-    n_lsb_bits = int_to_bits(n_lsb, 8)
-    ext_size = len(secret_ext)
-    if ext_size > 255:
+def region_layout(options: int, total_bytes: int, audio_start_idx: int, header_len: int, content_size_bits: int,
+                  n_lsb: int, random_seed: str | None = None) -> tuple[int, int, int]:
+    """
+    payload_layout atau, untuk OPT_MATRIX, Matrix.matrix_layout (n_lsb berisi k; kapasitas dan
+    awal payload dalam satuan blok)
+    """
+    if options & OPT_MATRIX:
+        return matrix_layout(total_bytes, audio_start_idx, header_len, content_size_bits, n_lsb, random_seed)
+    return payload_layout(total_bytes, audio_start_idx, header_len, content_size_bits, n_lsb, random_seed)
+
+def build_header(n_lsb: int, secret_ext: str, options: int, content_size_bits: int,
+                 checksum: tuple[int, int] | None = None) -> bytes:
+    """
+    Menyusun header stego: magic, n_lsb, ext_size, options, content_size, ekstensi,
+    lalu (jika options memuat OPT_CHECKSUM) CRC32 sampel awal dan CRC32 seluruh payload
+    
+    Output:
+        header dalam bytes (setiap bit disisipkan ke 1 LSB byte cover)
+    """
+    if len(secret_ext) > 255:
         raise ValueError("Extension string too long.")
-    ext_size_bits = int_to_bits(ext_size, 8)
-    options = 0
-    if random_seed is not None:
-        options |= 0b00000010
-    options_bits = int_to_bits(options, 8)
-    content_size_bits_str = int_to_bits(content_size_bits, 32)
-    ext_type_bits = ''.join(int_to_bits(ord(c), 8) for c in secret_ext)
-
-    header_bits = magic + n_lsb_bits + ext_size_bits + options_bits + content_size_bits_str + ext_type_bits
-    header_len_bits = len(header_bits)
-    header_bytes_needed = header_len_bits
-
-    if header_bytes_needed >= total_usable_bytes:
-        raise ValueError("Cover too small to hold header in audio region.")
+    header = BitBuffer()
+    header.write(STEGO_MAGIC, 16)
+    header.write(n_lsb, 8)
+    header.write(len(secret_ext), 8)
+    header.write(options, 8)
+    header.write(content_size_bits, 32)
+    # Ekstensi 1 byte per karakter (latin-1), field sejajar byte sehingga disalin langsung
+    header.write_bytes(secret_ext.encode("latin-1"))
+    if options & OPT_CHECKSUM:
+        header.write(checksum[0], 32)
+        header.write(checksum[1], 32)
+    return header.to_bytes()
+
+def decode_header(usable, audio_start_idx: int) -> dict:
+    """
+    Membaca header stego (1 LSB per byte) dari byte-byte awal region audio
+    
+    Args:
+        usable (bytes | bytearray | memoryview): byte stego mulai dari audio_start_idx
+        audio_start_idx (int): index awal audio pada berkas stego
+        
+    Output:
+        dict berisi audio_start, n_lsb, ext, options, content_size, header_len,
+        prefix_crc dan crc32 (None jika tanpa OPT_CHECKSUM)
+    """
+    if len(usable) < FIXED_HEADER_LEN:
+        raise ValueError("Stego terlalu kecil untuk memuat header.")
 
-    # --- Compute capacity ---
-    available_bytes = total_usable_bytes - header_bytes_needed
-    total_payload_capacity = available_bytes * n_lsb
-    if content_size_bits > total_payload_capacity:
-        raise ValueError("Cover tidak cukup untuk berkas rahasia.")
+    # Seluruh header terpanjang dikumpulkan sekaligus; panjang sebenarnya diketahui dari field
+    bits = BitBuffer.from_lsbs(usable, min(len(usable), MAX_HEADER_LEN))
+    magic = bits.read(16)
+    if magic != STEGO_MAGIC:
+        raise ValueError(f"Magic mismatch. Expected 0x5354, got {hex(magic)}")
 
-    # --- Embed header ---
-    for i in range(header_len_bits):
-        bit = header_bits[i]
-        usable_cover_bytes[i][-1] = bit
+    n_lsb = bits.read(8)
+    ext_size = bits.read(8)
+    options = bits.read(8)
+    content_size = bits.read(32)
+    if not 1 <= n_lsb <= (MATRIX_MAX_K if options & OPT_MATRIX else 4):
+        raise ValueError(f"n_lsb pada header tidak valid: {n_lsb}")
 
-    # --- Payload start offset ---
-    if random_seed is not None:
-        max_start = find_max_start_sisip(n_lsb, audio_start_idx, header_bytes_needed)
-        random_number = generate_random(random_seed, max_start)
+    # extension string
+    header_len = FIXED_HEADER_LEN + ext_size * 8
+    if len(bits) < header_len:
+        raise ValueError("Stego terlalu kecil untuk memuat header.")
+    ext_chars = bits.read_bytes(ext_size).decode("latin-1")
+
+    prefix_crc = crc = None
+    if options & OPT_CHECKSUM:
+        if len(bits) < header_len + CHECKSUM_LEN:
+            raise ValueError("Stego terlalu kecil untuk memuat header.")
+        prefix_crc, crc = bits.read(32), bits.read(32)
+        header_len += CHECKSUM_LEN
+
+    return {
+        "audio_start": audio_start_idx,
+        "n_lsb": n_lsb,
+        "ext": ext_chars,
+        "options": options,
+        "content_size": content_size,
+        "header_len": header_len,
+        "prefix_crc": prefix_crc,
+        "crc32": crc,
+    }
+
+def read_header(stego, index: UsableIndex | None = None) -> dict:
+    """
+    Membaca header stego (1 LSB per byte) dari awal region audio.
+    Jika tidak ditemukan, dicoba header mode frame-aware (di main data frame pertama)
+    
+    Args:
+        stego (bytes | bytearray | memoryview): isi berkas stego
+        index (UsableIndex | None): indeks frame stego yang sudah diketahui, contoh dari CoverCache
+            (None = dihitung jika dibutuhkan)
         
-        start_offset_bit = find_spesific_index(audio_start_idx, header_bytes_needed, random_number)
+    Output:
+        dict berisi audio_start, n_lsb, ext, options, content_size, header_len,
+        index (UsableIndex untuk mode frame-aware, None jika tidak)
+    """
+    with stage("audio_start", bytes=len(stego)):
+        audio_start_idx = find_audio_start(stego)
+    # View dilepas eksplisit: traceback header yang gagal tidak boleh menahan export mmap
+    usable = memoryview(stego)[audio_start_idx:]
+    try:
+        header = decode_header(usable, audio_start_idx)
+        header["index"] = None
+        return header
+    except ValueError as err:
+        if index is None:
+            with stage("frame_index", bytes=len(stego)):
+                index = UsableIndex.from_data(stego)
+        try:
+            header = decode_header(index.gather(stego, 0, min(len(index), MAX_HEADER_LEN)), 0)
+        except ValueError:
+            raise err
+        if not header["options"] & OPT_FRAME_AWARE:
+            raise err
+        header["index"] = index
+        return header
+    finally:
+        usable.release()
+
+
+# ---------- Main functions ----------
+@profiled("embed")
+def embed_into(stego, secret: bytes, secret_ext: str, random_seed: str | None = None, n_lsb: int = 1,
+               frame_aware: bool = False, options: int = 0, checksum: tuple[int, int] | None = None,
+               audio_start_idx: int | None = None, index: UsableIndex | None = None) -> None:
+    """
+    Menyisipkan secret langsung ke buffer stego yang writable (in-place),
+    misalnya bytearray atau mmap dari salinan cover
+    
+    Args:
+        stego (bytearray | mmap | np.ndarray): isi berkas cover mp3 yang akan dimodifikasi
+        secret (bytes): isi berkas rahasia (sudah dienkripsi jika perlu)
+        secret_ext (str): ekstensi berkas rahasia, contoh ".txt"
+        random_seed (str | None): seed untuk random start (opsional)
+        n_lsb (int): jumlah LSB yang digunakan (1 - 4)
+        frame_aware (bool): hanya menyisipkan ke main data frame MP3 (melompati header frame & side info)
+        options (int): bit options tambahan pada header, contoh OPT_CONTAINER atau OPT_SCATTER
+            (scatter: seed menjadi kunci permutasi posisi bit, bukan random start). Dengan OPT_MATRIX
+            n_lsb diabaikan: k bit per blok 2^k - 1 byte dipilih sebesar mungkin sesuai kapasitas
+        checksum (tuple[int, int] | None): CRC32 sampel awal dan seluruh payload sebelum enkripsi
+            (lihat Checksum.PayloadChecksum); jika diisi, header memuat OPT_CHECKSUM
+        audio_start_idx (int | None): awal audio hasil analisis sebelumnya (lihat CoverCache), None = dipindai
+        index (UsableIndex | None): indeks frame hasil analisis sebelumnya untuk mode frame-aware
+    """
+    assert 1 <= n_lsb <= 4, "n_lsb must be between 1 and 4"
+
+    if len(stego) == 0:
+        raise ValueError("Cover contains no data bytes.")
+    current_stage().add(bytes=len(stego), bits=len(secret) * 8)
+
+    # --- Find audio sample start ---
+    if frame_aware:
+        # Ruang byte logis: hanya main data frame, header stego mulai dari byte logis 0
+        if index is None:
+            with stage("frame_index", bytes=len(stego)):
+                index = UsableIndex.from_data(stego)
+        if len(index) == 0:
+            raise ValueError("Cover tidak memiliki frame MP3 yang valid.")
+        options |= OPT_FRAME_AWARE
+        audio_start_idx, total_bytes = 0, len(index)
     else:
-        start_offset_bit = 0
-
-    # --- Embed payload ---
-    for j in range(content_size_bits):
-        global_payload_bit_index = (start_offset_bit + j) % total_payload_capacity
-        payload_byte_offset = global_payload_bit_index // n_lsb
-        lsb_pos = global_payload_bit_index % n_lsb
-        target_byte_idx = header_bytes_needed + payload_byte_offset
-        usable_cover_bytes[target_byte_idx][- (lsb_pos + 1)] = secret_bits[j]
-
-    # --- Write back ---
-    modified_cover = cover_bytes[:audio_start_idx] + usable_cover_bytes
-    stego_lines = [cover_ext] + [''.join(b) for b in modified_cover]
-    with open(output_file, "w") as f:
-        f.write("\n".join(stego_lines))
+        index = None
+        if audio_start_idx is None:
+            with stage("audio_start", bytes=len(stego)):
+                audio_start_idx = find_audio_start(stego)
+        total_bytes = len(stego)
+    content_size_bits = len(secret) * 8
 
+    # --- Build header (always 1 LSB per byte) ---
+    scatter = bool(options & OPT_SCATTER)
+    if scatter and random_seed is None:
+        raise ValueError("Mode scatter membutuhkan seed.")
+    if scatter and options & OPT_MATRIX:
+        raise ValueError("Mode scatter tidak dapat digabung dengan matrix embedding.")
+    if random_seed is not None and not scatter:
+        options |= OPT_RANDOM_START
+    if checksum is not None:
+        options |= OPT_CHECKSUM
+    if options & OPT_MATRIX:
+        # Panjang header tidak bergantung pada nilai k, sehingga k dapat dipilih sebelum header disusun
+        header_len = len(build_header(1, secret_ext, options, content_size_bits, checksum)) * 8
+        n_lsb = choose_k(total_bytes - audio_start_idx - header_len, content_size_bits)
+    header = build_header(n_lsb, secret_ext, options, content_size_bits, checksum)
+    header_len = len(header) * 8
+
+    # --- Compute capacity & payload start offset ---
+    payload_base, total_payload_capacity, start_offset_bit = region_layout(
+        options, total_bytes, audio_start_idx, header_len, content_size_bits, n_lsb,
+        None if scatter else random_seed)
+
+    # --- Embed header & payload ---
+    with stage("header_embed", bits=header_len):
+        if index is None:
+            embed_payload(stego, header, audio_start_idx, 0, header_len, 1)
+        else:
+            embed_payload_mapped(index, stego, header, audio_start_idx, 0, header_len, 1)
+    with stage("payload_embed", bytes=len(secret), bits=content_size_bits):
+        if scatter:
+            perm = ScatterPermutation(random_seed, total_payload_capacity)
+            scatter_embed(stego, secret, payload_base, perm, n_lsb, index)
+        elif options & OPT_MATRIX:
+            matrix_embed(stego, secret, payload_base, start_offset_bit, total_payload_capacity, n_lsb, index)
+        elif index is None:
+            embed_payload(stego, secret, payload_base, start_offset_bit, total_payload_capacity, n_lsb)
+        else:
+            embed_payload_mapped(index, stego, secret, payload_base, start_offset_bit, total_payload_capacity, n_lsb)
+
+def embed(cover, secret: bytes, secret_ext: str, random_seed: str | None = None, n_lsb: int = 1,
+          frame_aware: bool = False, options: int = 0, checksum: tuple[int, int] | None = None) -> bytearray:
+    """
+    Menyisipkan secret ke cover langsung di memori (tanpa berkas txt sementara)
+    
+    Args:
+        cover (bytes | bytearray | memoryview): isi berkas cover mp3
+        secret (bytes): isi berkas rahasia (sudah dienkripsi jika perlu)
+        secret_ext (str): ekstensi berkas rahasia, contoh ".txt"
+        random_seed (str | None): seed untuk random start (opsional)
+        n_lsb (int): jumlah LSB yang digunakan (1 - 4)
+        frame_aware (bool): hanya menyisipkan ke main data frame MP3
+        options (int): bit options tambahan pada header
+        checksum (tuple[int, int] | None): CRC32 payload sebelum enkripsi (opsional)
+        
+    Output:
+        bytearray berisi stego-object
+    """
+    stego = bytearray(cover)
+    embed_into(stego, secret, secret_ext, random_seed, n_lsb, frame_aware, options, checksum)
+    return stego
 
+def locate_payload(stego, random_seed: str | None = None, index: UsableIndex | None = None) -> dict:
+    """
+    Membaca header dan menghitung tata letak payload pada stego
+    
+    Args:
+        stego (bytes | bytearray | memoryview): isi berkas stego mp3
+        random_seed (str | None): seed yang dipakai saat penyisipan (opsional)
+        index (UsableIndex | None): indeks frame stego yang sudah diketahui (lihat read_header)
+        
+    Output:
+        dict header (lihat read_header) ditambah payload_base, capacity, start,
+        scatter (ScatterPermutation untuk mode OPT_SCATTER, None jika tidak), dan
+        matrix (k untuk mode OPT_MATRIX, None jika tidak; capacity dan start lalu dalam satuan blok)
+    """
+    with stage("read_header"):
+        header = read_header(stego, index)
+    index = header["index"]
+    total_bytes = len(stego) if index is None else len(index)
+
+    use_random_start = bool(header["options"] & OPT_RANDOM_START)
+    header["payload_base"], header["capacity"], header["start"] = region_layout(
+        header["options"], total_bytes, header["audio_start"], header["header_len"], header["content_size"],
+        header["n_lsb"], random_seed if use_random_start else None)
+    header["matrix"] = header["n_lsb"] if header["options"] & OPT_MATRIX else None
+    header["scatter"] = None
+    if header["options"] & OPT_SCATTER:
+        if random_seed is None:
+            raise ValueError("Stego memakai mode scatter, seed dibutuhkan.")
+        header["scatter"] = ScatterPermutation(random_seed, header["capacity"])
+    return header
+
+def read_payload(stego, layout: dict, offset: int = 0, length: int | None = None) -> bytes:
+    """
+    Mengekstrak sebagian payload (byte offset .. offset + length) tanpa membaca sisanya
+    
+    Args:
+        stego (bytes | bytearray | memoryview): isi berkas stego mp3
+        layout (dict): hasil locate_payload
+        offset (int): byte awal di dalam payload
+        length (int | None): jumlah byte (None = sampai akhir payload)
+        
+    Output:
+        byte payload yang diminta
+    """
+    payload_bytes = layout["content_size"] // 8
+    if length is None:
+        length = payload_bytes - offset
+    if offset < 0 or length < 0 or offset + length > payload_bytes:
+        raise ValueError("Rentang di luar payload.")
+
+    n_bits = length * 8
+    with stage("payload_extract", bytes=length, bits=n_bits):
+        if layout["matrix"]:
+            return matrix_extract(stego, offset * 8, n_bits, layout["payload_base"], layout["start"],
+                                  layout["capacity"], layout["matrix"], layout["index"])
+        # Bit payload ke-j berada di posisi (start + j) % capacity, jadi rentang cukup menggeser start
+        start = (layout["start"] + offset * 8) % layout["capacity"]
+        if layout["scatter"] is not None:
+            return scatter_extract(stego, offset * 8, n_bits, layout["payload_base"], layout["scatter"],
+                                   layout["n_lsb"], layout["index"])
+        if layout["index"] is None:
+            return extract_payload(stego, n_bits, layout["payload_base"], start, layout["capacity"],
+                                   layout["n_lsb"])
+        return extract_payload_mapped(layout["index"], stego, n_bits, layout["payload_base"], start,
+                                      layout["capacity"], layout["n_lsb"])
+
+def write_payload(stego, layout: dict, offset: int, data: bytes) -> None:
+    """
+    Menyisipkan data sebagai byte payload offset .. offset + len(data) (kebalikan read_payload),
+    hanya byte cover milik rentang tersebut yang ditulis
+    
+    Args:
+        stego (bytearray | mmap | np.ndarray): buffer stego yang writable
+        layout (dict): tata letak payload (hasil locate_payload)
+        offset (int): byte awal di dalam payload
+        data (bytes): isi rentang payload
+    """
+    if not data:
+        return
+    if layout["matrix"]:
+        matrix_embed(stego, data, layout["payload_base"], layout["start"], layout["capacity"], layout["matrix"],
+                     layout["index"], offset * 8)
+        return
+    start = (layout["start"] + offset * 8) % layout["capacity"]
+    if layout["scatter"] is not None:
+        scatter_embed(stego, data, layout["payload_base"], layout["scatter"], layout["n_lsb"], layout["index"],
+                      offset * 8)
+    elif layout["index"] is None:
+        embed_payload(stego, data, layout["payload_base"], start, layout["capacity"], layout["n_lsb"])
+    else:
+        embed_payload_mapped(layout["index"], stego, data, layout["payload_base"], start, layout["capacity"],
+                             layout["n_lsb"])
 
-def ekstrak(random_seed: str | None = None):
-    stego_file = "stega.txt"
-    output_file = "extracted.txt"
+def plausible_header(header: dict) -> bool:
+    """
+    Pemeriksaan kewajaran header tanpa checksum: payload kelipatan byte, ekstensi teks ASCII yang
+    diawali titik (atau kosong), dan kombinasi options yang dapat dihasilkan embed_into
+    """
+    options, ext = header["options"], header["ext"]
+    if header["content_size"] % 8 or (ext and (ext[0] != "." or not ext.isascii() or not ext.isprintable())):
+        return False
+    if options & OPT_LZMA and not options & OPT_COMPRESSED:
+        return False
+    if options & OPT_SCATTER and options & (OPT_RANDOM_START | OPT_MATRIX):
+        return False
+    return True
+
+def diff_runs(old: bytes, new: bytes, gap: int = UPDATE_RUN_GAP) -> list[tuple[int, int]]:
+    """
+    Rentang byte (awal, akhir) tempat old dan new berbeda; rentang yang berjarak kurang dari gap
+    digabung agar jumlah pemanggilan penyisipan tetap kecil
+    """
+    a = np.frombuffer(old, dtype=np.uint8)
+    b = np.frombuffer(new, dtype=np.uint8)
+    changed = np.flatnonzero(a != b)
+    if changed.size == 0:
+        return []
+    breaks = np.flatnonzero(np.diff(changed) > gap)
+    starts = np.concatenate(([changed[0]], changed[breaks + 1]))
+    ends = np.concatenate((changed[breaks], [changed[-1]])) + 1
+    return [(int(lo), int(hi)) for lo, hi in zip(starts, ends)]
+
+@profiled("update")
+def update_into(stego, secret: bytes, secret_ext: str, random_seed: str | None = None, options: int = 0,
+                checksum: tuple[int, int] | None = None, key: str | None = None) -> dict:
+    """
+    Mengganti payload stego yang sudah ada secara in-place. Jika tata letak payload tidak berubah
+    (n_lsb, panjang header, dan offset awal sama), hanya rentang byte payload yang berbeda dari
+    payload lama yang ditulis ulang, lalu header diperbarui
+    
+    Args:
+        stego (bytearray | mmap): isi berkas stego yang akan dimodifikasi
+        secret (bytes): payload baru (sudah dikompresi/dienkripsi jika perlu)
+        secret_ext (str): ekstensi berkas rahasia
+        random_seed (str | None): seed yang dipakai saat penyisipan awal
+        options (int): bit options isi payload (OPT_COMPRESSED, OPT_LZMA, OPT_CONTAINER);
+            n_lsb, frame-aware, random start, scatter, dan matrix mengikuti header lama
+            (k matrix dipilih ulang sesuai ukuran payload baru; jika berubah, payload ditulis ulang penuh)
+        checksum (tuple[int, int] | None): CRC32 payload baru sebelum enkripsi (opsional)
+        key (str | None): kunci vigenere payload lama, untuk memverifikasi checksum header lama
+        
+    Output:
+        dict berisi incremental (bool), payload_bytes, patched_bytes, runs
+    """
+    # Checksum mengimpor Sisip, sehingga diimpor saat dipakai
+    from Checksum import verify_stego_prefix
+
+    old = locate_payload(stego, random_seed)
+    # Seed salah menggeser tata letak payload lama: stego ditolak sebelum ada byte yang ditulis
+    verify_stego_prefix(stego, old, key)
+    seeded = old["options"] & (OPT_RANDOM_START | OPT_SCATTER)
+    structural = OPT_FRAME_AWARE | OPT_RANDOM_START | OPT_SCATTER | OPT_MATRIX
+    options = (old["options"] & structural) | (options & ~structural & ~OPT_CHECKSUM)
+    if options & (OPT_RANDOM_START | OPT_SCATTER) and random_seed is None:
+        raise ValueError("Stego memakai seed, seed dibutuhkan untuk memperbarui payload.")
+    if checksum is not None:
+        options |= OPT_CHECKSUM
+
+    n_lsb, index = old["n_lsb"], old["index"]
+    content_size_bits = len(secret) * 8
+    total_bytes = len(stego) if index is None else len(index)
+    if options & OPT_MATRIX:
+        # k dipilih ulang untuk ukuran payload baru, sama seperti penyisipan awal
+        header_len = len(build_header(1, secret_ext, options, content_size_bits, checksum)) * 8
+        n_lsb = choose_k(total_bytes - old["audio_start"] - header_len, content_size_bits)
+    header = build_header(n_lsb, secret_ext, options, content_size_bits, checksum)
+    header_len = len(header) * 8
+    payload_base, capacity, start = region_layout(
+        options, total_bytes, old["audio_start"], header_len, content_size_bits, n_lsb,
+        random_seed if options & OPT_RANDOM_START else None)
+
+    new = dict(old, options=options, n_lsb=n_lsb, header_len=header_len, content_size=content_size_bits,
+               payload_base=payload_base, capacity=capacity, start=start)
+    if options & OPT_MATRIX:
+        new["matrix"] = n_lsb
+    if options & OPT_SCATTER and capacity != old["capacity"]:
+        new["scatter"] = ScatterPermutation(random_seed, capacity)
+
+    # Tanpa checksum, seed tidak dapat diverifikasi: diff hanya dipakai jika header lama wajar,
+    # selain itu payload ditulis ulang penuh
+    incremental = ((n_lsb, payload_base, capacity, start) ==
+                   (old["n_lsb"], old["payload_base"], old["capacity"], old["start"]) and
+                   (not seeded or old["options"] & OPT_CHECKSUM or plausible_header(old)))
+    runs = [(0, len(secret))]
+    if incremental:
+        common = min(old["content_size"] // 8, len(secret))
+        # Bit lama hanya dibaca; byte cover yang ditulis sebanding dengan selisih payload
+        runs = diff_runs(read_payload(stego, old, 0, common), secret[:common])
+        if len(secret) > common:
+            runs.append((common, len(secret)))
+    with stage("payload_patch", bytes=sum(hi - lo for lo, hi in runs)):
+        for lo, hi in runs:
+            write_payload(stego, new, lo, secret[lo:hi])
+
+    with stage("header_embed", bits=header_len):
+        if index is None:
+            embed_payload(stego, header, old["audio_start"], 0, header_len, 1)
+        else:
+            embed_payload_mapped(index, stego, header, old["audio_start"], 0, header_len, 1)
+
+    return {
+        "incremental": incremental,
+        "payload_bytes": len(secret),
+        "patched_bytes": sum(hi - lo for lo, hi in runs),
+        "runs": len(runs),
+    }
+
+@profiled("extract")
+def extract(stego, random_seed: str | None = None) -> tuple[bytes, str]:
+    """
+    Mengekstrak secret dari stego langsung di memori (tanpa berkas txt sementara)
+    
+    Args:
+        stego (bytes | bytearray | memoryview): isi berkas stego mp3
+        random_seed (str | None): seed yang dipakai saat penyisipan (opsional)
+        
+    Output:
+        tuple (isi berkas rahasia, ekstensi berkas rahasia)
+    """
+    layout = locate_payload(stego, random_seed)
+    current_stage().add(bytes=len(stego), bits=layout["content_size"])
+
+    return read_payload(stego, layout), layout["ext"]
 
-    with open(stego_file, "r") as f:
+@profiled("read_bit_lines")
+def read_bit_lines(path: str) -> tuple[str, bytearray]:
+    """
+    Membaca berkas txt representasi bit (baris pertama ekstensi) menjadi bytearray
+    """
+    with open(path, "r") as f:
         lines = [ln.rstrip("\n") for ln in f.readlines()]
-    stego_ext = lines[0].strip()
-    stego_data_lines = lines[1:]
-    cover_bytes = [line if len(line) >= 8 else line.zfill(8) for line in stego_data_lines]
+    ext = lines[0].strip()
+    return ext, bytearray(int(line, 2) for line in lines[1:] if line.strip())
 
-    audio_start_idx = find_audio_start(cover_bytes)
-    usable_cover_bytes = [list(b) for b in cover_bytes[audio_start_idx:]]  # FIX
-    total_usable_bytes = len(usable_cover_bytes)
+@profiled("sisip")
+def sisip(random_seed: str | None = None, n_lsb: int = 1):
+    """
+    Wrapper kompatibilitas: cover.txt + sisip.txt -> stega.txt
+    """
+    cover_ext, cover_data = read_bit_lines("cover.txt")
+    secret_ext, secret_data = read_bit_lines("sisip.txt")
 
-    # --- Read header sequentially (1 bit per byte) ---
-    fixed_header_len = 16 + 8 + 8 + 8 + 32  # = 72 bits
-    fixed_header_bits = ''.join(usable_cover_bytes[i][-1] for i in range(fixed_header_len))
+    stego = embed(cover_data, bytes(secret_data), secret_ext, random_seed, n_lsb)
 
-    magic = bits_to_int(fixed_header_bits[0:16])
-    if magic != 0x5354:
-        raise ValueError(f"Magic mismatch. Expected 0x5354, got {hex(magic)}")
+    stego_lines = [cover_ext] + [format(b, '08b') for b in stego]
+    with open("stega.txt", "w") as f:
+        f.write("\n".join(stego_lines))
+
+@profiled("ekstrak")
+def ekstrak(random_seed: str | None = None):
+    """
+    Wrapper kompatibilitas: stega.txt -> extracted.txt
+    """
+    _, stego = read_bit_lines("stega.txt")
 
-    n_lsb = bits_to_int(fixed_header_bits[16:24])
-    ext_size = bits_to_int(fixed_header_bits[24:32])
-    options = bits_to_int(fixed_header_bits[32:40])
-    content_size = bits_to_int(fixed_header_bits[40:72])
+    secret, ext_chars = extract(stego, random_seed)
 
-    # extension string
-    ext_bits_len = ext_size * 8
-    ext_bits = ''.join(usable_cover_bytes[fixed_header_len + i][-1] for i in range(ext_bits_len))
-    ext_chars = ''.join(chr(bits_to_int(ext_bits[i:i+8])) for i in range(0, len(ext_bits), 8))
-
-    header_bits_total = fixed_header_len + ext_bits_len
-    available_bytes = total_usable_bytes - header_bits_total
-    total_payload_capacity = available_bytes * n_lsb
-
-    # payload offset
-    use_random_start = bool(options & 0b00000010)
-    if use_random_start and (random_seed is not None):
-        max_start = find_max_start_ekstrak(n_lsb, audio_start_idx, header_bits_total, content_size)
-        random_number = generate_random(random_seed, max_start)
-        
-        start_offset_bit = find_spesific_index(audio_start_idx, header_bits_total, random_number)
-    else:
-        start_offset_bit = 0
-
-    # extract payload
-    extracted_bits = []
-    for j in range(content_size):
-        global_payload_bit_index = (start_offset_bit + j) % total_payload_capacity
-        payload_byte_offset = global_payload_bit_index // n_lsb
-        lsb_pos = global_payload_bit_index % n_lsb
-        source_byte_idx = header_bits_total + payload_byte_offset
-        extracted_bits.append(usable_cover_bytes[source_byte_idx][- (lsb_pos + 1)])
-
-    secret_bits = ''.join(extracted_bits)
-
-    # write out
-    bit_lines = lines_from_bits(secret_bits, 8)
-    with open(output_file, "w") as f:
+    with open("extracted.txt", "w") as f:
         f.write(ext_chars + "\n")
-        for bl in bit_lines:
-            f.write(bl + "\n")
+        for b in secret:
+            f.write(format(b, '08b') + "\n")
 
 if __name__ == "__main__":
     print("start sisip")
-    sisip(use_random_start=False, n_lsb=4)
+    sisip(n_lsb=4)
     print("beres sisip, mulai ekstrak")
     ekstrak()
     print("beres ekstrak")
@@ -0,0 +1,436 @@
+import mmap
+import os
+
+import numpy as np
+
+from Checksum import CHECKSUM_SAMPLE, PayloadChecksum, verify_crc, verify_prefix, verify_stego_prefix
+from Compression import Decompressor, compress_file
+from FileProcessor import read_secret_payload
+from LSBEngine import bit_segments, embed_run, extract_run
+from CoverCache import CoverCache, default_cache, frame_index
+from Profiler import current_stage, profiled, stage
+from Sisip import (MAX_HEADER_LEN, OPT_CHECKSUM, OPT_COMPRESSED, OPT_CONTAINER, OPT_LZMA, OPT_MATRIX,
+                   OPT_RANDOM_START, OPT_SCATTER, build_header, decode_header, embed_into, find_audio_start, locate_payload,
+                   payload_layout, read_header, read_payload, update_into)
+from Vigenere import decrypt_bytes, encrypt_bytes
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+# Ukuran potongan payload terkompresi yang didekompresi per langkah pada extract_range
+RANGE_CHUNK_SIZE = 1 << 16
+
+def scan_audio_start(f, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Mencari index awal audio (sama dengan find_audio_start) dengan membaca per chunk
+
+    Args:
+        f (BinaryIO): berkas mp3 yang dapat di-seek
+        chunk_size (int): ukuran chunk pembacaan dalam byte
+
+    Output:
+        index awal audio, atau 0 jika sync word tidak ditemukan
+    """
+    f.seek(0)
+    pos = 0
+    prev = b''
+    while True:
+        block = f.read(chunk_size)
+        if not block:
+            return 0
+        # Sisakan 1 byte sebelumnya agar sync word di perbatasan chunk tetap terdeteksi
+        idx = find_audio_start(prev + block)
+        if idx:
+            return pos - len(prev) + idx
+        pos += len(block)
+        prev = block[-1:]
+
+def read_at(f, offset: int, length: int) -> bytes:
+    """
+    Membaca length byte mulai dari offset
+    """
+    f.seek(offset)
+    return f.read(length)
+
+def apply_vigenere(data: bytes, key: bytes | None, offset: int, decrypt: bool = False) -> bytes:
+    """
+    Enkripsi/dekripsi vigenere untuk potongan data yang dimulai pada byte ke-offset
+    """
+    if not key:
+        return data
+    return decrypt_bytes(data, key, offset) if decrypt else encrypt_bytes(data, key, offset)
+
+def open_secret(secret_path: str, compression: str = "none", chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Membuka berkas rahasia sebagai sumber payload yang dapat dibaca acak.
+    Jika dikompresi, hasil kompresi streaming ditulis ke berkas sementara
+
+    Output:
+        tuple (file object, ukuran payload dalam byte, bit options kompresi)
+    """
+    raw_size = os.path.getsize(secret_path)
+    f = open(secret_path, 'rb')
+    if compression == "none":
+        return f, raw_size, 0
+    with f:
+        chunks, options = compress_file(f, compression, raw_size, chunk_size)
+        if not options:
+            return open(secret_path, 'rb'), raw_size, 0
+        import tempfile
+        tmp = tempfile.TemporaryFile()
+        for chunk in chunks:
+            tmp.write(chunk)
+    return tmp, tmp.tell(), options
+
+def embed_chunk(chunk: bytearray, c0: int, runs: list[tuple]) -> None:
+    """
+    Menyisipkan bagian run yang byte fisiknya berada di chunk (byte berkas c0 .. c0 + len(chunk))
+
+    Args:
+        chunk (bytearray): potongan cover yang writable
+        c0 (int): offset chunk di berkas
+        runs (list[tuple]): (sumber(offset, length) -> np.ndarray, index bit sumber, index bit ruang payload,
+            panjang, byte awal region, n_lsb)
+    """
+    c1 = c0 + len(chunk)
+    arr = np.frombuffer(chunk, dtype=np.uint8)
+    for source, j, g, length, base, n in runs:
+        lo = max(g, (c0 - base) * n)
+        hi = min(g + length, (c1 - base) * n)
+        if lo >= hi:
+            continue
+        ja = j + (lo - g)
+        s0 = ja >> 3
+        src = source(s0, ((ja + hi - lo + 7) >> 3) - s0)
+        embed_run(arr, src, ja - 8 * s0, lo, hi - lo, base - c0, n)
+
+@profiled("embed_stream")
+def embed_stream(cover_path: str, secret_path: str, output_path: str, random_seed: str | None = None,
+                 n_lsb: int = 1, key: str | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 compression: str = "none", checksum: bool = False) -> None:
+    """
+    Menyisipkan berkas rahasia ke cover per chunk sehingga memori tetap terbatas
+    berapapun ukuran cover. Hasilnya identik dengan Sisip.embed
+
+    Args:
+        cover_path (str): path cover mp3
+        secret_path (str): path berkas rahasia
+        output_path (str): path stego mp3 keluaran
+        random_seed (str | None): seed untuk random start (opsional)
+        n_lsb (int): jumlah LSB yang digunakan (1 - 4)
+        key (str | None): kunci enkripsi vigenere (opsional)
+        chunk_size (int): ukuran chunk cover dalam byte
+        compression (str): none, zlib, lzma, atau auto
+        checksum (bool): simpan CRC32 payload di header (satu lintasan baca tambahan atas secret)
+    """
+    assert 1 <= n_lsb <= 4, "n_lsb must be between 1 and 4"
+    if not cover_path.endswith('.mp3') or not output_path.endswith('.mp3'):
+        raise Exception("File cover atau output harus berekstensi mp3!")
+
+    key_bytes = key.encode("utf-8") if key else None
+    total_bytes = os.path.getsize(cover_path)
+    if total_bytes == 0:
+        raise ValueError("Cover contains no data bytes.")
+    with stage("compress"):
+        fs, secret_size, options = open_secret(secret_path, compression, chunk_size)
+    content_size_bits = secret_size * 8
+    current_stage().add(bytes=total_bytes, bits=content_size_bits)
+
+    with fs, open(cover_path, 'rb') as fc, open(output_path, 'wb') as out:
+        with stage("audio_start"):
+            audio_start_idx = scan_audio_start(fc, chunk_size)
+
+        if random_seed is not None:
+            options |= OPT_RANDOM_START
+        crc = None
+        if checksum:
+            options |= OPT_CHECKSUM
+            with stage("checksum", bytes=secret_size):
+                crc = PayloadChecksum()
+                fs.seek(0)
+                for chunk in iter(lambda: fs.read(chunk_size), b''):
+                    crc.update(chunk)
+                crc = crc.value()
+        header = np.frombuffer(build_header(n_lsb, os.path.splitext(secret_path)[1], options,
+                                            content_size_bits, crc), dtype=np.uint8)
+        header_len = len(header) * 8
+        payload_base, capacity, start_offset_bit = payload_layout(
+            total_bytes, audio_start_idx, header_len, content_size_bits, n_lsb, random_seed)
+
+        def read_secret(offset: int, length: int) -> np.ndarray:
+            data = apply_vigenere(read_at(fs, offset, length), key_bytes, offset)
+            return np.frombuffer(data, dtype=np.uint8)
+
+        # (sumber, index bit sumber, index bit ruang payload, panjang, byte awal, n_lsb)
+        runs = [(lambda offset, length: header[offset:offset + length], 0, 0, header_len, audio_start_idx, 1)]
+        for j, g, length in bit_segments(content_size_bits, start_offset_bit, capacity):
+            runs.append((read_secret, j, g, length, payload_base, n_lsb))
+
+        fc.seek(0)
+        c0 = 0
+        while True:
+            chunk = bytearray(fc.read(chunk_size))
+            if not chunk:
+                break
+            embed_chunk(chunk, c0, runs)
+            out.write(chunk)
+            c0 += len(chunk)
+
+@profiled("extract_stream")
+def extract_stream(stego_path: str, output_path: str, random_seed: str | None = None,
+                   key: str | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE, early_abort: bool = True) -> str:
+    """
+    Mengekstrak berkas rahasia per chunk (hanya byte cover yang memuat payload yang dibaca)
+
+    Args:
+        stego_path (str): path stego mp3
+        output_path (str): path berkas keluaran (ekstensi diganti dengan ekstensi di header)
+        random_seed (str | None): seed yang dipakai saat penyisipan (opsional)
+        key (str | None): kunci dekripsi vigenere (opsional)
+        chunk_size (int): perkiraan ukuran chunk cover dalam byte
+        early_abort (bool): jika header memuat checksum, verifikasi sampel awal payload
+            sebelum berkas keluaran dibuat
+
+    Output:
+        path berkas rahasia yang ditulis. Jika checksum tidak cocok, berkas keluaran dihapus
+        dan ValueError dilempar
+    """
+    if not stego_path.endswith('.mp3'):
+        raise Exception("File audio harus berekstensi mp3!")
+
+    key_bytes = key.encode("utf-8") if key else None
+    total_bytes = os.path.getsize(stego_path)
+
+    with open(stego_path, 'rb') as f:
+        with stage("read_header"):
+            audio_start_idx = scan_audio_start(f, chunk_size)
+            try:
+                header = decode_header(read_at(f, audio_start_idx, MAX_HEADER_LEN), audio_start_idx)
+            except ValueError as err:
+                # Header stego frame-aware berada di main data frame, bukan di awal audio
+                from Probe import read_frame_aware_header
+                try:
+                    read_frame_aware_header(f)
+                except ValueError:
+                    raise err
+                raise ValueError("Mode frame-aware tidak didukung ekstraksi streaming, gunakan Sisip.extract.")
+        if header["options"] & OPT_SCATTER:
+            raise ValueError("Mode scatter tidak didukung ekstraksi streaming, gunakan Sisip.extract.")
+        if header["options"] & OPT_MATRIX:
+            raise ValueError("Mode matrix tidak didukung ekstraksi streaming, gunakan Sisip.extract.")
+        n_lsb = header["n_lsb"]
+        content_size = header["content_size"]
+        current_stage().add(bytes=(content_size + 7) // 8, bits=content_size)
+
+        use_random_start = bool(header["options"] & OPT_RANDOM_START)
+        payload_base, capacity, start_offset_bit = payload_layout(
+            total_bytes, audio_start_idx, header["header_len"], content_size, n_lsb,
+            random_seed if use_random_start else None)
+        segments = list(bit_segments(content_size, start_offset_bit, capacity))
+
+        def extract_bits(ja: int, jb: int) -> bytes:
+            # Bit payload [ja, jb) dari seluruh segmen, dibaca hanya byte cover yang diperlukan
+            bits = np.zeros(jb - ja, dtype=np.uint8)
+            for j, g, length in segments:
+                lo = max(j, ja)
+                hi = min(j + length, jb)
+                if lo >= hi:
+                    continue
+                g_lo = g + (lo - j)
+                p0 = payload_base + g_lo // n_lsb
+                p1 = payload_base + (g_lo + hi - lo - 1) // n_lsb + 1
+                arr = np.frombuffer(read_at(f, p0, p1 - p0), dtype=np.uint8)
+                extract_run(arr, bits, lo - ja, g_lo, hi - lo, payload_base - p0, n_lsb)
+            return np.packbits(bits).tobytes()
+
+        has_checksum = bool(header["options"] & OPT_CHECKSUM)
+        if has_checksum and early_abort:
+            with stage("verify_prefix"):
+                verify_prefix(extract_bits(0, min(CHECKSUM_SAMPLE * 8, content_size)), header, key)
+
+        output_path = os.path.splitext(output_path)[0] + header["ext"]
+        step = max(8, chunk_size * n_lsb // 8 * 8)
+        decompressor = Decompressor(header["options"]) if header["options"] & OPT_COMPRESSED else None
+        crc = PayloadChecksum() if has_checksum else None
+        try:
+            with open(output_path, 'wb') as out:
+                # Diproses berurutan menurut bit payload agar keluaran ditulis sekuensial
+                for ja in range(0, content_size, step):
+                    data = apply_vigenere(extract_bits(ja, min(ja + step, content_size)), key_bytes, ja >> 3,
+                                          decrypt=True)
+                    if crc:
+                        crc.update(data)
+                    out.write(decompressor.update(data) if decompressor else data)
+                if crc:
+                    verify_crc(crc.crc, header["crc32"])
+                if decompressor:
+                    out.write(decompressor.finish())
+        except Exception:
+            os.remove(output_path)
+            raise
+
+    return output_path
+
+def read_compressed_range(stego, layout: dict, offset: int, length: int | None, key: str | None = None,
+                          chunk_size: int = RANGE_CHUNK_SIZE) -> bytes:
+    """
+    Rentang berkas rahasia dari payload terkompresi: payload didekompresi berurutan dari awal dan
+    berhenti setelah byte offset + length dihasilkan (dibaca sampai akhir jika length None).
+    Ukuran asli baru diketahui di akhir, sehingga rentang di luar berkas terdeteksi setelah dekompresi
+    """
+    if offset < 0:
+        raise ValueError("Offset negatif tidak didukung untuk payload terkompresi (ukuran asli tidak diketahui).")
+    key_bytes = key.encode("utf-8") if key else None
+    end = None if length is None else offset + length
+    payload_bytes = layout["content_size"] // 8
+    decompressor = Decompressor(layout["options"])
+    crc = PayloadChecksum() if layout["crc32"] is not None else None
+    out = bytearray()
+    produced = pos = 0
+    while pos < payload_bytes and (end is None or produced < end):
+        n = min(chunk_size, payload_bytes - pos)
+        data = apply_vigenere(read_payload(stego, layout, pos, n), key_bytes, pos, decrypt=True)
+        if crc:
+            crc.update(data)
+        plain = decompressor.update(data)
+        pos += n
+        if pos == payload_bytes:
+            plain += decompressor.finish()
+        out += plain[max(0, offset - produced):None if end is None else end - produced]
+        produced += len(plain)
+    if crc and pos == payload_bytes:
+        verify_crc(crc.crc, layout["crc32"])
+    if produced < (offset if end is None else end):
+        raise ValueError("Rentang di luar berkas rahasia.")
+    return bytes(out)
+
+@profiled("extract_range")
+def extract_range(stego_path: str, offset: int = 0, length: int | None = None, random_seed: str | None = None,
+                  key: str | None = None, cache: CoverCache | None = None) -> tuple[bytes, str]:
+    """
+    Mengekstrak sebagian berkas rahasia (byte offset .. offset + length) tanpa mengekstrak seluruh payload.
+    Posisi byte cover untuk bit rentang tersebut dihitung langsung (n_lsb, random start, wrap-around,
+    scatter, frame-aware) sehingga hanya halaman mmap yang memuatnya yang dibaca. Payload terkompresi
+    harus didekompresi dari awal, biayanya sebanding offset + length
+
+    Args:
+        stego_path (str): path stego mp3
+        offset (int): byte awal di berkas rahasia; negatif = dihitung dari akhir (payload tanpa kompresi)
+        length (int | None): jumlah byte (None = sampai akhir berkas rahasia)
+        random_seed (str | None): seed yang dipakai saat penyisipan (opsional)
+        key (str | None): kunci dekripsi vigenere (opsional)
+        cache (CoverCache | None): cache indeks frame untuk stego frame-aware (None = default_cache())
+
+    Output:
+        tuple (isi rentang, ekstensi berkas rahasia). Rentang yang melewati akhir berkas melempar
+        ValueError; CRC32 seluruh payload hanya diperiksa jika rentang mencakup seluruh payload
+    """
+    if not stego_path.endswith('.mp3'):
+        raise Exception("File audio harus berekstensi mp3!")
+    if length is not None and length < 0:
+        raise ValueError("Panjang rentang tidak boleh negatif.")
+
+    with open(stego_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as stego:
+        index = None
+        audio_start_idx = find_audio_start(stego)
+        try:
+            decode_header(memoryview(stego)[audio_start_idx:], audio_start_idx)
+        except ValueError:
+            # Header tidak di awal audio (kemungkinan frame-aware): indeks frame diambil dari cache
+            # agar tidak membangun ulang indeks seluruh berkas setiap pemanggilan
+            index = frame_index((cache or default_cache()).analyze(stego_path, frames=True))
+        layout = locate_payload(stego, random_seed, index)
+        if layout["options"] & OPT_CONTAINER:
+            raise ValueError("Stego berisi container, gunakan Cli.py unpack.")
+        verify_stego_prefix(stego, layout, key)
+
+        if layout["options"] & OPT_COMPRESSED:
+            return read_compressed_range(stego, layout, offset, length, key), layout["ext"]
+
+        payload_bytes = layout["content_size"] // 8
+        if offset < 0:
+            offset = max(0, payload_bytes + offset)
+        if offset > payload_bytes or (length is not None and offset + length > payload_bytes):
+            raise ValueError("Rentang di luar berkas rahasia.")
+        length = payload_bytes - offset if length is None else length
+        current_stage().add(bytes=length, bits=length * 8)
+        data = read_payload(stego, layout, offset, length)
+    if key:
+        data = decrypt_bytes(data, key, offset)
+    if length == payload_bytes and layout["crc32"] is not None:
+        crc = PayloadChecksum()
+        crc.update(data)
+        verify_crc(crc.crc, layout["crc32"])
+    return data, layout["ext"]
+
+@profiled("embed_mmap")
+def embed_mmap(cover_path: str, secret: bytes, secret_ext: str, output_path: str,
+               random_seed: str | None = None, n_lsb: int = 1, frame_aware: bool = False,
+               options: int = 0, checksum: tuple[int, int] | None = None, analysis: dict | None = None) -> None:
+    """
+    Menyalin cover ke output_path lalu menyisipkan secret secara in-place lewat mmap.
+    Hanya halaman yang memuat byte tersentuh yang dimodifikasi; flush diserahkan ke OS
+
+    Args:
+        cover_path (str): path cover mp3
+        secret (bytes): isi berkas rahasia (sudah dienkripsi jika perlu)
+        secret_ext (str): ekstensi berkas rahasia, contoh ".txt"
+        output_path (str): path stego mp3 keluaran
+        random_seed (str | None): seed untuk random start (opsional)
+        n_lsb (int): jumlah LSB yang digunakan (1 - 4)
+        frame_aware (bool): hanya menyisipkan ke main data frame MP3
+        options (int): bit options tambahan pada header, contoh OPT_CONTAINER
+        checksum (tuple[int, int] | None): CRC32 payload sebelum enkripsi (opsional)
+        analysis (dict | None): hasil CoverCache.analyze untuk cover ini (awal audio dan indeks frame
+            tidak dihitung ulang)
+    """
+    if not cover_path.endswith('.mp3') or not output_path.endswith('.mp3'):
+        raise Exception("File cover atau output harus berekstensi mp3!")
+    cover_size = os.path.getsize(cover_path)
+    if cover_size == 0:
+        raise ValueError("Cover contains no data bytes.")
+    current_stage().add(bytes=cover_size, bits=len(secret) * 8)
+
+    import shutil
+    with stage("copy", bytes=cover_size):
+        shutil.copyfile(cover_path, output_path)
+    try:
+        with open(output_path, 'r+b') as f, mmap.mmap(f.fileno(), 0) as mm:
+            if analysis is None:
+                embed_into(mm, secret, secret_ext, random_seed, n_lsb, frame_aware, options, checksum)
+            else:
+                embed_into(mm, secret, secret_ext, random_seed, n_lsb, frame_aware, options, checksum,
+                           analysis["audio_start"], frame_index(analysis) if frame_aware else None)
+    except Exception:
+        os.remove(output_path)
+        raise
+
+def update_file(stego_path: str, secret_path: str, random_seed: str | None = None, key: str | None = None,
+                compression: str | None = None, checksum: bool | None = None) -> dict:
+    """
+    Mengganti berkas rahasia pada stego yang sudah ada secara in-place lewat mmap. Jika tata letak
+    payload tidak berubah, hanya byte cover milik bagian payload yang berbeda yang ditulis ulang
+    (berguna untuk perubahan kecil; payload terkompresi biasanya berubah total setelah titik edit)
+
+    Args:
+        stego_path (str): path stego mp3 yang diperbarui
+        secret_path (str): path berkas rahasia baru
+        random_seed (str | None): seed yang dipakai saat penyisipan awal
+        key (str | None): kunci enkripsi vigenere (opsional)
+        compression (str | None): none, zlib, lzma, atau auto (None = mengikuti header lama)
+        checksum (bool | None): sertakan CRC32 payload (None = mengikuti header lama)
+
+    Output:
+        dict statistik update (lihat Sisip.update_into)
+    """
+    if not stego_path.endswith('.mp3'):
+        raise Exception("File stego harus berekstensi mp3!")
+    with open(stego_path, 'r+b') as f, mmap.mmap(f.fileno(), 0) as mm:
+        old_options = read_header(mm)["options"]
+        if compression is None:
+            compression = "none"
+            if old_options & OPT_COMPRESSED:
+                compression = "lzma" if old_options & OPT_LZMA else "zlib"
+        if checksum is None:
+            checksum = bool(old_options & OPT_CHECKSUM)
+        payload = read_secret_payload(secret_path, key, compression, checksum)
+        return update_into(mm, payload["data"], payload["ext"], random_seed, payload["options"],
+                           payload["checksum"], key)
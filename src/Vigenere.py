@@ -1,3 +1,5 @@
+import numpy as np
+
 def encrypt_vigenere(plain: int, key: int) -> int:
     """
     Mengenkripsi satu byte plain dengan satu byte key
@@ -22,4 +24,73 @@ def decrypt_vigenere(cipher: int, key: int) -> int:
     Output:
         satu byte plaintext
     """
-    return (cipher - key) % 256
\ No newline at end of file
+    return (cipher - key) % 256
+
+def _key_bytes(key: bytes | str) -> bytes:
+    return key.encode("utf-8") if isinstance(key, str) else bytes(key)
+
+def keystream(key: bytes | str, offset: int, length: int) -> np.ndarray:
+    """
+    Membentuk keystream dengan mengulang key, dimulai dari byte ke-offset
+    
+    Args: 
+        key (bytes | str): kunci (str di-encode UTF-8)
+        offset (int): posisi byte awal data terhadap awal berkas
+        length (int): panjang keystream
+        
+    Output:
+        array uint8 key[(offset + i) % len(key)] untuk i = 0..length-1
+    """
+    key = np.frombuffer(_key_bytes(key), dtype=np.uint8)
+    if len(key) == 0:
+        raise ValueError("Key tidak boleh kosong.")
+    start = offset % len(key)
+    reps = (start + length + len(key) - 1) // len(key)
+    return np.tile(key, reps)[start:start + length]
+
+def encrypt_bytes(data: bytes, key: bytes | str, offset: int = 0) -> bytes:
+    """
+    Mengenkripsi seluruh buffer sekaligus, identik dengan encrypt_vigenere per byte
+    
+    Args: 
+        data (bytes): plaintext
+        key (bytes | str): kunci
+        offset (int): posisi byte awal data (untuk potongan/chunk di tengah berkas)
+        
+    Output:
+        ciphertext
+    """
+    plain = np.frombuffer(data, dtype=np.uint8)
+    # Penjumlahan uint8 otomatis modulo 256
+    return (plain + keystream(key, offset, len(plain))).tobytes()
+
+def decrypt_bytes(data: bytes, key: bytes | str, offset: int = 0) -> bytes:
+    """
+    Mendekripsi seluruh buffer sekaligus, identik dengan decrypt_vigenere per byte
+    
+    Args: 
+        data (bytes): ciphertext
+        key (bytes | str): kunci
+        offset (int): posisi byte awal data (untuk potongan/chunk di tengah berkas)
+        
+    Output:
+        plaintext
+    """
+    cipher = np.frombuffer(data, dtype=np.uint8)
+    return (cipher - keystream(key, offset, len(cipher))).tobytes()
+
+class VigenereStream:
+    """
+    Enkripsi/dekripsi per chunk berurutan; posisi key dibawa antar chunk
+    """
+
+    def __init__(self, key: bytes | str, decrypt: bool = False, offset: int = 0):
+        self.key = _key_bytes(key)
+        self.decrypt = decrypt
+        self.offset = offset
+
+    def update(self, chunk: bytes) -> bytes:
+        fn = decrypt_bytes if self.decrypt else encrypt_bytes
+        out = fn(chunk, self.key, self.offset)
+        self.offset += len(chunk)
+        return out
@@ -0,0 +1,26 @@
+import os
+import sys
+
+import pytest
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC)
+
+@pytest.fixture(scope="session")
+def src_dir() -> str:
+    return SRC
+
+@pytest.fixture(scope="session")
+def cover_path() -> str:
+    """
+    Path cover mp3 contoh (src/sound/campina.mp3)
+    """
+    return os.path.join(SRC, "sound", "campina.mp3")
+
+@pytest.fixture(scope="session")
+def cover(cover_path) -> bytes:
+    """
+    Isi cover mp3 contoh, dibaca sekali per sesi test
+    """
+    with open(cover_path, 'rb') as f:
+        return f.read()
@@ -0,0 +1,59 @@
+import csv
+import json
+
+import pytest
+
+import CoverCache
+from Batch import main_batch, read_manifest, run_batch
+from Sisip import extract
+
+@pytest.fixture
+def manifest(tmp_path, monkeypatch, cover):
+    monkeypatch.setattr(CoverCache, "_default", CoverCache.CoverCache(str(tmp_path / "cache")))
+    covers = tmp_path / "covers"
+    covers.mkdir()
+    (covers / "besar.mp3").write_bytes(cover)
+    (tmp_path / "kecil.mp3").write_bytes(cover[:4096])
+    (tmp_path / "rahasia.txt").write_bytes(b"isi rahasia batch\n" * 100)
+    rows = [
+        {"cover": str(covers), "secret": str(tmp_path / "rahasia.txt"), "output": str(tmp_path / "ok.mp3"),
+         "n_lsb": "2", "key": "", "seed": "s"},
+        {"cover": str(tmp_path / "kecil.mp3"), "secret": str(tmp_path / "rahasia.txt"),
+         "output": str(tmp_path / "gagal.mp3"), "n_lsb": "1", "key": "kunci", "seed": ""},
+    ]
+    path = tmp_path / "manifest.csv"
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    return str(path)
+
+def test_read_manifest_defaults(manifest):
+    jobs = read_manifest(manifest)
+    assert [j["job"] for j in jobs] == [0, 1]
+    assert jobs[0]["seed"] == "s" and jobs[0]["key"] is None and jobs[0]["n_lsb"] == 2
+    assert jobs[1]["seed"] is None and jobs[1]["key"] == "kunci"
+    assert jobs[0]["checksum"] and jobs[0]["compression"] == "none" and not jobs[0]["matrix"]
+
+def test_read_manifest_missing_columns(tmp_path):
+    path = tmp_path / "manifest.csv"
+    path.write_text("cover,secret\na.mp3,b.txt\n")
+    with pytest.raises(ValueError, match="output, n_lsb"):
+        read_manifest(str(path))
+
+def test_run_batch_reports_ok_and_error(tmp_path, manifest):
+    ok, err = run_batch(read_manifest(manifest), workers=1)
+    assert ok["status"] == "ok" and ok["cover"].endswith("besar.mp3") and ok["secret_bytes"] == 1800
+    with open(ok["output"], 'rb') as f:
+        assert extract(f.read(), "s") == (b"isi rahasia batch\n" * 100, ".txt")
+    assert err["status"] == "error" and "Cover tidak cukup" in err["error"]
+    assert not (tmp_path / "gagal.mp3").exists()
+
+@pytest.mark.parametrize("report", ["laporan.csv", "laporan.json"])
+def test_main_batch_writes_report(tmp_path, manifest, report, capsys):
+    path = str(tmp_path / report)
+    assert main_batch(manifest, 1, path) == 1
+    assert "1/2 job berhasil" in capsys.readouterr().out
+    with open(path, newline='') as f:
+        rows = list(csv.DictReader(f)) if report.endswith(".csv") else [json.loads(line) for line in f]
+    assert [r["status"] for r in rows] == ["ok", "error"]
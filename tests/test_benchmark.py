@@ -0,0 +1,37 @@
+import pytest
+
+from Benchmark import find_regressions, load_results, parse_importtime, write_results
+
+def row(stage: str, seconds: float, n_lsb: int = 1, mb_per_s: float | None = 10.0) -> dict:
+    return {"cover_bytes": 1000, "secret_bytes": 100, "n_lsb": n_lsb, "random_start": False, "stage": stage,
+            "seconds": seconds, "mb_per_s": mb_per_s}
+
+def test_find_regressions_threshold_and_noise_floor():
+    baseline = [row("read", 0.010), row("extract", 0.010), row("write", 0.0002), row("psnr", 0.010)]
+    rows = [row("read", 0.0124), row("extract", 0.0130), row("write", 0.0008), row("psnr", 0.005),
+            row("read", 0.050, n_lsb=2)]
+    regressions = find_regressions(rows, baseline, threshold=0.25)
+    # read +24% di bawah batas, write di bawah min_seconds, n_lsb 2 tidak ada di baseline
+    assert [(r["stage"], r["baseline"], r["ratio"]) for r in regressions] == [("extract", 0.010, 1.3)]
+    assert [r["stage"] for r in find_regressions(rows, baseline, 0.25, min_seconds=1e-4)] == ["extract", "write"]
+
+def test_find_regressions_skips_zero_baseline():
+    assert find_regressions([row("read", 0.5)], [row("read", 0.0)]) == []
+
+@pytest.mark.parametrize("name", ["hasil.csv", "hasil.json"])
+def test_results_round_trip(tmp_path, name):
+    rows = [row("read", 0.012345), row("header_embed", 0.000123, mb_per_s=None)]
+    path = str(tmp_path / name)
+    write_results(rows, path)
+    assert load_results(path) == rows
+
+def test_parse_importtime():
+    stderr = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |   zlib",
+        "import time:      3000 |      45000 | numpy",
+        "import time:       500 |      47000 | Stream",
+        "import time:        10 |         10 |   zlib",
+        "bukan baris importtime",
+    ])
+    assert parse_importtime(stderr) == {"zlib": 120, "numpy": 45000, "Stream": 47000}
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from BitBuffer import BitBuffer
+from Sisip import OPT_CHECKSUM, OPT_RANDOM_START, build_header, decode_header
+
+def baseline_header_bits(n_lsb: int, ext: str, options: int, content_size_bits: int) -> str:
+    """
+    Header sebagai string bit seperti program awal (int_to_bits per field)
+    """
+    return (f"{0x5354:016b}{n_lsb:08b}{len(ext):08b}{options:08b}{content_size_bits:032b}"
+            + ''.join(f"{ord(c):08b}" for c in ext))
+
+def pack(bits: str) -> bytes:
+    return np.packbits(np.array([int(b) for b in bits], dtype=np.uint8)).tobytes()
+
+@pytest.mark.parametrize("n_lsb,ext,options,size", [(1, ".txt", 0, 2344), (3, ".docx", OPT_RANDOM_START, 113256),
+                                                    (4, "", 0, 0), (2, ".c" * 100, 0, (1 << 32) - 1)])
+def test_header_bytes_match_baseline_bits(n_lsb, ext, options, size):
+    bits = baseline_header_bits(n_lsb, ext, options, size)
+    assert build_header(n_lsb, ext, options, size) == pack(bits)
+    checksum = (0x12345678, 0x9ABCDEF0)
+    with_crc = bits + f"{checksum[0]:032b}{checksum[1]:032b}"
+    assert build_header(n_lsb, ext, options | OPT_CHECKSUM, size, checksum) == pack(
+        with_crc[:32] + f"{options | OPT_CHECKSUM:08b}" + with_crc[40:])
+
+def test_decode_header_reads_lsbs():
+    header = build_header(2, ".png", OPT_CHECKSUM, 4096, (1, 2))
+    lsbs = np.unpackbits(np.frombuffer(header, dtype=np.uint8)) | 0b10
+    decoded = decode_header(lsbs.tobytes(), 7)
+    assert (decoded["n_lsb"], decoded["ext"], decoded["content_size"], decoded["prefix_crc"], decoded["crc32"]) == (
+        2, ".png", 4096, 1, 2)
+
+def test_unaligned_fields_roundtrip():
+    buf = BitBuffer()
+    buf.write(0b101, 3)
+    buf.write_bytes(b"\xffab")
+    buf.write(0x1234, 13)
+    assert len(buf) == 3 + 24 + 13
+    reader = BitBuffer(buf.to_bytes(), len(buf))
+    assert (reader.read(3), reader.read_bytes(3), reader.read(13)) == (0b101, b"\xffab", 0x1234)
+    with pytest.raises(ValueError):
+        reader.read(1)
+    with pytest.raises(ValueError):
+        buf.write(8, 3)
@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+
+from Checksum import CHECKSUM_SAMPLE, PayloadChecksum, checksum_of, verify_stego_prefix
+from Sisip import embed, locate_payload
+from Vigenere import encrypt_bytes
+
+SECRET = np.random.default_rng(14).integers(0, 256, 3 * CHECKSUM_SAMPLE + 17, dtype=np.uint8).tobytes()
+
+def test_chunked_checksum_matches_whole_buffer():
+    checksum = PayloadChecksum()
+    for lo in range(0, len(SECRET), 1000):
+        checksum.update(SECRET[lo:lo + 1000])
+    assert checksum.value() == checksum_of(SECRET)
+    assert checksum_of(SECRET)[0] == checksum_of(SECRET[:CHECKSUM_SAMPLE])[1]
+
+def test_prefix_check_rejects_wrong_key_and_seed(cover):
+    stego = embed(cover, encrypt_bytes(SECRET, "kunci"), ".bin", "seed", 2, False, 0, checksum_of(SECRET))
+    verify_stego_prefix(stego, locate_payload(stego, "seed"), "kunci")
+    with pytest.raises(ValueError, match="Checksum"):
+        verify_stego_prefix(stego, locate_payload(stego, "seed"), "kuncj")
+    with pytest.raises(ValueError, match="Checksum"):
+        verify_stego_prefix(stego, locate_payload(stego, "bukan"), "kunci")
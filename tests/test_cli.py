@@ -0,0 +1,41 @@
+import pytest
+
+import Cli
+from Checksum import checksum_of
+from Sisip import embed
+
+def test_range_reports_non_stego(cover_path, capsys):
+    assert Cli.main(["range", cover_path]) == 1
+    assert "Magic mismatch" in capsys.readouterr().err
+
+def test_update_rejects_wrong_seed(tmp_path, cover, capsys):
+    secret = b"rahasia " * 100
+    stego = tmp_path / "stego.mp3"
+    stego.write_bytes(embed(cover, secret, ".txt", "benar", 1, checksum=checksum_of(secret)))
+    before = stego.read_bytes()
+    (tmp_path / "baru.txt").write_bytes(secret.upper())
+    assert Cli.main(["update", str(stego), str(tmp_path / "baru.txt"), "-s", "salah"]) == 1
+    assert "Checksum payload tidak cocok" in capsys.readouterr().err
+    assert stego.read_bytes() == before
+
+def test_unpack_reports_non_container(tmp_path, cover, capsys):
+    stego = tmp_path / "stego.mp3"
+    stego.write_bytes(embed(cover, b"bukan container", ".txt"))
+    assert Cli.main(["unpack", str(stego), "-o", str(tmp_path)]) == 1
+    assert "Stego tidak berisi container" in capsys.readouterr().err
+    assert Cli.main(["unpack", str(stego), "--list"]) == 1
+
+def test_pack_reports_small_cover(tmp_path, cover_path, capsys):
+    secret = tmp_path / "besar.bin"
+    secret.write_bytes(bytes(2_000_000))
+    output = tmp_path / "stego.mp3"
+    assert Cli.main(["pack", cover_path, str(output), str(secret)]) == 1
+    assert "Cover tidak cukup" in capsys.readouterr().err
+    assert not output.exists()
+
+def test_n_lsb_out_of_range_is_rejected(capsys):
+    for argv in (["embed", "--secret", "x.txt", "-n", "0"], ["pack", "a.mp3", "b.mp3", "c.txt", "-n", "9"]):
+        with pytest.raises(SystemExit) as exc:
+            Cli.main(argv)
+        assert exc.value.code == 2
+        assert "invalid choice" in capsys.readouterr().err
@@ -0,0 +1,29 @@
+import io
+
+import numpy as np
+
+from Compression import compress_file, decompress_chunks
+from Sisip import OPT_COMPRESSED, OPT_LZMA
+
+def auto(data: bytes) -> tuple[bytes, int]:
+    chunks, options = compress_file(io.BytesIO(data), "auto", len(data), chunk_size=4096)
+    return b''.join(chunks), options
+
+def test_auto_skips_incompressible_data():
+    data = np.random.default_rng(0).integers(0, 256, 50000, dtype=np.uint8).tobytes()
+    assert auto(data) == (data, 0)
+
+def test_auto_picks_zlib_for_short_text():
+    data = b"pesan rahasia yang cukup panjang. " * 200
+    payload, options = auto(data)
+    assert options == OPT_COMPRESSED
+    assert b''.join(decompress_chunks([payload], options)) == data
+
+def test_auto_picks_lzma_for_long_range_repeats():
+    # Blok acak 40 KB diulang: jarak pengulangan di luar window 32 KB zlib
+    block = np.random.default_rng(1).integers(0, 256, 40000, dtype=np.uint8).tobytes()
+    data = block * 4
+    payload, options = auto(data)
+    assert options == OPT_COMPRESSED | OPT_LZMA
+    assert len(payload) < len(block) * 1.1
+    assert b''.join(decompress_chunks([payload], options)) == data
@@ -0,0 +1,51 @@
+import os
+import zlib
+
+import pytest
+
+from Container import embed_many, extract_entry, list_entries, load_entries, pack_files, unpack_file
+from Sisip import locate_payload
+
+@pytest.fixture
+def secrets(tmp_path):
+    paths = []
+    for name, data in (("satu.txt", b"isi berkas pertama\n" * 40), ("dua.bin", bytes(range(256)) * 8)):
+        path = tmp_path / name
+        path.write_bytes(data)
+        paths.append(str(path))
+    return paths
+
+def test_extract_entry_by_index_and_name(cover, secrets):
+    stego = embed_many(cover, load_entries(secrets, "kunci"), "s", 2)
+    assert [e["name"] + e["ext"] for e in list_entries(stego, "s")] == ["satu.txt", "dua.bin"]
+    with open(secrets[1], 'rb') as f:
+        expected = f.read()
+    assert extract_entry(stego, 1, "s", "kunci") == (expected, "dua.bin")
+    assert extract_entry(stego, "dua", "s", "kunci") == (expected, "dua.bin")
+    assert extract_entry(stego, "dua.bin", "s", "kunci") == (expected, "dua.bin")
+
+def test_entry_crc_covers_plaintext(cover, secrets):
+    entries = load_entries(secrets, "kunci")
+    with open(secrets[0], 'rb') as f:
+        assert entries[0]["crc32"] == zlib.crc32(f.read())
+    stego = embed_many(cover, entries)
+    with pytest.raises(ValueError, match="Checksum tidak cocok untuk satu.txt"):
+        extract_entry(stego, 0, None, "bukan")
+
+def test_extract_entry_detects_corruption(cover, secrets):
+    stego = embed_many(cover, load_entries(secrets))
+    entry = list_entries(stego)[0]
+    # n_lsb 1 tanpa seed: bit payload ke-j berada di LSB byte cover payload_base + j
+    layout = locate_payload(stego)
+    stego[layout["payload_base"] + entry["offset"] * 8] ^= 1
+    with pytest.raises(ValueError, match="Checksum tidak cocok"):
+        extract_entry(stego, 0)
+    assert extract_entry(stego, 1)[1] == "dua.bin"
+
+def test_unpack_selected_entry(tmp_path, cover_path, secrets):
+    stego = str(tmp_path / "stego.mp3")
+    pack_files(cover_path, secrets, stego, "s", 1, "kunci")
+    written = unpack_file(stego, str(tmp_path / "out"), ["satu"], "s", "kunci")
+    assert [os.path.basename(p) for p in written] == ["satu.txt"]
+    with open(written[0], 'rb') as f, open(secrets[0], 'rb') as g:
+        assert f.read() == g.read()
@@ -0,0 +1,52 @@
+from CoverCache import CoverCache, capacity_bytes, frame_index, pack_index, unpack_index
+from Planner import UsableIndex
+from Stream import embed_mmap, extract_range
+
+def unwritable_cache(tmp_path) -> CoverCache:
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("x")
+    return CoverCache(str(blocker / "cache"))
+
+def test_analyze_survives_unwritable_cache_dir(tmp_path, cover_path):
+    cache = unwritable_cache(tmp_path)
+    analysis = cache.analyze(cover_path, frames=True)
+    assert analysis["usable_bytes"] > 0
+    assert cache.analyze(cover_path, frames=True) is analysis
+    assert capacity_bytes(analysis, 2, ".txt") > 0
+    assert not any(p.name.endswith(".tmp") for p in tmp_path.iterdir())
+
+def test_frame_aware_extract_range_with_unwritable_cache(tmp_path, cover_path):
+    secret = bytes(range(256)) * 8
+    stego = str(tmp_path / "stego.mp3")
+    embed_mmap(cover_path, secret, ".bin", stego, "s", 2, frame_aware=True)
+    data, ext = extract_range(stego, 100, 50, "s", cache=unwritable_cache(tmp_path))
+    assert (data, ext) == (secret[100:150], ".bin")
+
+def test_disk_roundtrip_and_lru(tmp_path, cover_path):
+    cache = CoverCache(str(tmp_path / "c"))
+    first = cache.analyze(cover_path)
+    fresh = CoverCache(str(tmp_path / "c"))
+    assert fresh.analyze(cover_path) == first
+    assert fresh.stats()["entries"] == 1
+
+def test_evict_rescans_only_past_the_limit(tmp_path, monkeypatch):
+    cache = CoverCache(str(tmp_path / "c"), max_bytes=100 * 200)
+    scans = []
+    evict = cache.evict
+    monkeypatch.setattr(cache, "evict", lambda: (scans.append(1), evict()))
+    for i in range(300):
+        cache.store(f"k{i}", {"version": 0, "key": f"k{i}", "pad": "x" * 150})
+    assert cache.stats()["bytes"] <= cache.max_bytes
+    assert len(scans) < 300 // 10
+
+def test_frame_index_roundtrip_is_compact(tmp_path, cover_path, cover):
+    analysis = CoverCache(str(tmp_path / "c")).analyze(cover_path, frames=True)
+    index = UsableIndex.from_data(cover)
+    restored = frame_index(analysis)
+    assert (restored.starts, restored.lengths, len(restored)) == (index.starts, index.lengths, len(index))
+    assert len(analysis["frames"]) < len(index.starts) * 2
+
+def test_pack_index_above_4gib():
+    base = 5 << 30
+    index = unpack_index(pack_index(UsableIndex([base, base + 5000], [400, 600])))
+    assert list(index.starts) == [base, base + 5000] and list(index.lengths) == [400, 600]
@@ -0,0 +1,25 @@
+from FrameParser import index_frames, parse_frame_header
+from Planner import UsableIndex
+
+# MPEG1 layer III, 128 kbps, 44.1 kHz, tanpa CRC dan padding, joint stereo: 417 byte, side info 32 byte
+HEADER = bytes([0xFF, 0xFB, 0x90, 0x64])
+FRAME_LEN = 417
+
+def test_parse_frame_header_fields():
+    frame = parse_frame_header(HEADER + bytes(FRAME_LEN - 4), 0)
+    assert (frame.offset, frame.length, frame.header_len, frame.side_info_len) == (0, FRAME_LEN, 4, 32)
+    assert parse_frame_header(b"\xff\xe0\x00\x00" + bytes(100), 0) is None
+
+def test_index_frames_skips_garbage_and_truncated_tail():
+    frame = HEADER + bytes(FRAME_LEN - 4)
+    data = b"\x12\xff\x00" * 5 + frame * 3 + frame[:100]
+    frames = index_frames(data)
+    assert [f.offset for f in frames] == [15, 15 + FRAME_LEN, 15 + 2 * FRAME_LEN]
+    assert [f.main_data_start for f in frames] == [f.offset + 36 for f in frames]
+
+def test_cover_frames_are_contiguous(cover):
+    frames = index_frames(cover)
+    assert len(frames) > 100
+    assert all(a.end == b.offset for a, b in zip(frames, frames[1:]))
+    assert frames[-1].end <= len(cover)
+    assert len(UsableIndex.from_frames(frames)) == sum(f.end - f.main_data_start for f in frames)
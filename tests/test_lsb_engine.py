@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+import LSBEngine
+from LSBEngine import embed_payload, extract_payload, partition, set_threads
+
+@pytest.fixture
+def threads(monkeypatch):
+    monkeypatch.setattr(LSBEngine, "PARALLEL_MIN_BITS", 64)
+    set_threads(4)
+    yield
+    set_threads(1)
+
+def touched_bytes(runs, n_lsb):
+    return {g // n_lsb for _, start, length in runs for g in range(start, start + length)}
+
+@pytest.mark.parametrize("n_lsb,start", [(3, 4), (2, 1), (4, 7)])
+def test_partition_tasks_never_share_a_cover_byte(threads, n_lsb, start):
+    capacity = 3000 * n_lsb
+    n_bits = capacity - 1
+    tasks = partition(n_bits, start, capacity, n_lsb)
+    assert len(tasks) > 1
+    seen = set()
+    for runs in tasks:
+        touched = touched_bytes(runs, n_lsb)
+        assert not touched & seen
+        seen |= touched
+    assert sum(length for runs in tasks for _, _, length in runs) == n_bits
+
+@pytest.mark.parametrize("n_lsb,start", [(3, 4), (2, 1), (4, 7)])
+def test_threaded_wrap_embed_matches_serial(threads, n_lsb, start):
+    rng = np.random.default_rng(n_lsb)
+    cover = rng.integers(0, 256, 3000, dtype=np.uint8).tobytes()
+    capacity = len(cover) * n_lsb
+    n_bits = capacity - 1
+    payload = rng.integers(0, 256, -(-n_bits // 8), dtype=np.uint8).tobytes()
+
+    threaded = bytearray(cover)
+    embed_payload(threaded, payload, 0, start, capacity, n_lsb, n_bits)
+    set_threads(1)
+    serial = bytearray(cover)
+    embed_payload(serial, payload, 0, start, capacity, n_lsb, n_bits)
+    assert threaded == serial
+    assert extract_payload(threaded, n_bits, 0, start, capacity, n_lsb) == extract_payload(
+        serial, n_bits, 0, start, capacity, n_lsb)
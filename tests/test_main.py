@@ -0,0 +1,49 @@
+import os
+import shutil
+import sys
+import types
+
+import pytest
+
+import Main
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch, cover_path):
+    for name in ("sound", "secret", "output"):
+        (tmp_path / name).mkdir()
+    shutil.copyfile(cover_path, tmp_path / "sound" / "campina.mp3")
+    (tmp_path / "secret" / "a.txt").write_bytes(b"halo rahasia " * 50)
+    (tmp_path / "secret" / "b.txt").write_bytes(b"pesan kedua " * 40)
+    monkeypatch.chdir(tmp_path)
+    played = []
+    monkeypatch.setitem(sys.modules, "PlaySong", types.SimpleNamespace(play_song=played.append))
+    return tmp_path, played
+
+def answer(monkeypatch, answers):
+    it = iter(answers)
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(it))
+
+def test_sisip_pesan_plays_song_and_reports_psnr(workdir, monkeypatch, capsys):
+    tmp_path, played = workdir
+    # cover, secret, output, n_lsb, key, seed, matrix, frame-aware, kompresi
+    answer(monkeypatch, ["campina.mp3", "a.txt", "stego.mp3", "2", "", "", "", "", ""])
+    Main.sisip_pesan()
+    out = capsys.readouterr().out
+    assert "Terjadi kesalahan" not in out
+    assert "PSNR" in out
+    assert played == [os.path.join("output", "stego.mp3")]
+    assert (tmp_path / "output" / "stego.mp3").exists()
+
+def test_sisip_pesan_multi_file_skips_compression_prompt(workdir, monkeypatch, capsys):
+    tmp_path, played = workdir
+    # cover, secret, output, n_lsb, key, seed, matrix, frame-aware (tanpa pertanyaan kompresi)
+    answer(monkeypatch, ["campina.mp3", "a.txt, b.txt", "pack.mp3", "1", "", "", "", ""])
+    Main.sisip_pesan()
+    out = capsys.readouterr().out
+    assert "tidak berlaku untuk beberapa berkas" in out
+    assert "Terjadi kesalahan" not in out
+
+    from Container import list_entries
+    stego = (tmp_path / "output" / "pack.mp3").read_bytes()
+    # Seed kosong dari prompt diteruskan apa adanya, sama seperti ekstrak_pesan
+    assert [e["name"] + e["ext"] for e in list_entries(stego, "")] == ["a.txt", "b.txt"]
@@ -0,0 +1,50 @@
+import os
+
+import numpy as np
+import pytest
+
+from Checksum import checksum_of
+from Sisip import OPT_MATRIX, embed, extract, locate_payload, update_into
+
+def test_update_repicks_k_for_larger_payload(cover):
+    small, large = os.urandom(100), os.urandom(20000)
+    stego = embed(cover, small, ".bin", "s", 1, False, OPT_MATRIX, checksum_of(small))
+    old_k = locate_payload(stego, "s")["matrix"]
+
+    stats = update_into(stego, large, ".bin", "s", 0, checksum_of(large))
+    assert not stats["incremental"]
+    assert locate_payload(stego, "s")["matrix"] < old_k
+    assert extract(stego, "s") == (large, ".bin")
+
+def test_update_same_k_stays_incremental(cover):
+    secret = os.urandom(1000)
+    stego = embed(cover, secret, ".bin", None, 1, False, OPT_MATRIX, checksum_of(secret))
+    new = secret[:10] + bytes(b ^ 0xFF for b in secret[10:13]) + secret[13:]
+    stats = update_into(stego, new, ".bin", None, 0, checksum_of(new))
+    assert stats["incremental"] and stats["patched_bytes"] == 3
+    assert extract(stego) == (new, ".bin")
+
+@pytest.mark.parametrize("seed", [None, "s"])
+def test_at_most_one_changed_bit_per_block(cover, seed):
+    secret = os.urandom(3000)
+    stego = embed(cover, secret, ".bin", seed, 1, False, OPT_MATRIX)
+    layout = locate_payload(stego, seed)
+    m = (1 << layout["matrix"]) - 1
+    base, end = layout["payload_base"], layout["payload_base"] + layout["capacity"] * m
+
+    diff = np.frombuffer(cover, dtype=np.uint8) ^ np.frombuffer(bytes(stego), dtype=np.uint8)
+    assert set(np.unique(diff)) <= {0, 1}
+    assert not diff[end:].any()
+    per_block = diff[base:end].reshape(-1, m).sum(axis=1)
+    assert per_block.max() == 1
+
+def test_fewer_bit_flips_than_plain_lsb(cover):
+    secret = os.urandom(3000)
+    flips = {}
+    for options in (0, OPT_MATRIX):
+        stego = embed(cover, secret, ".bin", None, 1, False, options)
+        diff = np.frombuffer(cover, dtype=np.uint8) ^ np.frombuffer(bytes(stego), dtype=np.uint8)
+        flips[options] = int(np.unpackbits(diff).sum())
+    k = locate_payload(embed(cover, secret, ".bin", None, 1, False, OPT_MATRIX))["matrix"]
+    # Plain LSB mengubah ~1/2 bit per bit payload, Hamming (1 - 2^-k) / k
+    assert flips[OPT_MATRIX] < flips[0] * 2 * (1 - 2 ** -k) / k * 1.2
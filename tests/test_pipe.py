@@ -0,0 +1,23 @@
+import io
+
+import pytest
+
+from FileProcessor import secret_payload
+from Pipe import embed_pipe
+from Sisip import embed
+
+def test_embed_pipe_rejects_small_cover_before_writing(cover):
+    secret = b"x" * (len(cover) // 4)
+    payload = secret_payload(io.BytesIO(secret), len(secret), ".bin")
+    out = io.BytesIO()
+    with pytest.raises(ValueError, match="tidak cukup"):
+        embed_pipe(io.BytesIO(cover), out, payload, n_lsb=1, chunk_size=4096)
+    assert out.getvalue() == b""
+
+def test_embed_pipe_matches_embed(cover):
+    secret = b"rahasia " * 500
+    payload = secret_payload(io.BytesIO(secret), len(secret), ".txt", checksum=True)
+    out = io.BytesIO()
+    embed_pipe(io.BytesIO(cover), out, payload, n_lsb=2, chunk_size=4096)
+    assert out.getvalue() == embed(cover, payload["data"], ".txt", None, 2, False, payload["options"],
+                                   payload["checksum"])
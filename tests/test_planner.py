@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from CoverCache import CoverCache, capacity_bytes, header_bits
+from Planner import UsableIndex, bits_fit, capacity_bits
+from Sisip import embed, find_audio_start, locate_payload
+
+@pytest.fixture(scope="module")
+def index(cover) -> UsableIndex:
+    return UsableIndex.from_data(cover)
+
+@pytest.mark.parametrize("n_lsb", [1, 2, 3, 4])
+@pytest.mark.parametrize("frame_aware", [False, True])
+def test_capacity_matches_embed(tmp_path, cover_path, cover, index, n_lsb, frame_aware):
+    header_len = header_bits(".bin", checksum=False)
+    if frame_aware:
+        capacity = index.capacity_bits(n_lsb, header_len)
+    else:
+        capacity = capacity_bits(len(cover) - find_audio_start(cover), n_lsb, header_len)
+    analysis = CoverCache(str(tmp_path)).analyze(cover_path, frame_aware)
+    assert capacity_bytes(analysis, n_lsb, ".bin", False, frame_aware) == capacity // 8
+
+    fits = bytes(capacity // 8)
+    embed(cover, fits, ".bin", None, n_lsb, frame_aware)
+    with pytest.raises(ValueError, match="tidak cukup"):
+        embed(cover, fits + b"x", ".bin", None, n_lsb, frame_aware)
+
+def test_bits_fit_counts_bits_before_wrap(index):
+    usable = len(index)
+    assert index.bits_fit(2, 0, 100) == index.capacity_bits(2, 100) == (usable - 100) * 2
+    assert index.bits_fit(2, 500, 100) == (usable - 100) * 2 - 500
+    assert bits_fit(10, 4, 80, 0) == 0
+
+@pytest.mark.parametrize("n_lsb", [1, 3])
+def test_bit_position_matches_frame_aware_embed(cover, index, n_lsb):
+    rng = np.random.default_rng(6)
+    secret = rng.integers(0, 256, 4000, dtype=np.uint8).tobytes()
+    stego = embed(cover, secret, ".bin", "seed", n_lsb, frame_aware=True)
+    layout = locate_payload(stego, "seed")
+    bits = np.unpackbits(np.frombuffer(secret, dtype=np.uint8))
+    for j in rng.integers(0, len(bits), 200):
+        g = (layout["start"] + int(j)) % layout["capacity"]
+        byte, lsb = index.bit_position(g, n_lsb, layout["payload_base"])
+        assert (stego[byte] >> lsb) & 1 == bits[j]
+    logical = rng.integers(0, len(index), 50)
+    assert [index.physical(int(i)) for i in logical] == list(index.physical_array(logical))
+
+def test_index_above_4gib():
+    base = 5 << 30
+    index = UsableIndex([base, base + 5000], [400, 600])
+    assert index.physical(450) == base + 5050
+    assert index.physical_array(np.array([0, 399, 400], dtype=np.int64)).tolist() == [base, base + 399, base + 5000]
+    assert list(index.pieces(390, 410)) == [(390, base + 390, 10), (400, base + 5000, 10)]
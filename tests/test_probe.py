@@ -0,0 +1,36 @@
+import os
+
+from Checksum import checksum_of
+from Probe import collect_mp3, probe, probe_many
+from Sisip import OPT_CHECKSUM, OPT_COMPRESSED, OPT_RANDOM_START, embed
+
+def test_probe_reports_header(tmp_path, cover):
+    secret = bytes(range(256)) * 10
+    path = tmp_path / "stego.mp3"
+    path.write_bytes(embed(cover, secret, ".bin", "s", 3, options=OPT_COMPRESSED, checksum=checksum_of(secret)))
+    r = probe(str(path))
+    assert r["n_lsb"] == 3 and r["ext"] == ".bin" and r["content_bytes"] == len(secret)
+    assert r["options"] == OPT_RANDOM_START | OPT_COMPRESSED | OPT_CHECKSUM
+    assert r["flags"] == "random,compressed,checksum"
+
+def test_probe_frame_aware(tmp_path, cover):
+    path = tmp_path / "frame.mp3"
+    path.write_bytes(embed(cover, b"rahasia" * 20, ".txt", None, 2, frame_aware=True))
+    r = probe(str(path))
+    assert r["flags"] == "frame" and r["content_bytes"] == 140 and r["audio_start"] == 0
+
+def test_probe_many_reports_errors(tmp_path, cover_path, cover):
+    stego = tmp_path / "stego.mp3"
+    stego.write_bytes(embed(cover, b"x" * 100, ".txt"))
+    missing = str(tmp_path / "hilang.mp3")
+    results = probe_many([str(stego), cover_path, missing], workers=2)
+    assert results[0]["content_bytes"] == 100
+    assert results[1]["path"] == cover_path and "Magic mismatch" in results[1]["error"]
+    assert results[2]["path"] == missing and "error" in results[2]
+
+def test_collect_mp3(tmp_path):
+    (tmp_path / "sub").mkdir()
+    for name in ("b.mp3", "a.MP3", "c.txt", "sub/d.mp3"):
+        (tmp_path / name).write_bytes(b"")
+    assert [os.path.basename(p) for p in collect_mp3([str(tmp_path)])] == ["a.MP3", "b.mp3"]
+    assert len(collect_mp3([str(tmp_path)], recursive=True)) == 3
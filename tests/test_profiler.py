@@ -0,0 +1,38 @@
+import collections
+import json
+
+import pytest
+
+import Profiler
+
+@pytest.fixture
+def small_profiler(monkeypatch):
+    monkeypatch.setattr(Profiler, "MAX_RECORDS", 5)
+    monkeypatch.setattr(Profiler._State, "records", collections.deque(maxlen=5))
+    monkeypatch.setattr(Profiler._State, "summary", {})
+    yield
+    Profiler.disable()
+
+def run_stages(n):
+    for i in range(n):
+        with Profiler.stage("outer", bytes=10):
+            with Profiler.stage("inner", bits=i):
+                pass
+
+def test_records_are_capped_but_summary_counts_all(small_profiler):
+    Profiler.enable()
+    run_stages(20)
+    assert len(Profiler.records()) == 5
+    table = Profiler.summary_table()
+    assert "outer/inner" in table
+    assert any(line.split()[:2] == ["outer", "20"] for line in table.splitlines())
+
+def test_records_spill_to_output_file(small_profiler, tmp_path):
+    out = str(tmp_path / "profil.jsonl")
+    Profiler.enable(out=out)
+    run_stages(20)
+    Profiler.write_json_lines(out)
+    with open(out) as f:
+        rows = [json.loads(line) for line in f]
+    assert len(rows) == 40
+    assert [r["bits"] for r in rows if r["stage"] == "inner"] == list(range(20))
@@ -0,0 +1,43 @@
+import math
+
+import pytest
+
+from PSNR import compare_files, compare_many
+from Sisip import embed
+
+def write(tmp_path, name, data) -> str:
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+def test_compare_files_known_bytes(tmp_path):
+    a = write(tmp_path, "a.mp3", bytes([10, 20, 30, 40]))
+    b = write(tmp_path, "b.mp3", bytes([10, 21, 27, 40]))
+    r = compare_files(a, b, chunk_size=3)
+    # selisih 1 dan 3: MSE = (1 + 9) / 4
+    assert r["bytes"] == 4 and r["mse"] == 2.5
+    assert r["psnr"] == pytest.approx(10 * math.log10(255 ** 2 / 2.5))
+    assert r["bytes_changed"] == 2 and r["max_delta"] == 3
+    # 20 ^ 21 = 0b1, 30 ^ 27 = 0b101
+    assert r["bits_flipped"] == [2, 0, 1, 0, 0, 0, 0, 0]
+    assert "payload_bytes" not in r
+
+def test_compare_files_identical(tmp_path):
+    a = write(tmp_path, "a.mp3", b"sama" * 100)
+    r = compare_files(a, a)
+    assert r["mse"] == 0 and r["psnr"] == float('inf') and r["bytes_changed"] == 0
+
+def test_compare_files_unequal_lengths(tmp_path):
+    a = write(tmp_path, "a.mp3", bytes([0, 0, 0, 0, 9, 9]))
+    b = write(tmp_path, "b.mp3", bytes([0, 0, 0, 2]))
+    r = compare_files(a, b)
+    assert r["bytes"] == 4 and r["mse"] == 1.0
+
+def test_ratios_are_opt_in(tmp_path, cover):
+    secret = bytes(range(256)) * 4
+    a = write(tmp_path, "a.mp3", cover)
+    b = write(tmp_path, "b.mp3", embed(cover, secret, ".bin"))
+    r = compare_many([(a, b)], ratios=True)[0]
+    assert r["payload_bytes"] == len(secret)
+    assert r["bits_per_change"] == pytest.approx(len(secret) * 8 / sum(r["bits_flipped"]))
+    assert "payload_bytes" not in compare_many([(a, b)])[0]
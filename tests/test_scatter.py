@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from Scatter import ScatterPermutation, scatter_embed, scatter_extract
+from Sisip import OPT_SCATTER, embed, extract
+
+@pytest.mark.parametrize("capacity", [1, 2, 3, 1000, 4097])
+def test_permutation_is_a_bijection(capacity):
+    perm = ScatterPermutation("seed", capacity)
+    positions = perm.positions(np.arange(capacity, dtype=np.uint64))
+    assert sorted(positions.tolist()) == list(range(capacity))
+
+def test_permutation_depends_on_seed():
+    j = np.arange(1000, dtype=np.uint64)
+    assert not np.array_equal(ScatterPermutation("a", 1000).positions(j), ScatterPermutation("b", 1000).positions(j))
+
+@pytest.mark.parametrize("n_lsb", [1, 3, 4])
+def test_partial_extract_matches_embed(n_lsb):
+    rng = np.random.default_rng(n_lsb)
+    stego = rng.integers(0, 256, 5000, dtype=np.uint8)
+    payload = rng.integers(0, 256, 600, dtype=np.uint8).tobytes()
+    perm = ScatterPermutation("seed", (len(stego) - 100) * n_lsb)
+    scatter_embed(stego, payload, 100, perm, n_lsb)
+    assert scatter_extract(stego, 0, len(payload) * 8, 100, perm, n_lsb) == payload
+    assert scatter_extract(stego, 80, 160, 100, perm, n_lsb) == payload[10:30]
+
+def test_scatter_stego_roundtrip(cover):
+    secret = np.random.default_rng(16).integers(0, 256, 5000, dtype=np.uint8).tobytes()
+    stego = embed(cover, secret, ".bin", "seed", 2, False, OPT_SCATTER)
+    assert extract(stego, "seed") == (secret, ".bin")
+    assert extract(stego, "lain")[0] != secret
@@ -0,0 +1,62 @@
+import asyncio
+import os
+
+import pytest
+
+from Server import HttpError, StegoServer, embed_job, embed_params, extract_job
+
+def test_extract_job_stays_in_dotted_workdir(tmp_path, cover_path):
+    workdir = tmp_path / ".cache" / "stego_req"
+    workdir.mkdir(parents=True)
+    secret = workdir / "secret.txt"
+    secret.write_bytes(b"isi rahasia " * 20)
+    params = {"key": "kunci", "seed": None, "n_lsb": 2, "compression": "zlib", "checksum": True,
+              "frame_aware": False, "scatter": False, "matrix": False}
+    stego = workdir / "stego.mp3"
+    embed_job(cover_path, str(secret), str(stego), params)
+    out = extract_job(str(stego), os.path.join(workdir, "out"), None, "kunci")
+    assert out == os.path.join(workdir, "out.txt")
+    assert open(out, "rb").read() == secret.read_bytes()
+
+@pytest.mark.parametrize("query", [{"cover_bytes": "10", "n_lsb": "0"}, {"cover_bytes": "10", "n_lsb": "5"},
+                                   {"cover_bytes": "10", "n_lsb": "2.5"}, {"cover_bytes": "x"}, {}])
+def test_embed_params_rejects_invalid_numbers(query):
+    with pytest.raises(HttpError) as err:
+        embed_params(query, {})
+    assert err.value.status == 400
+
+def test_embed_params_reads_key_and_seed_from_headers():
+    params = embed_params({"cover_bytes": "10", "n_lsb": "4"}, {"x-stego-key": "kunci", "x-stego-seed": "s"})
+    assert (params["n_lsb"], params["key"], params["seed"]) == (4, "kunci", "s")
+    with pytest.raises(HttpError):
+        embed_params({"cover_bytes": "10", "key": "kunci"}, {})
+
+def test_slow_upload_does_not_hold_job_slot(tmp_path, cover_path):
+    secret = tmp_path / "secret.txt"
+    secret.write_bytes(b"isi rahasia " * 20)
+    params = {"key": None, "seed": None, "n_lsb": 2, "compression": "none", "checksum": True,
+              "frame_aware": False, "scatter": False, "matrix": False}
+    stego = tmp_path / "stego.mp3"
+    embed_job(cover_path, str(secret), str(stego), params)
+    body = stego.read_bytes()
+
+    async def scenario():
+        server = StegoServer(max_jobs=1)
+        listener = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            _, slow = await asyncio.open_connection("127.0.0.1", port)
+            slow.write(f"POST /extract HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body[:1000])
+            await slow.drain()
+            await asyncio.sleep(0.1)
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(f"POST /extract HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+            await writer.drain()
+            response = await asyncio.wait_for(reader.read(), 10)
+            writer.close()
+            slow.close()
+        return response
+
+    response = asyncio.run(scenario())
+    assert response.startswith(b"HTTP/1.1 200")
+    assert response.endswith(secret.read_bytes())
@@ -0,0 +1,87 @@
+import math
+import os
+
+import numpy as np
+import pytest
+
+from Randomizer import generate_random
+from Sisip import embed, extract, find_audio_start
+from Vigenere import encrypt_bytes
+
+# Stego hasil program awal (src/output) beserta parameter pembuatnya; n_lsb 4 dari menu disimpan sebagai 3.
+# Berkas teks asalnya memakai CRLF, hasil ekstraksi di src/ekstraksi disimpan dengan LF
+BASELINE = [
+    ("1-1", 1, "kunci", ""), ("1-2", 1, None, ""), ("1-3", 1, None, "seed"), ("1-4", 1, "kunci", "seed"),
+    ("2-1", 1, None, ""), ("2-2", 2, None, ""), ("2-3", 3, None, ""), ("4-1", 3, None, ""),
+    ("4-2", 3, None, ""), ("4-3", 3, None, ""), ("4-4", 3, None, ""), ("4-5", 3, None, ""),
+    ("4-6", 3, None, ""), ("4-7", 3, None, ""),
+]
+TEXT_EXTS = (".txt", ".md", ".c")
+
+def baseline_secret(src_dir: str, name: str) -> tuple[bytes, str]:
+    folder = os.path.join(src_dir, "ekstraksi")
+    file = next(f for f in os.listdir(folder) if f.startswith(f"hasil-{name}."))
+    ext = os.path.splitext(file)[1]
+    with open(os.path.join(folder, file), 'rb') as f:
+        data = f.read()
+    return (data.replace(b"\n", b"\r\n") if ext in TEXT_EXTS else data), ext
+
+@pytest.mark.parametrize("name,n_lsb,key,seed", BASELINE)
+def test_embed_matches_baseline_output(src_dir, cover, name, n_lsb, key, seed):
+    secret, ext = baseline_secret(src_dir, name)
+    payload = encrypt_bytes(secret, key) if key else secret
+    with open(os.path.join(src_dir, "output", f"output-{name}.mp3"), 'rb') as f:
+        expected = f.read()
+    assert embed(cover, payload, ext, seed, n_lsb) == expected
+    assert extract(expected, seed) == (payload, ext)
+
+def reference_audio_start(data: bytes) -> int:
+    """
+    find_audio_start program awal: sync word 11 bit mulai dari bit mana pun di byte i, hasil i + 4
+    """
+    for i in range(len(data) - 1):
+        combined = f"{data[i]:08b}{data[i + 1]:08b}"
+        if any(combined[shift:shift + 11] == "1" * 11 for shift in range(8)):
+            return i + 4
+    return 0
+
+def reference_embed(cover: bytes, secret: bytes, ext: str, seed: str | None, n_lsb: int) -> bytes:
+    """
+    Penyisipan per bit seperti program awal (sisip), tanpa berkas teks perantara
+    """
+    out = bytearray(cover)
+    audio_start = reference_audio_start(cover)
+    bits = ''.join(f"{b:08b}" for b in secret)
+    header = (f"{0x5354:016b}{n_lsb:08b}{len(ext):08b}{(2 if seed is not None else 0):08b}{len(bits):032b}"
+              + ''.join(f"{ord(c):08b}" for c in ext))
+    for i, bit in enumerate(header):
+        idx = audio_start + i
+        out[idx] = (out[idx] & 0xFE) | int(bit)
+    capacity = (len(cover) - audio_start - len(header)) * n_lsb
+    start = 0
+    if seed is not None:
+        available = len(cover) - (audio_start + len(header))
+        max_start = available - math.ceil(len(bits) / n_lsb)
+        start = generate_random(seed, max_start) + audio_start + len(header) + 1
+    for j, bit in enumerate(bits):
+        g = (start + j) % capacity
+        idx = audio_start + len(header) + g // n_lsb
+        out[idx] = (out[idx] & ~(1 << (g % n_lsb)) & 0xFF) | (int(bit) << (g % n_lsb))
+    return bytes(out)
+
+def test_find_audio_start_matches_reference(cover):
+    assert find_audio_start(cover) == reference_audio_start(cover)
+    rng = np.random.default_rng(5)
+    for _ in range(20):
+        data = rng.integers(0, 0xE0, 64, dtype=np.uint8)
+        at = int(rng.integers(0, 60))
+        data[at], data[at + 1] = 0xFF >> int(rng.integers(0, 3)), 0xFF
+        assert find_audio_start(data.tobytes()) == reference_audio_start(data.tobytes())
+
+@pytest.mark.parametrize("n_lsb", [1, 2, 3, 4])
+@pytest.mark.parametrize("seed", [None, "seed"])
+def test_embed_matches_reference_layout(cover, n_lsb, seed):
+    secret = np.random.default_rng(n_lsb).integers(0, 256, 3000, dtype=np.uint8).tobytes()
+    stego = embed(cover, secret, ".bin", seed, n_lsb)
+    assert stego == reference_embed(cover, secret, ".bin", seed, n_lsb)
+    assert extract(stego, seed) == (secret, ".bin")
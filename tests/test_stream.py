@@ -0,0 +1,93 @@
+import pytest
+
+from Checksum import checksum_of
+from Sisip import embed
+from Stream import embed_mmap, embed_stream, extract_range, extract_stream
+from Vigenere import encrypt_bytes
+
+SECRET = bytes(range(256)) * 20 + b"akhir berkas rahasia"
+
+@pytest.fixture(scope="module")
+def secret_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("secret") / "rahasia.bin"
+    path.write_bytes(SECRET)
+    return str(path)
+
+@pytest.mark.parametrize("chunk_size", [4096, 1 << 20])
+@pytest.mark.parametrize("key", [None, "kunci"])
+@pytest.mark.parametrize("seed", [None, "", "abc"])
+@pytest.mark.parametrize("n_lsb", [1, 2, 3, 4])
+def test_embed_stream_matches_embed(tmp_path, cover_path, cover, secret_path, n_lsb, seed, key, chunk_size):
+    out = str(tmp_path / "stego.mp3")
+    embed_stream(cover_path, secret_path, out, seed, n_lsb, key, chunk_size)
+    payload = encrypt_bytes(SECRET, key) if key else SECRET
+    with open(out, 'rb') as f:
+        assert f.read() == embed(cover, payload, ".bin", seed, n_lsb)
+
+@pytest.mark.parametrize("chunk_size", [4096, 1 << 20])
+def test_extract_stream_round_trip(tmp_path, cover_path, secret_path, chunk_size):
+    stego = str(tmp_path / "stego.mp3")
+    embed_stream(cover_path, secret_path, stego, "abc", 3, "kunci", chunk_size, "zlib", checksum=True)
+    out = extract_stream(stego, str(tmp_path / "keluar"), "abc", "kunci", chunk_size)
+    assert out.endswith(".bin")
+    with open(out, 'rb') as f:
+        assert f.read() == SECRET
+
+def test_embed_stream_checksum_matches_embed(tmp_path, cover_path, cover, secret_path):
+    out = str(tmp_path / "stego.mp3")
+    embed_stream(cover_path, secret_path, out, "abc", 2, "kunci", 4096, checksum=True)
+    with open(out, 'rb') as f:
+        assert f.read() == embed(cover, encrypt_bytes(SECRET, "kunci"), ".bin", "abc", 2,
+                                 checksum=checksum_of(SECRET))
+
+def test_extract_stream_rejects_frame_aware(tmp_path, cover_path):
+    stego = str(tmp_path / "stego.mp3")
+    embed_mmap(cover_path, b"rahasia" * 10, ".txt", stego, None, 1, frame_aware=True)
+    with pytest.raises(ValueError, match="frame-aware tidak didukung"):
+        extract_stream(stego, str(tmp_path / "out"))
+
+def test_extract_stream_reports_non_stego(tmp_path, cover_path):
+    with pytest.raises(ValueError, match="Magic mismatch"):
+        extract_stream(cover_path, str(tmp_path / "out"))
+
+@pytest.mark.parametrize("seed", [None, "abc"])
+def test_embed_mmap_matches_embed(tmp_path, cover_path, cover, seed):
+    out = str(tmp_path / "stego.mp3")
+    embed_mmap(cover_path, SECRET, ".bin", out, seed, 2, checksum=checksum_of(SECRET))
+    with open(out, 'rb') as f:
+        assert f.read() == embed(cover, SECRET, ".bin", seed, 2, checksum=checksum_of(SECRET))
+
+def test_embed_mmap_removes_output_on_failure(tmp_path, cover):
+    small = tmp_path / "kecil.mp3"
+    small.write_bytes(cover[:8192])
+    out = tmp_path / "stego.mp3"
+    with pytest.raises(ValueError, match="Cover tidak cukup"):
+        embed_mmap(str(small), SECRET, ".bin", str(out))
+    assert not out.exists()
+
+@pytest.fixture(params=["none", "zlib"])
+def range_stego(request, tmp_path, cover_path, secret_path):
+    stego = str(tmp_path / "stego.mp3")
+    embed_stream(cover_path, secret_path, stego, "s", 2, "kunci", compression=request.param, checksum=True)
+    with open(extract_stream(stego, str(tmp_path / "penuh"), "s", "kunci"), 'rb') as f:
+        full = f.read()
+    return stego, full
+
+def test_extract_range_matches_full_extract(range_stego):
+    stego, full = range_stego
+    assert extract_range(stego, 1000, 300, "s", "kunci") == (full[1000:1300], ".bin")
+    assert extract_range(stego, 5000, None, "s", "kunci") == (full[5000:], ".bin")
+    assert extract_range(stego, 0, None, "s", "kunci") == (full, ".bin")
+
+def test_extract_range_negative_offset(tmp_path, cover_path, secret_path):
+    stego = str(tmp_path / "stego.mp3")
+    embed_stream(cover_path, secret_path, stego, None, 3, "kunci")
+    assert extract_range(stego, -100, None, None, "kunci") == (SECRET[-100:], ".bin")
+    assert extract_range(stego, -100, 40, None, "kunci") == (SECRET[-100:-60], ".bin")
+
+def test_extract_range_past_end(range_stego):
+    stego, full = range_stego
+    with pytest.raises(ValueError, match="Rentang di luar"):
+        extract_range(stego, len(full) - 10, 20, "s", "kunci")
+    with pytest.raises(ValueError, match="Rentang di luar"):
+        extract_range(stego, len(full) + 1, None, "s", "kunci")
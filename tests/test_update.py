@@ -0,0 +1,61 @@
+import os
+
+import pytest
+
+from Checksum import checksum_of
+from Sisip import embed, extract, update_into
+from Stream import extract_stream, update_file
+from Vigenere import encrypt_bytes
+
+def test_update_patches_only_changed_bytes(cover):
+    secret = os.urandom(2000)
+    stego = embed(cover, secret, ".bin", "s", 2, checksum=checksum_of(secret))
+    new = secret[:500] + bytes(b ^ 0xFF for b in secret[500:504]) + secret[504:]
+    stats = update_into(stego, new, ".bin", "s", 0, checksum_of(new))
+    assert stats["incremental"] and stats["patched_bytes"] == 4 and stats["runs"] == 1
+    assert extract(stego, "s") == (new, ".bin")
+
+def test_update_growing_payload_appends_tail(cover):
+    secret = os.urandom(1000)
+    stego = embed(cover, secret, ".bin", None, 3)
+    new = secret + os.urandom(500)
+    stats = update_into(stego, new, ".bin")
+    assert stats["incremental"] and stats["patched_bytes"] == 500
+    assert extract(stego) == (new, ".bin")
+
+def test_update_rejects_wrong_seed(cover):
+    secret = os.urandom(1000)
+    stego = embed(cover, secret, ".bin", "benar", 1, checksum=checksum_of(secret))
+    before = bytes(stego)
+    with pytest.raises(ValueError, match="Checksum payload tidak cocok"):
+        update_into(stego, secret[::-1], ".bin", "salah", 0, checksum_of(secret[::-1]))
+    assert stego == before
+
+def test_update_rejects_wrong_key(cover):
+    secret = os.urandom(1000)
+    stego = embed(cover, encrypt_bytes(secret, "kunci"), ".bin", "s", 1, checksum=checksum_of(secret))
+    with pytest.raises(ValueError, match="Checksum payload tidak cocok"):
+        update_into(stego, secret, ".bin", "s", 0, checksum_of(secret), "bukan")
+
+def test_update_without_checksum_rewrites_implausible_header(cover):
+    secret = os.urandom(1000)
+    stego = embed(cover, secret, "bin", "s", 1)
+    stats = update_into(stego, secret, "bin", "s")
+    assert not stats["incremental"] and stats["patched_bytes"] == len(secret)
+    assert extract(stego, "s") == (secret, "bin")
+
+def test_update_file_passes_key(tmp_path, cover):
+    secret = b"isi rahasia pertama\n" * 50
+    stego_path, secret_path = str(tmp_path / "stego.mp3"), str(tmp_path / "secret.txt")
+    with open(stego_path, 'wb') as f:
+        f.write(embed(cover, encrypt_bytes(secret, "kunci"), ".txt", "s", 1, checksum=checksum_of(secret)))
+    with open(secret_path, 'wb') as f:
+        f.write(secret.replace(b"pertama", b"kedua!!"))
+
+    with pytest.raises(ValueError, match="Checksum payload tidak cocok"):
+        update_file(stego_path, secret_path, "salah", "kunci")
+    stats = update_file(stego_path, secret_path, "s", "kunci")
+    assert stats["incremental"]
+    out = extract_stream(stego_path, str(tmp_path / "out"), "s", "kunci")
+    with open(out, 'rb') as f:
+        assert f.read() == secret.replace(b"pertama", b"kedua!!")
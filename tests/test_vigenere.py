@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from Vigenere import VigenereStream, decrypt_bytes, decrypt_vigenere, encrypt_bytes, encrypt_vigenere
+
+DATA = np.random.default_rng(7).integers(0, 256, 5000, dtype=np.uint8).tobytes()
+
+def per_byte(fn, data: bytes, key: bytes, offset: int = 0) -> bytes:
+    return bytes(fn(b, key[(offset + i) % len(key)]) for i, b in enumerate(data))
+
+@pytest.mark.parametrize("key", ["k", "kunci", "kunci rahasia yang panjang", "künci"])
+@pytest.mark.parametrize("offset", [0, 3, 1001])
+def test_bytes_match_per_byte_cipher(key, offset):
+    key_bytes = key.encode("utf-8")
+    cipher = encrypt_bytes(DATA, key, offset)
+    assert cipher == per_byte(encrypt_vigenere, DATA, key_bytes, offset)
+    assert decrypt_bytes(cipher, key, offset) == per_byte(decrypt_vigenere, cipher, key_bytes, offset) == DATA
+
+def test_stream_chunks_match_whole_buffer():
+    stream = VigenereStream("kunci")
+    chunks = [DATA[:7], DATA[7:7], DATA[7:1234], DATA[1234:]]
+    assert b''.join(stream.update(c) for c in chunks) == encrypt_bytes(DATA, "kunci")
+
+def test_empty_key_rejected():
+    with pytest.raises(ValueError):
+        encrypt_bytes(DATA, "")